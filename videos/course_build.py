@@ -0,0 +1,177 @@
+"""
+Incremental Course Build
+
+Works like make for the ``videos/`` tree. Every scene is split into segment
+jobs whose cache keys come from the AST fingerprints in ``scene_index``, and
+the keys of the last successful build are kept in a state file per quality
+tier. A build re-renders only segments whose key changed or whose clip is
+missing, then re-stitches only the modules that had a segment re-rendered.
+A segment's key chains the keys of every segment before it, since each one
+starts from the state they leave behind (the screen and the seeded random
+streams), so editing a section re-renders it and every section after it.
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Set
+
+from course_settings import DEFAULT_OUTPUT_DIR, atomic_write_json
+from render_cache import RenderCache, restore_cached_jobs, store_rendered_results
+from render_history import RenderHistory
+from render_pool import (
+    job_output_path,
+    modules_dir,
+    print_render_summary,
+    variant_jobs,
+)
+from render_queue import select_renderer
+from section_render import plan_section_jobs
+from stitch import StitchError, concat_clips
+
+
+def build_state_path(quality: str) -> str:
+    """Path of the file recording the last successful build of a tier"""
+    return os.path.join(DEFAULT_OUTPUT_DIR, quality, "build_state.json")
+
+
+def load_build_state(quality: str) -> Dict:
+    """Load segment keys from the last build, or an empty state"""
+    try:
+        with open(build_state_path(quality), encoding="utf-8") as state:
+            return json.load(state)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_build_state(quality: str, state: Dict):
+    """Atomically write the build state"""
+    atomic_write_json(build_state_path(quality), state, indent=2, sort_keys=True)
+
+
+def stale_jobs(jobs: List[Dict], previous: Dict) -> List[Dict]:
+    """Return segment jobs whose key changed or whose clip is missing
+
+    Keys are the chained clip keys from ``plan_section_jobs``, so a job is
+    also stale when any segment before it changed.
+    """
+    return [
+        job
+        for job in jobs
+        if previous.get(job["segment"]) != job["cache_key"]
+        or not os.path.exists(job_output_path(job))
+    ]
+
+
+def tier_views(jobs: List[Dict], tier: str) -> List[Dict]:
+    """The jobs (or their quality variants) that write clips at ``tier``"""
+    views = [view for job in jobs for view in [job] + variant_jobs(job)]
+    return [view for view in views if view["quality"] == tier]
+
+
+def stitch_tier(
+    tier: str,
+    planned: Dict[str, List[Dict]],
+    failed: Set[str],
+    rebuilt_scenes: Set[str],
+    state: Dict,
+) -> bool:
+    """Record a tier's up-to-date segments and re-stitch its rebuilt modules"""
+    ok = True
+    for scene, scene_jobs in planned.items():
+        jobs = tier_views(scene_jobs, tier)
+        state[scene] = {
+            job["segment"]: job["cache_key"]
+            for job in jobs
+            if job["name"] not in failed
+        }
+        if len(state[scene]) < len(jobs):
+            ok = False
+            continue
+
+        output = os.path.join(modules_dir(tier), f"{scene}.mp4")
+        if scene not in rebuilt_scenes and os.path.exists(output):
+            continue
+        try:
+            concat_clips([job_output_path(job) for job in jobs], output)
+        except StitchError as error:
+            print(f"❌ {scene}: {error.args[0]}")
+            if os.path.exists(output):
+                os.remove(output)
+            ok = False
+            continue
+        print(f"✅ {scene}: stitched {len(jobs)} clips -> {output}")
+    save_build_state(tier, state)
+    return ok
+
+
+def build_course(
+    targets: List[Dict],
+    quality: str = "high",
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+    warm: bool = False,
+    queue: Optional[str] = None,
+    memory_budget: Optional[int] = None,
+    variants: Sequence[str] = (),
+) -> bool:
+    """Bring every target's section clips and module video up to date
+
+    ``targets`` are launcher render targets with ``file`` and ``class`` keys.
+    With ``warm``, sections render on prefork workers that keep manimlib
+    loaded between jobs; with ``queue``, they are published to that shared
+    queue directory and drained by workers on any machine. Concurrent jobs
+    are kept within ``memory_budget`` bytes of predicted peak memory.
+    ``variants`` are lower quality tiers built from the same renders; a
+    section out of date at any tier is rendered once for all of them.
+    """
+    tiers = [quality] + list(variants)
+    states = {tier: load_build_state(tier) for tier in tiers}
+    planned = {}
+    dirty = []
+    ok = True
+    for info in targets:
+        scene = info["class"]
+        try:
+            jobs = plan_section_jobs(info["file"], scene, quality, variants=variants)
+        except KeyError as error:
+            print(f"❌ {error.args[0]}")
+            ok = False
+            continue
+        except (OSError, SyntaxError) as error:
+            print(f"❌ {info['file']}: {error}")
+            ok = False
+            continue
+        planned[scene] = jobs
+        stale = set()
+        for tier in tiers:
+            previous = states[tier].get(scene, {})
+            for job in stale_jobs(tier_views(jobs, tier), previous):
+                stale.add(job["name"])
+        dirty.extend(job for job in jobs if job["name"] in stale)
+
+    pending, restored = dirty, []
+    if cache is not None:
+        pending, restored = restore_cached_jobs(dirty, cache)
+    print(
+        f"🔨 {len(dirty)} of {sum(len(jobs) for jobs in planned.values())} "
+        f"sections out of date ({len(restored)} served from cache)"
+    )
+
+    failed = set()
+    if pending:
+        start = time.perf_counter()
+        renderer = select_renderer(warm, queue, memory_budget)
+        results = renderer(pending, workers=workers, history=RenderHistory())
+        print_render_summary(results, time.perf_counter() - start)
+        if cache is not None:
+            store_rendered_results(pending, results, cache)
+        failed = {result["name"] for result in results if not result["ok"]}
+
+    rebuilt_scenes = {job["parent_scene"] for job in dirty}
+    for tier in tiers:
+        ok = stitch_tier(tier, planned, failed, rebuilt_scenes, states[tier]) and ok
+
+    if not dirty and ok:
+        print("✅ Everything is up to date")
+    return ok
@@ -9,13 +9,56 @@ Usage:
     python course_launcher.py                    # Interactive menu
     python course_launcher.py --module 0        # Run specific module (0-10)
     python course_launcher.py --list            # List all modules
+    python course_launcher.py --list --breakdown  # ...with per-section durations
+    python course_launcher.py --startup-check   # --list/--info stay under 100 ms
     python course_launcher.py --complete        # Run complete course intro
+    python course_launcher.py --render          # Render all modules in parallel
+    python course_launcher.py --render 1 4 7 --quality medium --workers 4
+    python course_launcher.py --render 4 --sections  # One job per section
+    python course_launcher.py --render --sections --progress  # Live ETA view
+    python course_launcher.py --render --complete   # Also render the course intro
+    python course_launcher.py --render 1 --sections --segment bits_to_bytes --shards 8
+    python course_launcher.py --timeline 2      # Exact durations from a dry run
+    python course_launcher.py --watch 6         # Re-render sections on save
+    python course_launcher.py --interactive 6   # Window with live section reload
+    python course_launcher.py --stitch 4        # Join section clips losslessly
+    python course_launcher.py --stitch-course   # Join modules into the course
+    python course_launcher.py --build           # Re-render only changed sections
+    python course_launcher.py --build --warm    # ...on workers that stay warm
+    python course_launcher.py --build -q high --variants medium low  # One pass
+    python course_launcher.py --build --queue /mnt/renders/queue --workers 0
+    python course_launcher.py --queue-worker /mnt/renders/queue  # on each box
 """
 
 import os
 import sys
+import time
 import argparse
-from typing import List, Dict
+import contextlib
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence
+
+# Only what argparse needs is imported up front so metadata commands such as
+# --list and --info start fast; the scene index, duration estimates and
+# render tooling are imported by the commands that use them.
+from course_settings import DEFAULT_QUEUE_DIR, QUALITY_TIERS, parse_size
+
+if TYPE_CHECKING:
+    from render_cache import RenderCache
+
+# Cold start budget of metadata commands, checked by --startup-check
+STARTUP_BUDGET_SECONDS = 0.1
+STARTUP_RUNS = 5
+METADATA_COMMANDS = (["--list"], ["--info"])
+
+# Modules metadata commands must not import, directly or indirectly
+HEAVY_MODULES = (
+    "manimlib",
+    "numpy",
+    "concurrent.futures",
+    "multiprocessing",
+    "subprocess",
+    "render_pool",
+)
 
 
 class CourseLauncher:
@@ -26,124 +69,162 @@ class CourseLauncher:
             0: {
                 "name": "Welcome to MagicBehindAI",
                 "file": "module0_channel_welcome.py",
-                "class": "Module0ChannelWelcome",
-                "duration": "15 min",
                 "description": "Channel introduction and course overview",
             },
             1: {
                 "name": "Computer Fundamentals",
                 "file": "module1_computer_fundamentals.py",
-                "class": "Module1ComputerFundamentals",
-                "duration": "60 min",
                 "description": "Learn computer basics, binary systems, and programming concepts",
             },
             2: {
                 "name": "Programming Logic",
                 "file": "module2_programming_logic.py",
-                "class": "Module2ProgrammingLogic",
-                "duration": "50 min",
                 "description": "Develop logical thinking and problem-solving skills",
             },
             3: {
                 "name": "Introduction to Python",
                 "file": "module3_introduction_to_python.py",
-                "class": "Module3IntroductionToPython",
-                "duration": "70 min",
                 "description": "Get started with Python syntax and basic programming",
             },
             4: {
                 "name": "Core Python Concepts",
                 "file": "module4_core_python_concepts.py",
-                "class": "Module4CorePythonConcepts",
-                "duration": "90 min",
                 "description": "Master data types, control structures, and core concepts",
             },
             5: {
                 "name": "Functions and Modules",
                 "file": "module5_functions_and_modules.py",
-                "class": "Module5FunctionsAndModules",
-                "duration": "80 min",
                 "description": "Learn to organize code with functions and modules",
             },
             6: {
                 "name": "Object-Oriented Programming",
                 "file": "module6_object_oriented_programming.py",
-                "class": "Module6ObjectOrientedProgramming",
-                "duration": "90 min",
                 "description": "Master OOP principles and design patterns",
             },
             7: {
                 "name": "File Handling & Error Management",
                 "file": "module7_file_handling_error_management.py",
-                "class": "Module7FileHandlingErrorManagement",
-                "duration": "70 min",
                 "description": "Handle files and manage errors professionally",
             },
             8: {
                 "name": "Advanced Python Features",
                 "file": "module8_advanced_python_features.py",
-                "class": "Module8AdvancedPythonFeatures",
-                "duration": "80 min",
                 "description": "Explore decorators, generators, and advanced concepts",
             },
             9: {
                 "name": "Libraries & Frameworks",
                 "file": "module9_libraries_frameworks.py",
-                "class": "Module9LibrariesFrameworks",
-                "duration": "70 min",
                 "description": "Work with Python ecosystem and popular libraries",
             },
             10: {
                 "name": "Project Development",
                 "file": "module10_project_development.py",
-                "class": "Module10ProjectDevelopment",
-                "duration": "80 min",
                 "description": "Complete project lifecycle and career preparation",
             },
         }
+        self.course_intro = {
+            "name": "Complete Python Course",
+            "file": "complete_python_course.py",
+        }
+        self.index = None
 
     def check_dependencies(self) -> bool:
         """Check if required dependencies are installed"""
-        try:
-            import importlib.util
+        import importlib.util
 
-            spec = importlib.util.find_spec("manimlib")
-            return spec is not None
-        except ImportError:
+        # Probe without importing: loading manimlib takes over a second
+        if importlib.util.find_spec("manimlib") is None:
             print("❌ ManimGL is required but not installed.")
             print("Install with: pip install manimgl")
             print("Or: pip install manimlib")
             return False
+        return True
+
+    def scene_index(self) -> Dict[str, List[Dict]]:
+        """Scenes of every course file, from the cached AST index"""
+        from scene_index import index_scenes
+
+        if self.index is None:
+            files = [self.course_intro["file"]]
+            files += [info["file"] for info in self.modules.values()]
+            self.index = index_scenes(files)
+        return self.index
+
+    def scene_targets(self, info: Dict) -> List[Dict]:
+        """Render targets of a module entry: each Scene in its file, in order"""
+        return [
+            {"name": info["name"], "file": info["file"], "class": scene["name"]}
+            for scene in self.scene_index().get(info["file"], [])
+        ]
+
+    def module_durations(self) -> Dict[int, List[Dict]]:
+        """Timeline of each module's scenes: from a fresh dry run, else estimated"""
+        from scene_durations import estimate_durations
+        from scene_timeline import load_timeline
+
+        estimates = estimate_durations([info["file"] for info in self.modules.values()])
+        durations = {}
+        for num, info in self.modules.items():
+            durations[num] = []
+            for target in self.scene_targets(info):
+                timeline = load_timeline(target["file"], target["class"])
+                if timeline is not None:
+                    timeline = dict(timeline, source="dry run")
+                else:
+                    estimate = estimates[info["file"]][target["class"]]
+                    timeline = dict(estimate, source="estimated")
+                durations[num].append(dict(timeline, scene=target["class"]))
+        return durations
+
+    def describe_duration(self, timelines: List[Dict]) -> str:
+        """Total duration of some scene timelines and where it came from"""
+        from scene_timeline import format_duration
+
+        seconds = sum(timeline["duration"] for timeline in timelines)
+        sources = sorted({timeline["source"] for timeline in timelines})
+        source = " + ".join(sources) or "no scenes"
+        guessed = sum(timeline.get("guessed", 0) for timeline in timelines)
+        if guessed:
+            source += f", {guessed} values guessed"
+        return f"{format_duration(seconds)} ({source})"
 
-    def list_modules(self):
+    def list_modules(self, breakdown: bool = False):
         """Display all available modules"""
+        from scene_timeline import format_duration, timeline_lines
+
         print("🐍 Python Programming Course Modules\n")
         print("=" * 60)
 
-        total_duration = 0
+        durations = self.module_durations()
+        total_duration = 0.0
         for num, info in self.modules.items():
-            duration_num = int(info["duration"].split()[0])
-            total_duration += duration_num
+            timelines = durations[num]
+            total_duration += sum(timeline["duration"] for timeline in timelines)
 
             print(f"Module {num:2d}: {info['name']}")
-            print(f"           Duration: {info['duration']}")
+            print(f"           Duration: {self.describe_duration(timelines)}")
             print(f"           {info['description']}")
             print(f"           File: {info['file']}")
+            scenes = ", ".join(timeline["scene"] for timeline in timelines)
+            print(f"           Scenes: {scenes or 'none found'}")
+            for timeline in timelines if breakdown else []:
+                print(
+                    f"           🎬 {timeline['scene']}"
+                    f" ({format_duration(timeline['duration'])})"
+                )
+                for line in timeline_lines(timeline):
+                    print(f"        {line}")
             print()
 
         print("=" * 60)
-        print(
-            f"Total Course Duration: ~{total_duration} minutes ({total_duration // 60}h {total_duration % 60}m)"
-        )
+        print(f"Total Course Duration: {format_duration(total_duration)}")
         print(f"Total Modules: {len(self.modules)}")
 
     def verify_module_exists(self, module_num: int) -> bool:
-        """Check if module file exists"""
+        """Check that a module's file exists and defines at least one scene"""
         if module_num not in self.modules:
             return False
-
-        module_file = self.modules[module_num]["file"]
-        return os.path.exists(module_file)
+        return bool(self.scene_targets(self.modules[module_num]))
 
     def run_module(self, module_num: int):
         """Execute a specific module"""
@@ -152,16 +233,327 @@ class CourseLauncher:
             return False
 
         module_info = self.modules[module_num]
+        timelines = self.module_durations()[module_num]
         print(f"🚀 Starting Module {module_num}: {module_info['name']}")
         print(f"📁 File: {module_info['file']}")
-        print(f"⏱️  Duration: {module_info['duration']}")
+        print(f"⏱️  Duration: {self.describe_duration(timelines)}")
         print(f"📝 Description: {module_info['description']}")
+        scenes = " ".join(target["class"] for target in self.scene_targets(module_info))
         print("\nTo render animations, use:")
-        print(f"manimgl {module_info['file']} {module_info['class']}")
+        print(f"manimgl {module_info['file']} {scenes}")
         print("\nFor high quality:")
-        print(f"manimgl {module_info['file']} {module_info['class']} -w")
+        print(f"manimgl {module_info['file']} {scenes} -w")
+        return True
+
+    def module_video_path(self, target: Dict, quality: str) -> str:
+        """Path of a scene's full video for a quality tier"""
+        from render_pool import modules_dir
+
+        return os.path.join(modules_dir(quality), f"{target['class']}.mp4")
+
+    def render_targets(
+        self, module_nums: List[int], include_intro: bool = False
+    ) -> List[Dict]:
+        """Scenes to render, optionally led by the course introduction"""
+        entries = [self.modules[num] for num in module_nums]
+        if include_intro:
+            entries.insert(0, self.course_intro)
+        return [target for info in entries for target in self.scene_targets(info)]
+
+    def missing_modules(self, module_nums: List[int]) -> bool:
+        """Report requested modules without a file or without any scene"""
+        missing = [num for num in module_nums if not self.verify_module_exists(num)]
+        if missing:
+            print(f"❌ Modules not found or without scenes: {missing}")
+        return bool(missing)
+
+    def build_render_jobs(
+        self,
+        module_nums: List[int],
+        quality: str,
+        include_intro: bool = False,
+        variants: Sequence[str] = (),
+    ) -> List[Dict]:
+        """Create one render job per requested module"""
+        from render_pool import modules_dir
+        from section_render import plan_scene_job
+
+        return [
+            plan_scene_job(
+                target["file"], target["class"], quality, modules_dir(quality), variants
+            )
+            for target in self.render_targets(module_nums, include_intro)
+        ]
+
+    def build_section_jobs(
+        self,
+        module_nums: List[int],
+        quality: str,
+        include_intro: bool = False,
+        segments: Optional[List[str]] = None,
+        variants: Sequence[str] = (),
+    ) -> List[Dict]:
+        """Create one render job per section of each requested module"""
+        from section_render import plan_section_jobs
+
+        jobs = []
+        for target in self.render_targets(module_nums, include_intro):
+            jobs.extend(
+                plan_section_jobs(
+                    target["file"], target["class"], quality, segments, variants
+                )
+            )
+        return jobs
+
+    def render_modules(
+        self,
+        module_nums: List[int],
+        quality: str = "high",
+        workers: Optional[int] = None,
+        sections: bool = False,
+        include_intro: bool = False,
+        cache: Optional["RenderCache"] = None,
+        warm: bool = False,
+        segments: Optional[List[str]] = None,
+        shards: int = 1,
+        queue: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        live: bool = False,
+        variants: Sequence[str] = (),
+    ) -> bool:
+        """Render modules concurrently on a worker process pool
+
+        Section jobs are looked up in the render cache first, so only
+        sections whose source or render settings changed are rendered.
+        With ``warm``, jobs run on prefork workers that keep manimlib loaded.
+        ``segments`` limits section mode to the named sections, and
+        ``shards`` splits each of them into that many frame ranges. With
+        ``queue``, jobs go through that shared queue directory instead.
+        Jobs only start while their predicted peak memory fits
+        ``memory_budget`` bytes. With ``live``, a refreshing view shows each
+        running job's section, frame rate and ETA instead of one line per job.
+        ``variants`` are lower quality tiers encoded from the same frames.
+        """
+        from progress_view import ProgressView
+        from render_cache import restore_cached_jobs, store_rendered_results
+        from render_history import RenderHistory
+        from render_pool import print_render_summary
+        from render_queue import select_renderer
+        from section_shards import render_sharded
+
+        if queue is not None and shards > 1:
+            print("❌ --shards cannot be combined with --queue")
+            return False
+        if variants and shards > 1:
+            print("❌ --shards cannot be combined with --variants")
+            return False
+        if self.missing_modules(module_nums):
+            return False
+
+        if sections:
+            try:
+                jobs = self.build_section_jobs(
+                    module_nums, quality, include_intro, segments, variants
+                )
+            except KeyError as error:
+                print(f"❌ {error.args[0]}")
+                return False
+            restored = []
+            if cache is not None:
+                jobs, restored = restore_cached_jobs(jobs, cache)
+            print(
+                f"🎬 Rendering {len(jobs)} sections at {quality} quality"
+                f" ({len(restored)} served from cache)"
+            )
+        else:
+            jobs = self.build_render_jobs(
+                module_nums, quality, include_intro, variants
+            )
+            print(f"🎬 Rendering {len(jobs)} modules at {quality} quality")
+        if variants:
+            print(f"🎞️  Also encoding {', '.join(variants)} from the same frames")
+
+        history = RenderHistory()
+        view = ProgressView(jobs, history) if live else None
+
+        def report(result: Dict):
+            if view is not None:
+                view.on_result(result)
+                return
+            status = "✅" if result["ok"] else "❌"
+            print(f"{status} {result['name']} finished in {result['wall_time']:.1f}s")
+
+        start = time.perf_counter()
+        renderer = select_renderer(warm, queue, memory_budget)
+        try:
+            with view or contextlib.nullcontext():
+                if sections and shards > 1:
+                    results = render_sharded(
+                        jobs,
+                        shards,
+                        renderer,
+                        workers,
+                        on_result=report,
+                        history=history,
+                    )
+                else:
+                    results = renderer(
+                        jobs, workers=workers, on_result=report, history=history
+                    )
+        except RuntimeError as error:
+            print(f"❌ {error}")
+            return False
+        if cache is not None:
+            store_rendered_results(jobs, results, cache)
+        print_render_summary(results, time.perf_counter() - start)
+        return all(result["ok"] for result in results)
+
+    def record_timelines(
+        self,
+        module_nums: List[int],
+        workers: Optional[int] = None,
+        include_intro: bool = False,
+    ) -> bool:
+        """Dry-run modules without rendering and print their exact timelines"""
+        from render_pool import render_jobs
+        from scene_timeline import (
+            format_duration,
+            load_timeline,
+            timeline_lines,
+            timeline_path,
+        )
+        from section_render import plan_timeline_job
+
+        if self.missing_modules(module_nums):
+            return False
+        jobs = [
+            plan_timeline_job(target["file"], target["class"])
+            for target in self.render_targets(module_nums, include_intro)
+        ]
+        print(f"⏱️  Dry-running {len(jobs)} scenes")
+        results = {result["name"]: result for result in render_jobs(jobs, workers)}
+
+        ok = True
+        total = 0.0
+        for job in jobs:
+            timeline = load_timeline(job["source"], job["parent_scene"])
+            if not results[job["name"]]["ok"] or timeline is None:
+                print(f"❌ {job['parent_scene']}: see {results[job['name']]['log']}")
+                ok = False
+                continue
+            total += timeline["duration"]
+            print(
+                f"\n🎬 {job['parent_scene']}: {format_duration(timeline['duration'])}"
+                f" -> {timeline_path(job['parent_scene'])}"
+            )
+            for line in timeline_lines(timeline):
+                print(line)
+        print(f"\nTotal: {format_duration(total)}")
+        return ok
+
+    def stitch_modules(self, module_nums: List[int], quality: str = "high") -> bool:
+        """Join each module's section clips into one module video"""
+        from section_render import section_clip_paths
+        from stitch import StitchError, concat_clips
+
+        ok = True
+        for num in module_nums:
+            for target in self.scene_targets(self.modules[num]):
+                output = self.module_video_path(target, quality)
+                try:
+                    clips = section_clip_paths(
+                        target["file"], target["class"], quality
+                    )
+                    concat_clips(clips, output)
+                except (KeyError, StitchError) as error:
+                    print(f"❌ Module {num}: {error.args[0]}")
+                    ok = False
+                    continue
+                print(f"✅ Module {num}: {len(clips)} clips -> {output}")
+        return ok
+
+    def stitch_course(self, quality: str = "high") -> bool:
+        """Join the course introduction and every module into one course video"""
+        from render_pool import modules_dir
+        from stitch import StitchError, concat_clips
+
+        targets = self.render_targets(list(self.modules), include_intro=True)
+        videos = [self.module_video_path(target, quality) for target in targets]
+        output = os.path.join(os.path.dirname(modules_dir(quality)), "course.mp4")
+        try:
+            concat_clips(videos, output)
+        except StitchError as error:
+            print(f"❌ {error.args[0]}")
+            return False
+        print(f"✅ Course: {len(videos)} videos -> {output}")
+        return True
+
+    def build(
+        self,
+        module_nums: List[int],
+        quality: str = "high",
+        workers: Optional[int] = None,
+        cache: Optional["RenderCache"] = None,
+        include_intro: bool = False,
+        warm: bool = False,
+        queue: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        variants: Sequence[str] = (),
+    ) -> bool:
+        """Incrementally rebuild module videos from changed sections only"""
+        from course_build import build_course
+
+        if self.missing_modules(module_nums):
+            return False
+        targets = self.render_targets(module_nums, include_intro)
+        try:
+            return build_course(
+                targets, quality, workers, cache, warm, queue, memory_budget, variants
+            )
+        except RuntimeError as error:
+            print(f"❌ {error}")
+            return False
+
+    def watch(
+        self,
+        module_nums: List[int],
+        cache: Optional["RenderCache"] = None,
+        include_intro: bool = False,
+    ) -> bool:
+        """Re-render each section at draft quality as soon as it is edited"""
+        from section_watch import SectionWatcher
+
+        if self.missing_modules(module_nums):
+            return False
+        entries = [self.modules[num] for num in module_nums]
+        if include_intro:
+            entries.insert(0, self.course_intro)
+        try:
+            SectionWatcher([info["file"] for info in entries], cache=cache).run()
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
         return True
 
+    def interactive(self, module_num: int, scene: Optional[str] = None) -> bool:
+        """Open a module scene in manimgl's window with hot-swapping enabled"""
+        import subprocess
+
+        from course_settings import VIDEOS_DIR
+        from section_render import plan_interactive_job
+
+        if self.missing_modules([module_num]):
+            return False
+        info = self.modules[module_num]
+        scenes = [target["class"] for target in self.scene_targets(info)]
+        scene = scene or scenes[0]
+        if scene not in scenes:
+            print(f"❌ Module {module_num} has no scene {scene}; it has {scenes}")
+            return False
+        job = plan_interactive_job(info["file"], scene)
+        print(f"🪟 Opening {scene}; edit the source, then run self.hot_swap()")
+        command = [sys.executable, "-m", "manimlib", job["file"], job["scene"]]
+        return subprocess.run(command, cwd=VIDEOS_DIR).returncode == 0
+
     def run_complete_course(self):
         """Run the complete course introduction"""
         print("🎓 Starting Complete Python Programming Course")
@@ -182,11 +574,12 @@ class CourseLauncher:
             print("3. Run complete course introduction")
             print("4. Check dependencies")
             print("5. Course information")
+            print("6. Render modules with live progress")
             print("0. Exit")
             print("-" * 60)
 
             try:
-                choice = input("Select an option (0-5): ").strip()
+                choice = input("Select an option (0-6): ").strip()
 
                 if choice == "0":
                     print("👋 Thanks for using the Python Course!")
@@ -209,6 +602,8 @@ class CourseLauncher:
                         print("❌ Missing dependencies")
                 elif choice == "5":
                     self.show_course_info()
+                elif choice == "6":
+                    self.render_from_menu()
                 else:
                     print("❌ Invalid option. Please try again.")
 
@@ -216,6 +611,78 @@ class CourseLauncher:
                 print("\n👋 Course launcher interrupted. Goodbye!")
                 break
 
+    def render_from_menu(self):
+        """Ask what to render, then render it with the live progress view"""
+        from render_cache import RenderCache
+
+        if not self.check_dependencies():
+            return
+        self.list_modules()
+        try:
+            answer = input("\nModules to render (e.g. 1 4 7, blank for all): ")
+            module_nums = [int(num) for num in answer.split()] or list(self.modules)
+        except ValueError:
+            print("❌ Please enter module numbers separated by spaces")
+            return
+        quality = input(f"Quality {list(QUALITY_TIERS)} [draft]: ").strip() or "draft"
+        if quality not in QUALITY_TIERS:
+            print(f"❌ Unknown quality: {quality}")
+            return
+        sections = input("Render one job per section? [Y/n]: ").strip().lower()
+        self.render_modules(
+            module_nums,
+            quality,
+            sections=sections not in ("n", "no"),
+            cache=RenderCache(),
+            live=True,
+        )
+
+    def startup_check(self) -> bool:
+        """Check that metadata commands start fast and import nothing heavy"""
+        import subprocess
+
+        ok = True
+        for command in METADATA_COMMANDS:
+            argv = [sys.executable, os.path.abspath(__file__), *command]
+            timings = []
+            for _ in range(STARTUP_RUNS):
+                start = time.perf_counter()
+                subprocess.run(argv, stdout=subprocess.DEVNULL, check=True)
+                timings.append(time.perf_counter() - start)
+            profile = subprocess.run(
+                [sys.executable, "-X", "importtime", *argv[1:]],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+            imported = [
+                line.rsplit("|", 1)[1].strip()
+                for line in profile.stderr.splitlines()
+                if line.startswith("import time:") and "|" in line
+            ]
+            heavy = [
+                name
+                for name in imported
+                if any(
+                    name == module or name.startswith(f"{module}.")
+                    for module in HEAVY_MODULES
+                )
+            ]
+
+            best = min(timings)
+            fast = best <= STARTUP_BUDGET_SECONDS
+            status = "✅" if fast and not heavy else "❌"
+            print(
+                f"{status} {' '.join(command)}: {best * 1000:.0f} ms"
+                f" (budget {STARTUP_BUDGET_SECONDS * 1000:.0f} ms,"
+                f" best of {STARTUP_RUNS})"
+            )
+            if heavy:
+                print(f"   Imports render modules: {', '.join(heavy)}")
+            ok = ok and fast and not heavy
+        return ok
+
     def show_course_info(self):
         """Display comprehensive course information"""
         print("\n🎓 Complete Python Programming Course")
@@ -255,21 +722,262 @@ def main():
     parser.add_argument("--module", "-m", type=int, help="Run specific module (0-10)")
     parser.add_argument("--list", "-l", action="store_true", help="List all modules")
     parser.add_argument(
-        "--complete", "-c", action="store_true", help="Run complete course"
+        "--breakdown",
+        action="store_true",
+        help="With --list, show each module's duration per section",
+    )
+    parser.add_argument(
+        "--complete",
+        "-c",
+        action="store_true",
+        help="Run complete course (with --render, also render the course intro)",
     )
     parser.add_argument(
         "--info", "-i", action="store_true", help="Show course information"
     )
+    parser.add_argument(
+        "--render",
+        "-r",
+        type=int,
+        nargs="*",
+        metavar="MODULE",
+        help="Render modules in parallel (all modules if none given)",
+    )
+    parser.add_argument(
+        "--quality",
+        "-q",
+        choices=list(QUALITY_TIERS),
+        default="high",
+        help="Render quality tier",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Number of render worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--variants",
+        nargs="+",
+        choices=list(QUALITY_TIERS),
+        default=[],
+        metavar="TIER",
+        help="Also write these lower quality tiers from the same render",
+    )
+    parser.add_argument(
+        "--sections",
+        "-s",
+        action="store_true",
+        help="Render each section method as its own job and clip",
+    )
+    parser.add_argument(
+        "--segment",
+        action="append",
+        metavar="SECTION",
+        help="With --sections, only render this section (repeatable)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="With --sections, split each section into N frame ranges",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="With --render, show a live view of running jobs and ETAs",
+    )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Render on prefork workers that keep manimlib and GL loaded",
+    )
+    parser.add_argument(
+        "--queue",
+        nargs="?",
+        const=DEFAULT_QUEUE_DIR,
+        metavar="DIR",
+        help="Publish render jobs to a shared queue directory and wait for them",
+    )
+    parser.add_argument(
+        "--queue-worker",
+        nargs="?",
+        const=DEFAULT_QUEUE_DIR,
+        metavar="DIR",
+        help="Render jobs from a shared queue directory until it is drained",
+    )
+    parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="With --queue-worker, keep waiting for new jobs",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=parse_size,
+        help="Memory concurrent renders may use, e.g. 48G (default: 80%% of RAM)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=parse_size,
+        help="Byte budget of the section render cache, e.g. 20G",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Render every section even if a cached clip exists",
+    )
+    parser.add_argument(
+        "--build",
+        "-b",
+        type=int,
+        nargs="*",
+        metavar="MODULE",
+        help="Re-render changed sections and re-stitch affected modules",
+    )
+    parser.add_argument(
+        "--watch",
+        type=int,
+        nargs="*",
+        metavar="MODULE",
+        help="Re-render edited sections at draft quality on every save",
+    )
+    parser.add_argument(
+        "--interactive",
+        type=int,
+        metavar="MODULE",
+        help="Open a module in manimgl's window; self.hot_swap() applies edits",
+    )
+    parser.add_argument(
+        "--scene",
+        help="With --interactive, which of the module's scenes to open",
+    )
+    parser.add_argument(
+        "--startup-check",
+        action="store_true",
+        help="Check that --list and --info start fast without heavy imports",
+    )
+    parser.add_argument(
+        "--timeline",
+        type=int,
+        nargs="*",
+        metavar="MODULE",
+        help="Dry-run modules without rendering and record exact timelines",
+    )
+    parser.add_argument(
+        "--stitch",
+        type=int,
+        nargs="*",
+        metavar="MODULE",
+        help="Join section clips into module videos (all modules if none given)",
+    )
+    parser.add_argument(
+        "--stitch-course",
+        action="store_true",
+        help="Join the course intro and all module videos into one course video",
+    )
 
     args = parser.parse_args()
     launcher = CourseLauncher()
 
-    # Check dependencies first
-    if not launcher.check_dependencies():
-        sys.exit(1)
+    variants = [tier for tier in args.variants if tier != args.quality]
+    master = QUALITY_TIERS[args.quality]
+    master_width = int(master["resolution"].split("x")[0])
+    for tier in variants:
+        if int(QUALITY_TIERS[tier]["resolution"].split("x")[0]) > master_width:
+            parser.error(f"--variants {tier} is larger than --quality {args.quality}")
+        # Variants drop frames from the master; they cannot add any
+        if QUALITY_TIERS[tier]["fps"] > master["fps"]:
+            parser.error(
+                f"--variants {tier} has a higher frame rate than"
+                f" --quality {args.quality}"
+            )
+
+    # Only commands that run manimgl need it; metadata commands stay fast
+    renders = (
+        args.render is not None
+        or args.build is not None
+        or args.timeline is not None
+        or args.queue_worker is not None
+        or args.watch is not None
+        or args.interactive is not None
+    )
+    cache = None
+    if renders:
+        from render_cache import RenderCache
+
+        if not launcher.check_dependencies():
+            sys.exit(1)
+        if not args.no_cache:
+            cache = RenderCache(max_bytes=args.cache_size)
 
-    if args.list:
-        launcher.list_modules()
+    if args.render is not None:
+        module_nums = args.render or list(launcher.modules)
+        if not launcher.render_modules(
+            module_nums,
+            args.quality,
+            args.workers,
+            args.sections,
+            include_intro=args.complete,
+            cache=cache,
+            warm=args.warm,
+            segments=args.segment,
+            shards=args.shards,
+            queue=args.queue,
+            memory_budget=args.memory_budget,
+            live=args.progress,
+            variants=variants,
+        ):
+            sys.exit(1)
+    elif args.build is not None:
+        module_nums = args.build or list(launcher.modules)
+        if not launcher.build(
+            module_nums,
+            args.quality,
+            args.workers,
+            cache,
+            args.complete,
+            args.warm,
+            args.queue,
+            args.memory_budget,
+            variants,
+        ):
+            sys.exit(1)
+    elif args.interactive is not None:
+        if not launcher.interactive(args.interactive, args.scene):
+            sys.exit(1)
+    elif args.watch is not None:
+        module_nums = args.watch or list(launcher.modules)
+        if not launcher.watch(module_nums, cache, args.complete):
+            sys.exit(1)
+    elif args.timeline is not None:
+        module_nums = args.timeline or list(launcher.modules)
+        if not launcher.record_timelines(module_nums, args.workers, args.complete):
+            sys.exit(1)
+    elif args.queue_worker is not None:
+        from render_queue import RenderQueue, drain
+
+        queue = RenderQueue(args.queue_worker)
+        print(f"📥 Rendering jobs from {queue.root}")
+        try:
+            completed = drain(queue, args.workers, args.follow, args.memory_budget)
+        except KeyboardInterrupt:
+            print("\n⏹️  Worker stopped; unfinished jobs return after their lease")
+            sys.exit(1)
+        print(f"✅ Queue drained after {completed} jobs")
+    elif args.stitch is not None or args.stitch_course:
+        ok = True
+        if args.stitch is not None:
+            module_nums = args.stitch or list(launcher.modules)
+            ok = launcher.stitch_modules(module_nums, args.quality)
+        if args.stitch_course:
+            ok = launcher.stitch_course(args.quality) and ok
+        if not ok:
+            sys.exit(1)
+    elif args.startup_check:
+        if not launcher.startup_check():
+            sys.exit(1)
+    elif args.list:
+        launcher.list_modules(args.breakdown)
     elif args.module:
         launcher.run_module(args.module)
     elif args.complete:
@@ -0,0 +1,91 @@
+"""
+Course Settings
+
+Paths, quality tiers and small helpers shared by the launcher and the render
+tooling. The launcher's metadata commands (``--list``, ``--info``) import
+this module but none of the render machinery, so it must only ever import
+cheap standard library modules.
+"""
+
+import contextlib
+import os
+from typing import Iterator, Union
+
+VIDEOS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT_DIR = os.path.join(VIDEOS_DIR, "renders")
+DEFAULT_QUEUE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "queue")
+
+# Quality tiers map to explicit resolution/fps so outputs are reproducible
+QUALITY_TIERS = {
+    "draft": {"resolution": "854x480", "fps": 15},
+    "low": {"resolution": "854x480", "fps": 30},
+    "medium": {"resolution": "1280x720", "fps": 30},
+    "high": {"resolution": "1920x1080", "fps": 60},
+    "uhd": {"resolution": "3840x2160", "fps": 60},
+}
+
+SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as ``500M`` or ``20G``"""
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in SIZE_UNITS:
+        return int(float(text[:-1]) * SIZE_UNITS[text[-1]])
+    return int(text)
+
+
+def source_digest(file: str) -> str:
+    """Hash of a course source file, relative to the videos directory"""
+    import hashlib  # not needed by the launcher's metadata commands
+
+    with open(os.path.join(VIDEOS_DIR, file), "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+@contextlib.contextmanager
+def replacing(path: str) -> Iterator[str]:
+    """Temporary path for the new content of ``path``, moved over it on success
+
+    The temporary name is unique to the host, process and thread, so writers
+    of the same file never share one, and ``os.replace`` makes the new
+    content appear at once. If writing fails the temporary file is removed
+    and the error is raised.
+    """
+    import socket
+    import threading
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary = (
+        f"{path}.{socket.gethostname()}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        yield temporary
+        os.replace(temporary, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temporary)
+        raise
+
+
+def atomic_write(path: str, content: Union[str, bytes], sync: bool = False):
+    """Replace a file's content atomically; ``sync`` flushes it to disk first
+
+    Syncing is for files other machines read over shared storage.
+    """
+    binary = isinstance(content, bytes)
+    with replacing(path) as temporary:
+        with open(
+            temporary, "wb" if binary else "w", encoding=None if binary else "utf-8"
+        ) as handle:
+            handle.write(content)
+            if sync:
+                handle.flush()
+                os.fsync(handle.fileno())
+
+
+def atomic_write_json(path: str, data, sync: bool = False, **options):
+    """Replace a JSON file atomically; ``options`` go to ``json.dumps``"""
+    import json
+
+    atomic_write(path, json.dumps(data, **options), sync)
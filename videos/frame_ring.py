@@ -0,0 +1,218 @@
+"""
+Shared-Memory Frame Ring
+
+Hands rendered frames to ffmpeg without copying them through the render
+process. ``FrameRing`` preallocates ``RING_SLOTS`` frame-sized slots in a
+memory-mapped file on tmpfs. The camera reads pixels straight into the next
+free slot, and a feeder process, started once per render, writes each
+filled slot to the encoder's stdin (more than once if the frame stands for
+several output frames) and hands it back:
+
+    render process:  readback -> slot 0 | slot 1 | slot 2 | slot 3
+    feeder process:              slot n -> ffmpeg stdin
+
+Slots are used round-robin and acknowledged in order, so the render
+process only waits when every slot is still queued for the encoder, which
+gives backpressure. Nothing is allocated per frame: a slot is a view into
+the shared mapping and the feeder writes from its own view of it.
+
+Encoders come and go while the feeder lives (crash journaling opens one per
+animation): each encoder's stdin is passed to the feeder over a Unix socket
+together with the message that opens it. The feeder is this file, run as a
+script; it needs nothing beyond the standard library.
+"""
+
+import mmap
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+# Frames that may wait for the encoder; at 1080p each slot is about 8 MB
+RING_SLOTS = 4
+
+# Messages to the feeder: operation, slot, frame length and times to write it
+OPEN, FRAME, CLOSE = b"O", b"F", b"C"
+MESSAGE = struct.Struct("<cIII")
+# Replies: slot and seconds spent writing it, negative if the write failed
+ACK = struct.Struct("<Id")
+
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def receive_exactly(channel: socket.socket, size: int) -> bytes:
+    """Read a whole message, or return ``b""`` if the peer went away"""
+    data = b""
+    while len(data) < size:
+        chunk = channel.recv(size - len(data))
+        if not chunk:
+            return b""
+        data += chunk
+    return data
+
+
+class FrameRing:
+    """Frame slots shared with a feeder process that writes them to ffmpeg"""
+
+    def __init__(self, frame_size: int, slots: int = RING_SLOTS):
+        self.frame_size = frame_size
+        self.backing = tempfile.TemporaryFile(dir=SHARED_MEMORY_DIR)
+        os.ftruncate(self.backing.fileno(), frame_size * slots)
+        self.memory = mmap.mmap(self.backing.fileno(), frame_size * slots)
+        view = memoryview(self.memory)
+        self.slots = [
+            view[index * frame_size : (index + 1) * frame_size]
+            for index in range(slots)
+        ]
+        view.release()
+        self.channel, feeder_end = socket.socketpair()
+        self.feeder = subprocess.Popen(
+            [
+                sys.executable,
+                os.path.abspath(__file__),
+                str(feeder_end.fileno()),
+                str(self.backing.fileno()),
+                str(frame_size),
+                str(slots),
+            ],
+            pass_fds=(feeder_end.fileno(), self.backing.fileno()),
+        )
+        feeder_end.close()
+        self.submitted = 0
+        self.acknowledged = 0
+        self.filling = None
+        self.encode_time = 0.0
+        self.stall_time = 0.0
+        self.error = None
+
+    def receive_ack(self):
+        """Wait for the feeder to finish the oldest queued message"""
+        reply = receive_exactly(self.channel, ACK.size)
+        if not reply:
+            raise BrokenPipeError("the frame feeder exited")
+        _, seconds = ACK.unpack(reply)
+        self.acknowledged += 1
+        if seconds < 0:
+            self.error = BrokenPipeError("the encoder stopped reading frames")
+        else:
+            self.encode_time += seconds
+
+    def check(self):
+        if self.error is not None:
+            raise self.error
+
+    def acquire(self) -> memoryview:
+        """The slot the next frame goes into, once the encoder has freed it"""
+        if self.filling is None:
+            started = time.perf_counter()
+            while self.submitted - self.acknowledged >= len(self.slots):
+                self.receive_ack()
+            self.stall_time += time.perf_counter() - started
+            self.filling = self.slots[self.submitted % len(self.slots)]
+        self.check()
+        return self.filling
+
+    def submit(self, frame, copies: int = 1) -> int:
+        """Queue a frame for the encoder, copying it in unless read in place"""
+        slot = self.acquire()
+        size = len(frame)
+        if size > self.frame_size:
+            raise ValueError(f"frame of {size} bytes exceeds the ring's slots")
+        if frame is not slot:
+            slot[:size] = frame
+        index = self.submitted % len(self.slots)
+        self.channel.sendall(MESSAGE.pack(FRAME, index, size, copies))
+        self.submitted += 1
+        self.filling = None
+        return size
+
+    def open_output(self, stdin):
+        """Start feeding an encoder's stdin"""
+        message = MESSAGE.pack(OPEN, 0, 0, 0)
+        socket.send_fds(self.channel, [message], [stdin.fileno()])
+        self.submitted += 1
+
+    def close_output(self):
+        """Wait until every queued frame is written, then close the encoder"""
+        self.channel.sendall(MESSAGE.pack(CLOSE, 0, 0, 0))
+        self.submitted += 1
+        while self.acknowledged < self.submitted:
+            self.receive_ack()
+        self.check()
+
+    def close(self):
+        """Stop the feeder and free the shared memory"""
+        self.channel.close()
+        self.feeder.wait()
+        for slot in self.slots:
+            slot.release()
+        self.memory.close()
+        self.backing.close()
+
+
+class RingPipe:
+    """Stand-in for an encoder's stdin that queues frames in a ``FrameRing``"""
+
+    def __init__(self, ring: FrameRing, stdin):
+        self.ring = ring
+        self.stdin = stdin
+        # Output frames the next written frame stands for
+        self.copies = 1
+        ring.open_output(stdin)
+
+    def write(self, frame) -> int:
+        return self.ring.submit(frame, self.copies)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        try:
+            self.ring.close_output()
+        finally:
+            self.stdin.close()
+
+
+def feed(channel: socket.socket, memory: mmap.mmap, frame_size: int):
+    """Write the slots named on ``channel`` to the encoder it last opened"""
+    view = memoryview(memory)
+    encoder = None
+    failed = False
+    while True:
+        try:
+            message, fds, _, _ = socket.recv_fds(channel, MESSAGE.size, 1)
+        except ConnectionError:  # the render process closed with replies unread
+            break
+        if not message:
+            break
+        if len(message) < MESSAGE.size:
+            message += receive_exactly(channel, MESSAGE.size - len(message))
+        operation, slot, size, copies = MESSAGE.unpack(message)
+        if operation == OPEN:
+            encoder, failed = fds[0], False
+        elif operation == CLOSE and encoder is not None:
+            os.close(encoder)
+            encoder = None
+        started = time.perf_counter()
+        if operation == FRAME and not failed:
+            try:
+                for _ in range(copies):
+                    frame = view[slot * frame_size : slot * frame_size + size]
+                    while frame:
+                        frame = frame[os.write(encoder, frame) :]
+            except OSError:
+                failed = True
+        seconds = -1.0 if failed else time.perf_counter() - started
+        try:
+            channel.sendall(ACK.pack(slot, seconds))
+        except ConnectionError:
+            break
+
+
+if __name__ == "__main__":
+    channel_fd, memory_fd, frame_size, slots = map(int, sys.argv[1:5])
+    channel = socket.socket(fileno=channel_fd)
+    feed(channel, mmap.mmap(memory_fd, frame_size * slots), frame_size)
@@ -0,0 +1,135 @@
+"""
+Multi-Resolution Output
+
+Writes every deliverable resolution from one render. ``MultiOutputScene``
+replaces the file writer's ffmpeg pipe with a single encoder process whose
+filter graph splits the master frames and scales (and, for lower tiers,
+decimates) each copy:
+
+    [0:v] vflip, split -> master                      renders/high/...
+                       -> fps=30, scale=1280:720    renders/medium/...
+                       -> fps=30, scale=854:480     renders/low/...
+
+``construct()`` runs and every frame is rasterized once, at the master
+tier; the scaled outputs only cost encoder time. Each copy lands at the
+same path under its own tier's ``renders/<tier>`` tree, so the section
+cache, incremental builds and stitching pick it up like a direct render.
+
+Crash journaling still works: every journaled partial file gets scaled
+partials next to it, and those are assembled once the scene finishes.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import os
+import shutil
+import subprocess
+from typing import List, Tuple
+
+from manimlib import Scene
+
+from course_settings import QUALITY_TIERS
+from render_pool import variant_path
+from stitch import concat_clips
+
+
+class MultiOutputScene(Scene):
+    """Mixin that encodes scaled copies of the movie in the same pass"""
+
+    # Tier being rendered and the lower tiers also written, set by subclasses
+    output_quality = "high"
+    output_variants = []
+
+    def run(self):
+        writer = self.file_writer
+        if self.output_variants and getattr(writer, "write_to_movie", False):
+            # Installed before JournalScene wraps the pipe, so partials split too
+            self.install_outputs(writer)
+        super().run()
+        if self.output_variants and getattr(self, "journal", None) is not None:
+            self.assemble_variants()
+
+    def output_paths(self, file_path: str) -> List[Tuple[str, str]]:
+        """(tier, path) of the master file and each scaled copy"""
+        paths = [(self.output_quality, file_path)]
+        for variant in self.output_variants:
+            paths.append(
+                (variant, variant_path(file_path, self.output_quality, variant))
+            )
+        return paths
+
+    def encoder_command(self, outputs: List[Tuple[str, str]]) -> List[str]:
+        """ffmpeg command reading raw frames and writing every output"""
+        camera = self.camera
+        width, height = camera.get_pixel_shape()
+        fps = getattr(camera, "fps", None) or camera.frame_rate
+
+        labels = "".join(f"[v{index}]" for index in range(len(outputs)))
+        graph = [f"[0:v]vflip,split={len(outputs)}{labels}"]
+        for index, (tier, _) in enumerate(outputs[1:], start=1):
+            settings = QUALITY_TIERS[tier]
+            scale = settings["resolution"].replace("x", ":")
+            rate = min(settings["fps"], fps)
+            graph.append(
+                f"[v{index}]fps={rate},scale={scale}:flags=lanczos[out{index}]"
+            )
+
+        command = ["ffmpeg", "-y", "-f", "rawvideo", "-s", f"{width}x{height}"]
+        command += ["-pix_fmt", "rgba", "-r", str(fps), "-i", "-"]
+        command += ["-filter_complex", ";".join(graph), "-an", "-loglevel", "error"]
+        for index, (tier, path) in enumerate(outputs):
+            label = "[v0]" if index == 0 else f"[out{index}]"
+            rate = fps if index == 0 else min(QUALITY_TIERS[tier]["fps"], fps)
+            command += ["-map", label, "-r", str(rate)]
+            command += ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+            command.append(self.temporary_path(path))
+        return command
+
+    @staticmethod
+    def temporary_path(path: str) -> str:
+        stem, extension = os.path.splitext(path)
+        return f"{stem}_temp{extension}"
+
+    def install_outputs(self, writer):
+        """Replace the writer's movie pipe with the multi-output encoder"""
+        state = {"outputs": []}
+
+        def open_movie_pipe(file_path):
+            state["outputs"] = self.output_paths(file_path)
+            for _, path in state["outputs"]:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            writer.final_file_path = file_path
+            writer.has_progress_display = False
+            writer.writing_process = subprocess.Popen(
+                self.encoder_command(state["outputs"]), stdin=subprocess.PIPE
+            )
+
+        def close_movie_pipe():
+            writer.writing_process.stdin.close()
+            writer.writing_process.wait()
+            # Scaled copies first: the master appearing marks the set complete
+            for _, path in reversed(state["outputs"]):
+                shutil.move(self.temporary_path(path), path)
+
+        writer.open_movie_pipe = open_movie_pipe
+        writer.close_movie_pipe = close_movie_pipe
+
+    def assemble_variants(self):
+        """Join each tier's journaled partials into that tier's movie"""
+        journal = self.journal
+        for variant in self.output_variants:
+            partials = [
+                variant_path(
+                    journal.partial_path(entry["partial"]),
+                    self.output_quality,
+                    variant,
+                )
+                for entry in journal.entries
+            ]
+            final = variant_path(journal.final_path, self.output_quality, variant)
+            if len(partials) == 1:
+                os.replace(partials[0], final)
+            elif partials:
+                concat_clips(partials, final)
+            directory = variant_path(journal.directory, self.output_quality, variant)
+            shutil.rmtree(directory, ignore_errors=True)
@@ -0,0 +1,192 @@
+"""
+Live Render Progress View
+
+Draws a terminal table of a batch of render jobs while they run: each job's
+current section, frames written, frames per second and ETA, plus an
+aggregate ETA for the whole batch. Jobs report progress through
+``render_progress.ProgressScene``; the view only reads those small files
+from a background thread, at most once per ``REFRESH_SECONDS``, so drawing
+never competes with the renders for more than a sliver of one core.
+
+ETAs come from measured throughput. A running job's ETA is its remaining
+frames (from the frame count the render history recorded last time) over
+its current frames per second. The batch ETA divides the remaining frames
+of every unfinished job by the combined frames per second of the running
+ones; jobs that never rendered before are sized from the history's time
+estimate at the current per-job rate.
+"""
+
+import os
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from render_pool import job_progress_path, read_progress
+from scene_timeline import format_duration
+
+if TYPE_CHECKING:
+    from render_history import RenderHistory
+
+REFRESH_SECONDS = 1.0
+
+# Without a terminal, print a one-line status this often instead
+LOG_SECONDS = 30.0
+
+# Finished jobs listed under the running ones (failures are always listed)
+RECENT_JOBS = 5
+
+NAME_WIDTH = 40
+SECTION_WIDTH = 24
+
+
+def clip(text: str, width: int) -> str:
+    """Pad or truncate text to a column width"""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+class ProgressView:
+    """Background-refreshed terminal view of a batch of render jobs"""
+
+    def __init__(
+        self,
+        jobs: List[Dict],
+        history: Optional["RenderHistory"] = None,
+        stream=None,
+    ):
+        self.jobs = jobs
+        self.history = history
+        self.stream = stream or sys.stdout
+        self.interactive = self.stream.isatty()
+        self.estimates = history.estimates(jobs) if history and jobs else {}
+        self.results = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.started = time.perf_counter()
+        self.logged = 0.0
+
+    def __enter__(self):
+        # Progress left over from an earlier run would show a stale state
+        for job in self.jobs:
+            try:
+                os.remove(job_progress_path(job))
+            except FileNotFoundError:
+                pass
+        self.thread = threading.Thread(target=self.refresh_loop, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        self.draw(final=True)
+
+    def on_result(self, result: Dict):
+        """Record a finished job (used as the renderer's ``on_result``)"""
+        with self.lock:
+            self.results[result["name"]] = result
+
+    def refresh_loop(self):
+        while not self.stopped.wait(REFRESH_SECONDS):
+            self.draw()
+
+    def job_state(self, job: Dict) -> Dict:
+        """Status, section, frames, rate and ETA of one job"""
+        with self.lock:
+            result = self.results.get(job["name"])
+        expected = self.history.frames(job) if self.history else None
+        if result is not None:
+            status = "done" if result["ok"] else "failed"
+            frames = result.get("frames") or expected
+            return {"status": status, "frames": frames, "expected": frames}
+
+        progress = read_progress(job)
+        if not progress:
+            return {"status": "queued", "frames": 0, "expected": expected}
+        frames, fps = progress["frames"], progress["fps"]
+        eta = None
+        if expected and fps > 0:
+            eta = max(expected - frames, 0) / fps
+        return {
+            "status": "running",
+            "section": progress.get("section") or f"play {progress['plays']}",
+            "frames": frames,
+            "expected": expected,
+            "fps": fps,
+            "eta": eta,
+        }
+
+    def batch_eta(self, states: Dict[str, Dict]) -> Optional[float]:
+        """Seconds until every job is done at the current throughput"""
+        running = [state for state in states.values() if state["status"] == "running"]
+        throughput = sum(state["fps"] for state in running)
+        if throughput <= 0:
+            return None
+        per_job = throughput / len(running)
+
+        remaining = 0.0
+        for job in self.jobs:
+            state = states[job["name"]]
+            if state["status"] not in ("running", "queued"):
+                continue
+            if state["expected"]:
+                remaining += max(state["expected"] - state["frames"], 0)
+            else:
+                # Never rendered before: size it from its time estimate
+                seconds = self.estimates.get(job["name"], 0.0)
+                remaining += max(seconds * per_job - state["frames"], 0)
+        return remaining / throughput
+
+    def lines(self) -> List[str]:
+        """The table as lines of text"""
+        states = {job["name"]: self.job_state(job) for job in self.jobs}
+        counts = {}
+        for state in states.values():
+            counts[state["status"]] = counts.get(state["status"], 0) + 1
+        throughput = sum(
+            state.get("fps", 0.0)
+            for state in states.values()
+            if state["status"] == "running"
+        )
+
+        lines = [
+            f"🎬 {counts.get('running', 0)} running · {counts.get('queued', 0)}"
+            f" queued · {counts.get('done', 0)} done · {counts.get('failed', 0)}"
+            f" failed   ⏱️  {format_duration(time.perf_counter() - self.started)}"
+            f" elapsed, ETA {format_duration(self.batch_eta(states))}"
+            f" ({throughput:.1f} frames/s)",
+            "-" * 100,
+        ]
+        for job in self.jobs:
+            state = states[job["name"]]
+            if state["status"] != "running":
+                continue
+            frames = f"{state['frames']}"
+            if state["expected"]:
+                percent = min(100.0, 100.0 * state["frames"] / state["expected"])
+                frames += f"/{state['expected']} {percent:3.0f}%"
+            lines.append(
+                f"▶️  {clip(job['name'], NAME_WIDTH):<{NAME_WIDTH}}"
+                f" {clip(state['section'], SECTION_WIDTH):<{SECTION_WIDTH}}"
+                f" {frames:>16} {state['fps']:6.1f} fps"
+                f"  ETA {format_duration(state['eta'])}"
+            )
+        with self.lock:
+            finished = list(self.results.values())
+        recent = [result for result in finished if result["ok"]][-RECENT_JOBS:]
+        for result in [result for result in finished if not result["ok"]] + recent:
+            mark = "✅" if result["ok"] else "❌"
+            lines.append(f"{mark} {result['name']} ({result['wall_time']:.1f}s)")
+        return lines
+
+    def draw(self, final: bool = False):
+        """Redraw the view (or log a status line when not on a terminal)"""
+        lines = self.lines()
+        if self.interactive:
+            # Home the cursor and clear the screen, then redraw in one write
+            self.stream.write("\033[H\033[J" + "\n".join(lines) + "\n")
+        elif final or time.perf_counter() - self.logged >= LOG_SECONDS:
+            self.logged = time.perf_counter()
+            self.stream.write(lines[0] + "\n")
+        self.stream.flush()
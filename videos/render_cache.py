@@ -0,0 +1,167 @@
+"""
+Render Cache
+
+Content-addressed store for rendered section clips. A clip's key hashes the
+section fingerprint from ``scene_index`` (its normalized source plus the
+helpers and definitions it uses) with everything else that affects pixels:
+resolution, fps, background colour, the installed manimgl version and, for
+sections rendered at a reduced frame rate, the frame step.
+
+Entries live as ``<root>/<key[:2]>/<key>.mp4``. A hit refreshes the entry's
+modification time, and once the store grows past its byte budget the entries
+with the oldest modification time are evicted first (least recently used).
+Writes go through a temporary file and ``os.replace`` so concurrent render
+workers never observe a partial clip.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from typing import Dict, List, Optional, Tuple
+
+from course_settings import DEFAULT_OUTPUT_DIR, QUALITY_TIERS, parse_size, replacing
+from render_pool import job_output_path, variant_jobs
+
+DEFAULT_CACHE_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "cache")
+DEFAULT_CACHE_BYTES = 20 * 1024**3
+
+
+def manim_version() -> str:
+    """Installed manimgl version, read from package metadata without importing"""
+    for distribution in ("manimgl", "manimlib"):
+        try:
+            return metadata.version(distribution)
+        except metadata.PackageNotFoundError:
+            continue
+    return "unknown"
+
+
+def clip_cache_key(
+    fingerprint: str,
+    quality: str,
+    background: Optional[str] = None,
+    frame_step: int = 1,
+) -> str:
+    """Build the cache key of a section clip
+
+    ``frame_step`` is the output frames per rendered frame of a section
+    rendered at a reduced frame rate; full rate clips keep their keys.
+    """
+    tier = QUALITY_TIERS[quality]
+    material = {
+        "fingerprint": fingerprint,
+        "resolution": tier["resolution"],
+        "fps": tier["fps"],
+        "background": background,
+        "manim": manim_version(),
+    }
+    if frame_step > 1:
+        material["frame_step"] = frame_step
+    encoded = json.dumps(material, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RenderCache:
+    """Size-capped, least-recently-used store of rendered clips"""
+
+    def __init__(
+        self, root: str = DEFAULT_CACHE_DIR, max_bytes: Optional[int] = None
+    ):
+        self.root = root
+        if max_bytes is None:
+            budget = os.environ.get("COURSE_RENDER_CACHE_BYTES")
+            max_bytes = parse_size(budget) if budget else DEFAULT_CACHE_BYTES
+        self.max_bytes = max_bytes
+
+    def entry_path(self, key: str) -> str:
+        """Path of the cached clip for a key"""
+        return os.path.join(self.root, key[:2], f"{key}.mp4")
+
+    def restore(self, key: str, destination: str) -> bool:
+        """Copy a cached clip to destination; return False on a miss"""
+        path = self.entry_path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+
+        os.makedirs(os.path.dirname(os.path.abspath(destination)), exist_ok=True)
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            # Evicted by a concurrent store since it was touched
+            return False
+        return True
+
+    def store(self, key: str, source: str):
+        """Add a rendered clip to the cache and enforce the byte budget"""
+        with replacing(self.entry_path(key)) as temporary:
+            shutil.copyfile(source, temporary)
+        self.evict()
+
+    def entries(self) -> Dict[str, os.stat_result]:
+        """Return every cached clip with its stat result"""
+        found = {}
+        if not os.path.isdir(self.root):
+            return found
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if not name.endswith(".mp4"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    found[path] = os.stat(path)
+                except FileNotFoundError:
+                    continue
+        return found
+
+    def evict(self) -> int:
+        """Remove least recently used clips until under budget; return bytes freed"""
+        entries = self.entries()
+        total = sum(stat.st_size for stat in entries.values())
+        freed = 0
+        for path, stat in sorted(entries.items(), key=lambda item: item[1].st_mtime):
+            if total - freed <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            freed += stat.st_size
+        return freed
+
+
+def restore_cached_jobs(
+    jobs: List[Dict], cache: RenderCache
+) -> Tuple[List[Dict], List[Dict]]:
+    """Serve cache hits; return the jobs still to render and the restored ones
+
+    A job with quality ``variants`` counts as a hit only if every tier is.
+    """
+    pending, restored = [], []
+    for job in jobs:
+        views = [job] + variant_jobs(job)
+        if all(
+            view.get("cache_key")
+            and cache.restore(view["cache_key"], job_output_path(view))
+            for view in views
+        ):
+            restored.append(job)
+        else:
+            pending.append(job)
+    return pending, restored
+
+
+def store_rendered_results(jobs: List[Dict], results: List[Dict], cache: RenderCache):
+    """Add every successfully rendered clip, and its quality variants, to the cache"""
+    by_name = {job["name"]: job for job in jobs}
+    for result in results:
+        job = by_name.get(result["name"])
+        if job is None or not result["ok"]:
+            continue
+        for view in [job] + variant_jobs(job):
+            key, output = view.get("cache_key"), job_output_path(view)
+            if key and os.path.exists(output):
+                cache.store(key, output)
@@ -0,0 +1,111 @@
+"""
+Duplicate Frame Detection
+
+Animations often end on frames that no longer change: the tail of a
+``LaggedStartMap`` whose last submobjects finished early, or the final
+frames of a ``Write``. ``FrameDedupScene`` compares every frame read back
+for the movie with the one before it, and at the end of the render prints
+how many bit-identical repeats each section produced:
+
+    Duplicate frames per section:
+      bits_to_bytes              212 of 1800  (11.8%)
+
+Nothing is copied: the previous frame is still in its frame ring slot
+(slots are reused only after the ring wraps), so ``same_frame`` compares
+the two slots directly. A strided sample of a few kilobytes rules out most
+distinct frames; frames that pass are compared chunk by chunk through a
+small scratch buffer, where ``==`` is a ``memcmp`` that stops at the first
+differing chunk. A match is exact, without any collision handling. Output
+is never altered, only recognized.
+
+The writer feeds ffmpeg a constant-rate raw video pipe, so a duplicate is
+still written; x264 codes it as skipped blocks. The report shows where
+frames are wasted, for trimming run times or lag ratios. A static
+``wait()`` is read back once by ``StaticHoldScene``, so its repeats are
+not counted here.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+from collections import Counter
+
+from manimlib import Scene
+
+# Bytes between the sampled bytes that screen out distinct frames
+SAMPLE_STRIDE = 4096
+# Bytes compared at a time once the samples match
+CHUNK_BYTES = 1 << 18
+
+
+def same_frame(previous, frame, scratch: bytearray) -> bool:
+    """Whether two frames are bit-identical, without copying either whole
+
+    Comparing two memoryviews goes byte by byte in Python's buffer
+    protocol, while a ``bytearray`` compares with ``memcmp``; each chunk of
+    ``previous`` is therefore copied into ``scratch`` (``CHUNK_BYTES`` long)
+    before it is compared.
+    """
+    if len(previous) != len(frame):
+        return False
+    if bytes(previous[::SAMPLE_STRIDE]) != bytes(frame[::SAMPLE_STRIDE]):
+        return False
+    for start in range(0, len(frame), CHUNK_BYTES):
+        part = previous[start : start + CHUNK_BYTES]
+        if len(part) == len(scratch):
+            scratch[:] = part
+            chunk = scratch
+        else:
+            chunk = bytearray(part)
+        if chunk != frame[start : start + CHUNK_BYTES]:
+            return False
+    return True
+
+
+class FrameDedupScene(Scene):
+    """Mixin that recognizes repeated frames and reports them per section"""
+
+    def run(self):
+        self.dedup_previous = None
+        self.dedup_scratch = bytearray(CHUNK_BYTES)
+        self.dedup_frames = Counter()
+        self.dedup_repeated = Counter()
+        self.install_dedup_readback(self.camera)
+        super().run()
+        self.report_duplicates()
+
+    def dedup_section(self) -> str:
+        # ProgressScene, mixed into every generated scene, tracks the section
+        return getattr(self, "progress_section", None) or "construct"
+
+    def install_dedup_readback(self, camera):
+        """Count every frame identical to the one read before it"""
+        read = camera.get_raw_fbo_data
+
+        def get_raw_fbo_data(*args, **kwargs):
+            frame = read(*args, **kwargs)
+            section = self.dedup_section()
+            self.dedup_frames[section] += 1
+            previous = self.dedup_previous
+            if (
+                previous is not None
+                and previous is not frame
+                and same_frame(previous, frame, self.dedup_scratch)
+            ):
+                self.dedup_repeated[section] += 1
+            # A ring slot keeps its frame until the ring wraps around to it
+            self.dedup_previous = frame
+            return frame
+
+        camera.get_raw_fbo_data = get_raw_fbo_data
+
+    def report_duplicates(self):
+        """Print the repeated frames of every section that had any"""
+        if not sum(self.dedup_repeated.values()):
+            return
+        print("Duplicate frames per section:")
+        for section, frames in self.dedup_frames.items():
+            repeated = self.dedup_repeated[section]
+            print(
+                f"  {section:<26} {repeated:>5} of {frames:<6}"
+                f" ({repeated / frames:.1%})"
+            )
@@ -0,0 +1,148 @@
+"""
+Render History
+
+Records how long each render job took and uses that history to schedule the
+longest jobs first, so a big module is never left running alone at the end
+of a parallel render while the other workers sit idle.
+
+Jobs without history fall back to a static cost from ``scene_index``. The
+static cost is scaled into seconds using jobs that have both a cost and a
+measured time, so estimated and measured jobs can be ordered together.
+
+The peak memory of each job is kept alongside, for ``render_memory``, and so
+is its frame count, for the ETAs of ``progress_view``.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from course_settings import DEFAULT_OUTPUT_DIR, VIDEOS_DIR, atomic_write_json
+from scene_index import segment_costs
+
+DEFAULT_HISTORY_PATH = os.path.join(DEFAULT_OUTPUT_DIR, "render_history.json")
+
+# Weight of the newest measurement in the moving average
+SMOOTHING = 0.5
+
+
+def history_key(job: Dict) -> str:
+    """Stable identity of a job across builds (indexes and shims may change)"""
+    source = job.get("source", job["file"])
+    scene = job.get("parent_scene", job["scene"])
+    segment = job.get("segment", "*")
+    key = f"{source}::{scene}::{segment}::{job['quality']}"
+    # Probe and shard jobs render a part of their section's frames
+    return f"{key}::{job['shard']}" if job.get("shard") else key
+
+
+class RenderHistory:
+    """Moving average of measured wall time per job"""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as history:
+                self.records = json.load(history)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.records = {}
+
+    def measured(self, job: Dict) -> Optional[float]:
+        """Average wall time of a job, or None without history"""
+        record = self.records.get(history_key(job))
+        return record.get("wall_time") if record else None
+
+    def peak_memory(self, job: Dict) -> Optional[int]:
+        """Recorded peak RSS of a job in bytes, or None without history"""
+        record = self.records.get(history_key(job))
+        return record.get("peak_rss") if record else None
+
+    def frames(self, job: Dict) -> Optional[int]:
+        """Frames a job wrote last time it rendered, or None without history"""
+        record = self.records.get(history_key(job))
+        return record.get("frames") if record else None
+
+    def known_peak_memory(self) -> Optional[int]:
+        """Largest peak RSS recorded for any job"""
+        records = list(self.records.values())  # may be read from worker threads
+        peaks = [record["peak_rss"] for record in records if record.get("peak_rss")]
+        return max(peaks) if peaks else None
+
+    def record(self, job: Dict, result: Dict):
+        """Fold a result into the job's moving averages
+
+        Wall time is only taken from successful renders; peak memory is taken
+        from failed ones too, since running out of memory is a failure.
+        """
+        key = history_key(job)
+        record = self.records.setdefault(key, {"runs": 0})
+        peak = result.get("peak_rss")
+        if peak:
+            # Rising peaks count in full, falling ones decay like wall time
+            previous = record.get("peak_rss", peak)
+            record["peak_rss"] = int(
+                max(peak, SMOOTHING * peak + (1 - SMOOTHING) * previous)
+            )
+        if not result["ok"]:
+            return
+        if "wall_time" not in record:
+            record["wall_time"] = result["wall_time"]
+        else:
+            record["wall_time"] = (
+                SMOOTHING * result["wall_time"]
+                + (1 - SMOOTHING) * record["wall_time"]
+            )
+        record["runs"] += 1
+        if result.get("frames"):
+            record["frames"] = result["frames"]
+
+    def save(self):
+        """Atomically write the history file
+
+        History only orders later renders, so failing to save it is a warning.
+        """
+        try:
+            atomic_write_json(self.path, self.records, indent=2, sort_keys=True)
+        except OSError as error:
+            print(f"⚠️  Render history not saved: {error}")
+
+    def static_cost(self, job: Dict, costs: Dict[str, Dict]) -> int:
+        """Static cost of a job: one segment, or a whole scene"""
+        source = job.get("source", job["file"])
+        if source not in costs:
+            try:
+                costs[source] = segment_costs(os.path.join(VIDEOS_DIR, source))
+            except (OSError, SyntaxError):
+                costs[source] = {}
+        scene = costs[source].get(job.get("parent_scene", job["scene"]))
+        if scene is None:
+            # Unknown scene name: the whole file is the best available estimate
+            return sum(sum(segments.values()) for segments in costs[source].values())
+        if "segment" in job:
+            return scene.get(job["segment"], 0)
+        return sum(scene.values())
+
+    def estimates(self, jobs: List[Dict]) -> Dict[str, float]:
+        """Predicted wall time of each job by name"""
+        costs = {}
+        static = {job["name"]: self.static_cost(job, costs) for job in jobs}
+        measured = {job["name"]: self.measured(job) for job in jobs}
+
+        # Seconds per unit of static cost, calibrated on jobs that have both
+        known = [name for name in static if measured[name] and static[name]]
+        if known:
+            scale = sum(measured[name] for name in known) / sum(
+                static[name] for name in known
+            )
+        else:
+            scale = 1.0
+
+        return {
+            name: static[name] * scale if measured[name] is None else measured[name]
+            for name in static
+        }
+
+    def order(self, jobs: List[Dict]) -> List[Dict]:
+        """Sort jobs longest predicted first"""
+        estimates = self.estimates(jobs)
+        return sorted(jobs, key=lambda job: estimates[job["name"]], reverse=True)
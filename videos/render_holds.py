@@ -0,0 +1,87 @@
+"""
+Static Hold Elision
+
+Most ``self.wait()`` calls in the course are static holds: nothing on screen
+has an updater, so every frame of the hold is identical. ``StaticHoldScene``
+collapses such a hold into a single frame: the clock advances by the whole
+hold in one step, the scene is drawn and read back once, and that frame is
+written with ``frame_repeats`` set to the hold's frame count. The frame
+ring's feeder writes it that many times, so the encoder still receives
+every frame (a raw video pipe has no way to say "repeat"), and x264 codes
+the repeats as skipped blocks. A hold costs the feeder's pipe writes
+instead of a render, a readback and a ring submission per frame.
+
+A hold is only collapsed when the output is deterministic: animations are
+not being skipped, no window is open, there is no ``stop_condition``, and
+neither the scene, the camera frame nor any mobject on screen has an
+updater. The frame still goes through ``emit_frame``, so progress
+reporting, sharding and crash journaling see it, as one frame.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import numpy as np
+from manimlib import Scene
+
+
+class StaticHoldScene(Scene):
+    """Mixin that renders a static ``wait()`` once and repeats the frame"""
+
+    def run(self):
+        self.hold_active = False
+        self.hold_repeats = None
+        self.held_frames = 0
+        super().run()
+        if self.held_frames:
+            print(f"Static holds: {self.held_frames} frames repeated, not rendered")
+
+    def has_active_updaters(self) -> bool:
+        """Whether anything could change between two frames of a wait"""
+        if getattr(self, "updaters", None):
+            return True
+        mobjects = [self.camera.frame, *self.mobjects]
+        return any(
+            member.get_updaters()
+            for mobject in mobjects
+            for member in mobject.get_family()
+        )
+
+    def is_static_hold(self, stop_condition) -> bool:
+        return (
+            stop_condition is None
+            and not self.skip_animations
+            and self.window is None
+            and not getattr(self, "presenter_mode", False)
+            and not self.has_active_updaters()
+        )
+
+    def wait(self, *args, **kwargs):
+        stop_condition = args[1] if len(args) > 1 else kwargs.get("stop_condition")
+        if not self.is_static_hold(stop_condition):
+            return super().wait(*args, **kwargs)
+        self.hold_active = True
+        try:
+            return super().wait(*args, **kwargs)
+        finally:
+            self.hold_active = False
+            self.hold_repeats = None
+
+    def get_wait_time_progression(self, *args, **kwargs):
+        times = super().get_wait_time_progression(*args, **kwargs)
+        if not self.hold_active or not isinstance(times, np.ndarray) or not len(times):
+            return times
+        # One step to the end of the hold, written once per frame it replaces
+        self.hold_repeats = len(times)
+        return times[-1:]
+
+    def emit_frame(self):
+        repeats, self.hold_repeats = self.hold_repeats, None
+        if repeats is None:
+            return super().emit_frame()
+        if not self.skip_animations:
+            self.held_frames += repeats - 1
+        self.frame_repeats = repeats
+        try:
+            super().emit_frame()
+        finally:
+            self.frame_repeats = 1
@@ -0,0 +1,179 @@
+"""
+Render Journal
+
+Makes long renders resumable after a crash. ``JournalScene`` splits the
+movie a scene writes into partial files, one per finished ``play()`` or
+``wait()`` call, and appends each to a journal as soon as it is closed. The
+journal lives next to the output:
+
+    <output_dir>/journal/<name>/journal.jsonl
+    <output_dir>/journal/<name>/partial_00042.mp4
+
+When the same job runs again with the same ``journal_key`` (source and
+render settings unchanged), the scene replays every journaled animation with
+``skip_animations`` enabled, which rebuilds the exact mobject, camera and RNG
+state without rasterizing, and starts writing at the first incomplete
+animation. Once the scene finishes, the partial files are stitched into the
+final movie with stream copy and the journal is removed.
+
+Partial files are opened lazily on the first written frame, so animations
+skipped for other reasons (for example by ``SectionScene``) produce none.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import json
+import os
+import shutil
+from typing import Dict, List
+
+from manimlib import Scene
+
+from stitch import concat_clips
+
+
+class RenderJournal:
+    """Append-only record of finished partial movie files for one output"""
+
+    def __init__(self, final_path: str, key: str):
+        stem = os.path.splitext(os.path.basename(final_path))[0]
+        self.directory = os.path.join(os.path.dirname(final_path), "journal", stem)
+        self.path = os.path.join(self.directory, "journal.jsonl")
+        self.final_path = final_path
+        self.key = key
+        self.entries = self.load()
+
+    def load(self) -> List[Dict]:
+        """Read usable entries, discarding a journal from other source"""
+        try:
+            with open(self.path, encoding="utf-8") as journal:
+                lines = [json.loads(line) for line in journal if line.strip()]
+        except (FileNotFoundError, json.JSONDecodeError):
+            lines = []
+
+        if not lines or lines[0].get("key") != self.key:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            os.makedirs(self.directory, exist_ok=True)
+            self.append({"key": self.key})
+            return []
+
+        entries = []
+        for entry in lines[1:]:
+            if not os.path.exists(self.partial_path(entry["partial"])):
+                break
+            entries.append(entry)
+        return entries
+
+    def append(self, entry: Dict):
+        """Durably add one line to the journal"""
+        with open(self.path, "a", encoding="utf-8") as journal:
+            journal.write(json.dumps(entry) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def partial_path(self, name: str) -> str:
+        """Path of a partial movie file inside the journal directory"""
+        return os.path.join(self.directory, name)
+
+    def next_partial(self) -> str:
+        """Name for the next partial movie file"""
+        return f"partial_{len(self.entries):05d}.mp4"
+
+    def record(self, name: str, plays: int):
+        """Record a closed partial that covers the scene up to ``plays``"""
+        entry = {"partial": name, "plays": plays}
+        self.append(entry)
+        self.entries.append(entry)
+
+    @property
+    def completed_plays(self) -> int:
+        """Number of play()/wait() calls already covered by partials"""
+        return self.entries[-1]["plays"] if self.entries else 0
+
+    def assemble(self):
+        """Stitch all partials into the final movie and drop the journal"""
+        partials = [self.partial_path(entry["partial"]) for entry in self.entries]
+        if len(partials) == 1:
+            os.replace(partials[0], self.final_path)
+        elif partials:
+            concat_clips(partials, self.final_path)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class JournalScene(Scene):
+    """Mixin that writes one journaled partial file per animation"""
+
+    # Identity of the render; a journal written under another key is ignored
+    journal_key = ""
+
+    def run(self):
+        writer = self.file_writer
+        if getattr(writer, "write_to_movie", False):
+            self.install_journal(writer)
+        super().run()
+
+    def install_journal(self, writer):
+        """Route the file writer's movie pipe through journaled partials"""
+        open_pipe = writer.open_movie_pipe
+        close_pipe = writer.close_movie_pipe
+        write_frame = writer.write_frame
+        finish = writer.finish
+        state = {"open": None, "finishing": False}
+
+        def open_movie_pipe(file_path):
+            # Called once by begin(); defer to the first written frame
+            self.journal = RenderJournal(file_path, self.journal_key)
+
+        def ensure_open():
+            if state["open"] is None:
+                state["open"] = self.journal.next_partial()
+                open_pipe(self.journal.partial_path(state["open"]))
+
+        def write_journaled_frame(camera):
+            ensure_open()
+            write_frame(camera)
+
+        def close_partial():
+            if state["open"] is not None:
+                close_pipe()
+                self.journal.record(state["open"], self.num_plays)
+                state["open"] = None
+
+        def close_movie_pipe():
+            close_partial()
+            if state["finishing"]:
+                self.journal.assemble()
+
+        def finish_journaled():
+            state["finishing"] = True
+            finish()
+
+        writer.open_movie_pipe = open_movie_pipe
+        writer.write_frame = write_journaled_frame
+        writer.close_movie_pipe = close_movie_pipe
+        writer.finish = finish_journaled
+        self.close_partial = close_partial
+
+    def journaled(self, method, *args, **kwargs):
+        """Run play()/wait(), replaying it if the journal already covers it"""
+        journal = getattr(self, "journal", None)
+        replaying = journal is not None and self.num_plays < journal.completed_plays
+        if not replaying:
+            result = method(*args, **kwargs)
+            if journal is not None:
+                # Only a finished animation becomes a journaled partial
+                self.close_partial()
+            return result
+
+        skipping = self.skip_animations
+        self.skip_animations = True
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.skip_animations = skipping
+
+    def play(self, *args, **kwargs):
+        return self.journaled(super().play, *args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        return self.journaled(super().wait, *args, **kwargs)
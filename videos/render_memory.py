@@ -0,0 +1,183 @@
+"""
+Render Memory Admission
+
+Keeps concurrent renders inside a memory budget. Scenes that keep hundreds
+of ``Text`` mobjects alive (module 8 and module 10 in particular) peak at
+several gigabytes each, so starting one job per core can exhaust memory and
+let the kernel's OOM killer pick a victim.
+
+Every job's peak resident set size is recorded in the render history. The
+render pools ask ``MemoryAdmission`` before starting a job: it is admitted
+only while the predicted peaks of running jobs plus its own stay under the
+budget and the system reports enough available memory for it. Otherwise it
+waits until a running job finishes. One job is always admitted when nothing
+is running, so a job larger than the budget still renders, alone.
+
+A job killed with SIGKILL despite this (the OOM killer) is retried once,
+predicted at the full budget so it runs by itself.
+"""
+
+import os
+import signal
+import sys
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from render_history import RenderHistory
+
+# Prediction for a job with no recorded peak when no job has one either
+DEFAULT_JOB_MEMORY = 2 * 1024**3
+
+# Share of physical memory renders may use unless a budget is given
+DEFAULT_BUDGET_FRACTION = 0.8
+
+# Seconds between re-checking available memory while jobs are held back
+BACKOFF_SECONDS = 5.0
+
+OOM_RETURNCODE = -signal.SIGKILL
+
+
+def physical_memory() -> Optional[int]:
+    """Total physical memory in bytes, if the platform reports it"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def available_memory() -> Optional[int]:
+    """Memory the kernel can hand out without swapping (Linux only)"""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def default_memory_budget() -> Optional[int]:
+    """Budget used when none is configured: most of physical memory"""
+    total = physical_memory()
+    return int(total * DEFAULT_BUDGET_FRACTION) if total else None
+
+
+def rusage_peak_rss(rusage) -> int:
+    """Peak RSS in bytes from a resource usage record"""
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss * scale
+
+
+def reset_process_peak_rss():
+    """Restart this process's peak RSS counter (Linux only)"""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def process_peak_rss() -> Optional[int]:
+    """Peak RSS of this process since the last reset (Linux only)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def format_bytes(size: float) -> str:
+    """Human readable size, e.g. 3.2G"""
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024:
+            return f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
+
+
+class MemoryAdmission:
+    """Admits jobs while their predicted peak memory fits the budget"""
+
+    def __init__(
+        self,
+        budget: Optional[int] = None,
+        history: Optional["RenderHistory"] = None,
+    ):
+        self.budget = budget or default_memory_budget()
+        self.history = history
+        self.running = {}
+        self.overrides = {}
+        self.condition = threading.Condition()
+
+    def predict(self, job: Dict) -> int:
+        """Predicted peak RSS of a job in bytes"""
+        if job["name"] in self.overrides:
+            return self.overrides[job["name"]]
+        if self.history is not None:
+            measured = self.history.peak_memory(job)
+            if measured:
+                return measured
+            # Unknown jobs are assumed as large as the largest known one
+            known = self.history.known_peak_memory()
+            if known:
+                return known
+        return DEFAULT_JOB_MEMORY
+
+    def fits(self, job: Dict) -> bool:
+        """Whether starting ``job`` now keeps memory within bounds"""
+        if not self.running or self.budget is None:
+            return True
+        predicted = self.predict(job)
+        if sum(self.running.values()) + predicted > self.budget:
+            return False
+        available = available_memory()
+        return available is None or predicted <= available
+
+    def next_job(self, queue: List[Dict]) -> Optional[Dict]:
+        """First queued job that fits, keeping the queue's order"""
+        with self.condition:
+            return next((job for job in queue if self.fits(job)), None)
+
+    def admit(self, job: Dict):
+        """Count a started job against the budget"""
+        with self.condition:
+            self.running[job["name"]] = self.predict(job)
+
+    def release(self, job: Dict):
+        """Return a finished job's memory to the budget"""
+        with self.condition:
+            self.running.pop(job["name"], None)
+            self.condition.notify_all()
+
+    def acquire(self, job: Dict):
+        """Block until ``job`` fits, then admit it (for threaded workers)"""
+        with self.condition:
+            while not self.fits(job):
+                self.condition.wait(BACKOFF_SECONDS)
+            self.running[job["name"]] = self.predict(job)
+
+    def retry_alone(self, job: Dict, result: Dict) -> bool:
+        """Whether an OOM-killed job should run again, by itself"""
+        if result["returncode"] != OOM_RETURNCODE or job["name"] in self.overrides:
+            return False
+        self.overrides[job["name"]] = self.budget or DEFAULT_JOB_MEMORY
+        print(
+            f"⚠️  {job['name']} was killed, likely out of memory"
+            f" (peak {format_bytes(result.get('peak_rss') or 0)});"
+            " retrying it alone"
+        )
+        return True
+
+    def describe_backoff(self, waiting: int) -> str:
+        """One-line note about jobs held back for memory"""
+        used = sum(self.running.values())
+        return (
+            f"⏳ Holding {waiting} jobs: {len(self.running)} running need"
+            f" ~{format_bytes(used)} of the {format_bytes(self.budget)} budget"
+        )
@@ -0,0 +1,120 @@
+"""
+Pipelined Frame Writing
+
+manimgl updates the scene, draws it, reads the pixels back and writes them
+to ffmpeg's stdin one frame after another, so the render sits idle whenever
+the pipe is full and x264 is still busy with earlier frames.
+``PipelineScene`` hands frames to a feeder process through a ``FrameRing``
+of shared-memory slots instead: while the feeder writes frame N to the
+encoder, the render process already updates, draws and reads back frame
+N+1.
+
+    render process:  update + draw -> readback into a free slot
+    feeder process:                   filled slot -> ffmpeg stdin
+
+The camera reads pixels straight into the slot with moderngl's
+``read_into``, so the hot path allocates nothing per frame. The ring is
+bounded: when the encoder falls behind, the render process waits for a
+free slot instead of buffering frames without bound. Drawing and readback
+stay in the render process, which owns the GL context.
+
+At the end of the render each stage's total time is printed, along with
+the time the render process spent waiting for the encoder; the same
+numbers are kept in ``pipeline_timings``.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import time
+from collections import Counter
+
+from manimlib import Scene
+
+from frame_ring import FrameRing, RingPipe
+
+
+class PipelineScene(Scene):
+    """Mixin that overlaps encoding with drawing the next frame"""
+
+    # Output frames each written frame stands for, set per frame by
+    # FrameRateScene in reduced frame rate sections
+    frame_repeats = 1
+
+    def run(self):
+        self.pipeline_timings = Counter()
+        self.frame_ring = None
+        self.install_pipeline(self.file_writer, self.camera)
+        started = time.perf_counter()
+        try:
+            super().run()
+        finally:
+            if self.frame_ring is not None:
+                self.pipeline_timings["encode"] = self.frame_ring.encode_time
+                self.pipeline_timings["stall"] = self.frame_ring.stall_time
+                self.frame_ring.close()
+        self.report_pipeline(time.perf_counter() - started)
+
+    def ring_for(self, camera) -> FrameRing:
+        """The scene's frame ring, sized for the camera's frames"""
+        if self.frame_ring is None:
+            width, height = camera.get_pixel_shape()
+            self.frame_ring = FrameRing(width * height * camera.n_channels)
+        return self.frame_ring
+
+    def install_pipeline(self, writer, camera):
+        """Read movie frames into ring slots and feed every pipe from the ring"""
+        timings = self.pipeline_timings
+        read = camera.get_raw_fbo_data
+        write_frame = writer.write_frame
+        state = {"writing": False}
+        # Older manimgl cameras read without a blit; their frames are copied in
+        in_place = hasattr(camera, "blit") and hasattr(camera, "draw_fbo")
+
+        def get_raw_fbo_data(*args, **kwargs):
+            if not (state["writing"] and in_place and not args and not kwargs):
+                started = time.perf_counter()
+                frame = read(*args, **kwargs)
+                timings["readback"] += time.perf_counter() - started
+                return frame
+            slot = self.frame_ring.acquire()
+            started = time.perf_counter()
+            camera.blit(camera.fbo, camera.draw_fbo)
+            camera.draw_fbo.read_into(
+                slot, viewport=camera.draw_fbo.viewport, components=camera.n_channels
+            )
+            timings["readback"] += time.perf_counter() - started
+            return slot
+
+        def write_pipelined_frame(camera):
+            # Crash journaling opens a new pipe per animation; wrap each one
+            process = getattr(writer, "writing_process", None)
+            if process is not None:
+                if not isinstance(process.stdin, RingPipe):
+                    process.stdin = RingPipe(self.ring_for(camera), process.stdin)
+                process.stdin.copies = self.frame_repeats
+            state["writing"] = process is not None
+            try:
+                write_frame(camera)
+            finally:
+                state["writing"] = False
+
+        camera.get_raw_fbo_data = get_raw_fbo_data
+        writer.write_frame = write_pipelined_frame
+
+    def update_frame(self, *args, **kwargs):
+        started = time.perf_counter()
+        result = super().update_frame(*args, **kwargs)
+        self.pipeline_timings["update"] += time.perf_counter() - started
+        return result
+
+    def report_pipeline(self, wall_time: float):
+        """Print the time spent in each stage"""
+        timings = self.pipeline_timings
+        if not timings["encode"]:
+            return
+        print(
+            f"Pipeline over {wall_time:.1f}s: update+draw {timings['update']:.1f}s,"
+            f" readback {timings['readback']:.1f}s,"
+            f" encoder writes {timings['encode']:.1f}s (in the feeder),"
+            f" waiting on encoder {timings['stall']:.1f}s"
+        )
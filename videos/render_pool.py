@@ -0,0 +1,263 @@
+"""
+Parallel Render Pool
+
+Runs manimgl render jobs concurrently on a pool of worker processes sized to
+the machine's cores. Each job renders one scene to its own file, and the pool
+reports per-job wall time, peak memory and exit status as jobs finish. Jobs
+are admitted against a memory budget by ``render_memory``.
+
+A job is a plain dict so it can cross process boundaries and be written to
+JSON unchanged:
+
+    {
+        "name": "module4",                         # unique job / output name
+        "file": "module4_core_python_concepts.py", # scene source file
+        "scene": "Module4CorePythonConcepts",      # Scene subclass to render
+        "quality": "high",                         # key of QUALITY_TIERS
+        "output_dir": "renders/high",              # where the clip is written
+    }
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from course_settings import DEFAULT_OUTPUT_DIR, QUALITY_TIERS, VIDEOS_DIR
+from render_memory import BACKOFF_SECONDS, MemoryAdmission, rusage_peak_rss
+
+if TYPE_CHECKING:
+    from render_history import RenderHistory
+
+
+# Environment variable telling a render process where to report progress
+PROGRESS_ENV = "COURSE_RENDER_PROGRESS"
+
+
+def default_worker_count() -> int:
+    """Number of worker processes to use when none is requested"""
+    return os.cpu_count() or 1
+
+
+def modules_dir(quality: str) -> str:
+    """Directory holding whole-module videos for a quality tier"""
+    return os.path.join(DEFAULT_OUTPUT_DIR, quality, "modules")
+
+
+def sections_dir(quality: str, scene: str) -> str:
+    """Directory holding a scene's section clips for a quality tier"""
+    return os.path.join(DEFAULT_OUTPUT_DIR, quality, "sections", scene)
+
+
+def job_output_path(job: Dict) -> str:
+    """Path of the video file a job writes"""
+    return os.path.join(job["output_dir"], f"{job['name']}.mp4")
+
+
+def job_log_path(job: Dict) -> str:
+    """Path of the log file capturing a job's manimgl output"""
+    return os.path.join(job["output_dir"], "logs", f"{job['name']}.log")
+
+
+def variant_path(path: str, quality: str, variant: str) -> str:
+    """Same render path under another quality tier's ``renders/<tier>``"""
+    parts = path.split(os.sep)
+    for index in range(len(parts) - 1, 0, -1):
+        if parts[index] == quality and parts[index - 1] == "renders":
+            parts[index] = variant
+            return os.sep.join(parts)
+    raise ValueError(f"{path} is not inside a renders/{quality} tree")
+
+
+def variant_jobs(job: Dict) -> List[Dict]:
+    """Views of a job's extra quality tiers, each shaped like a job
+
+    A job with ``variants`` (tier name -> cache key) writes a scaled copy of
+    its clip for each tier in the same pass; the views let the cache and the
+    build treat those copies like clips rendered at that tier.
+    """
+    return [
+        dict(
+            job,
+            quality=variant,
+            output_dir=variant_path(job["output_dir"], job["quality"], variant),
+            cache_key=key,
+            variants={},
+        )
+        for variant, key in job.get("variants", {}).items()
+    ]
+
+
+def job_progress_path(job: Dict) -> str:
+    """Path of the JSON file a running job reports its progress to"""
+    return os.path.join(job["output_dir"], "progress", f"{job['name']}.json")
+
+
+def read_progress(job: Dict) -> Dict:
+    """Last progress reported by a job, or an empty dict"""
+    try:
+        with open(job_progress_path(job), encoding="utf-8") as progress:
+            return json.load(progress)
+    except (OSError, ValueError):
+        return {}
+
+
+def build_render_command(job: Dict) -> List[str]:
+    """Build the manimgl command line for a render job"""
+    tier = QUALITY_TIERS[job["quality"]]
+    return [
+        sys.executable,
+        "-m",
+        "manimlib",
+        job["file"],
+        job["scene"],
+        "-w",
+        "-r",
+        tier["resolution"],
+        "--fps",
+        str(tier["fps"]),
+        "--video_dir",
+        job["output_dir"],
+        "--file_name",
+        job["name"],
+    ]
+
+
+def spawn_render(job: Dict, log) -> subprocess.Popen:
+    """Start a job's manimgl process, writing its output to ``log``"""
+    os.makedirs(os.path.dirname(job_progress_path(job)), exist_ok=True)
+    return subprocess.Popen(
+        build_render_command(job),
+        cwd=VIDEOS_DIR,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        env=dict(os.environ, **{PROGRESS_ENV: job_progress_path(job)}),
+    )
+
+
+def run_render_job(job: Dict) -> Dict:
+    """Render a single job and return its result (runs inside a worker)"""
+    os.makedirs(os.path.dirname(job_log_path(job)), exist_ok=True)
+
+    start = time.perf_counter()
+    peak_rss = None
+    with open(job_log_path(job), "w") as log:
+        try:
+            process = spawn_render(job, log)
+            if hasattr(os, "wait4"):
+                # wait4 reports the peak RSS of this child alone
+                _, status, usage = os.wait4(process.pid, 0)
+                returncode = os.waitstatus_to_exitcode(status)
+                process.returncode = returncode
+                peak_rss = rusage_peak_rss(usage)
+            else:
+                returncode = process.wait()
+        except OSError as error:
+            log.write(f"Failed to start render: {error}\n")
+            returncode = -1
+    wall_time = time.perf_counter() - start
+    frames = read_progress(job).get("frames")
+    return job_result(job, returncode, wall_time, peak_rss=peak_rss, frames=frames)
+
+
+def job_result(job: Dict, returncode: int, wall_time: float, **extra) -> Dict:
+    """Build the result dict reported for a finished job"""
+    result = {
+        "name": job["name"],
+        "returncode": returncode,
+        "ok": returncode == 0,
+        "wall_time": wall_time,
+        "output": job_output_path(job),
+        "log": job_log_path(job),
+    }
+    result.update(extra)
+    return result
+
+
+def render_jobs(
+    jobs: List[Dict],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    history: Optional["RenderHistory"] = None,
+    memory_budget: Optional[int] = None,
+) -> List[Dict]:
+    """Render jobs concurrently and return results in completion order
+
+    With a render history, jobs are submitted longest-predicted first and
+    every result is recorded. Jobs only start while their predicted peak
+    memory fits ``memory_budget`` (default: most of physical memory).
+    """
+    if not jobs:
+        return []
+    if history is not None:
+        jobs = history.order(jobs)
+
+    workers = min(workers or default_worker_count(), len(jobs))
+    admission = MemoryAdmission(memory_budget, history)
+    queue = list(jobs)
+    running = {}
+    results = []
+    held = False
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while queue or running:
+            while queue and len(running) < workers:
+                job = admission.next_job(queue)
+                if job is None:
+                    if not held:
+                        print(admission.describe_backoff(len(queue)))
+                        held = True
+                    break
+                queue.remove(job)
+                admission.admit(job)
+                running[pool.submit(run_render_job, job)] = job
+
+            # Wake up periodically to re-check memory for held-back jobs
+            done, _ = wait(
+                running, timeout=BACKOFF_SECONDS, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                job = running.pop(future)
+                admission.release(job)
+                try:
+                    result = future.result()
+                except Exception as error:
+                    # A crashed worker must not take down the whole batch
+                    result = job_result(job, -1, 0.0, error=str(error))
+                if history is not None:
+                    history.record(job, result)
+                if admission.retry_alone(job, result):
+                    queue.insert(0, job)
+                    continue
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    if history is not None:
+        history.save()
+    return results
+
+
+def print_render_summary(results: List[Dict], elapsed: float):
+    """Print per-job wall time and exit status plus the parallel speedup"""
+    print("=" * 60)
+    for result in sorted(results, key=lambda r: r["name"]):
+        status = "✅" if result["ok"] else "❌"
+        print(
+            f"{status} {result['name']:<48} {result['wall_time']:8.1f}s"
+            f"  exit {result['returncode']}"
+        )
+    print("=" * 60)
+
+    busy = sum(result["wall_time"] for result in results)
+    failed = [result for result in results if not result["ok"]]
+    print(f"Wall time: {elapsed:.1f}s  Job time: {busy:.1f}s", end="")
+    if elapsed > 0:
+        print(f"  Speedup: {busy / elapsed:.2f}x")
+    else:
+        print()
+    if failed:
+        print(f"❌ {len(failed)} of {len(results)} jobs failed; see logs:")
+        for result in failed:
+            print(f"   {result['log']}")
@@ -0,0 +1,91 @@
+"""
+Render Progress Reporting
+
+``ProgressScene`` is mixed into every generated scene and reports how far a
+render has got to the JSON file named by the ``COURSE_RENDER_PROGRESS``
+environment variable:
+
+    {"section": "bits_to_bytes", "frames": 1800, "elapsed": 42.0,
+     "fps": 42.9, "plays": 37, "done": false}
+
+Writes are rate-limited and atomic, so a reader such as ``progress_view``
+always sees a whole file and reporting costs the render next to nothing.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import functools
+import os
+import time
+
+from manimlib import Scene
+
+from course_settings import atomic_write_json
+from render_pool import PROGRESS_ENV
+
+# Minimum seconds between two progress writes
+REPORT_INTERVAL = 0.5
+
+
+class ProgressScene(Scene):
+    """Mixin that reports the current section and written frames"""
+
+    # Section method names of the course scene, set by generated scenes
+    progress_sections = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.progress_sections:
+            setattr(cls, name, cls._track_section(name, getattr(cls, name)))
+
+    @staticmethod
+    def _track_section(name, method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.progress_section = name
+            self.report_progress(force=True)
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    def run(self):
+        self.progress_path = os.environ.get(PROGRESS_ENV)
+        self.progress_section = None
+        self.progress_frames = 0
+        self.progress_started = time.perf_counter()
+        self.progress_reported = 0.0
+        try:
+            super().run()
+        finally:
+            self.report_progress(force=True, done=True)
+
+    def emit_frame(self):
+        written = not self.skip_animations
+        super().emit_frame()
+        if written:
+            self.progress_frames += 1
+            self.report_progress()
+
+    def report_progress(self, force: bool = False, done: bool = False):
+        """Write the progress file, at most every ``REPORT_INTERVAL`` seconds"""
+        path = getattr(self, "progress_path", None)
+        if not path:
+            return
+        now = time.perf_counter()
+        if not force and now - self.progress_reported < REPORT_INTERVAL:
+            return
+        self.progress_reported = now
+        elapsed = now - self.progress_started
+        progress = {
+            "section": self.progress_section,
+            "frames": self.progress_frames,
+            "elapsed": elapsed,
+            "fps": self.progress_frames / elapsed if elapsed > 0 else 0.0,
+            "plays": self.num_plays,
+            "done": done,
+        }
+        # Progress is only displayed; a report that cannot be written is skipped
+        try:
+            atomic_write_json(path, progress)
+        except OSError:
+            pass
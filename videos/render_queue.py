@@ -0,0 +1,494 @@
+"""
+Shared Render Queue
+
+A job queue kept in a plain directory, so several render machines that share
+storage (NFS, SMB, or just a local directory on one box) can drain one course
+build without a cluster scheduler. Every state change is a single atomic
+``rename`` within the queue directory:
+
+    <queue>/pending/<entry>.json    published, waiting for a worker
+    <queue>/running/<entry>.json    claimed; its mtime is the lease heartbeat
+    <queue>/done/<entry>.json       result reported by the worker
+    <queue>/renders/...             clips and logs written by workers
+
+A worker claims an entry by renaming it from ``pending`` to ``running``; only
+one rename can win. While it renders, a heartbeat thread touches the running
+file. Any process that sees a running entry whose mtime is older than the
+lease moves it back to ``pending`` for another worker, until the entry runs
+out of attempts. Lease ages are measured against the mtime of a file touched
+in the queue itself, so render boxes with skewed clocks agree on them.
+
+Entries carry the generated scene file along with the job, so workers only
+need the same checkout of the course source; a worker refuses jobs whose
+source differs from its own copy. ``render_jobs_queued`` has the same
+contract as ``render_pool.render_jobs``: it publishes jobs, drains the queue
+with local workers alongside any remote ones, and copies finished clips back
+into each job's output directory.
+"""
+
+import functools
+import json
+import os
+import shutil
+import socket
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from course_settings import (
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_QUEUE_DIR,
+    atomic_write,
+    atomic_write_json,
+    source_digest,
+)
+from render_history import RenderHistory
+from render_memory import MemoryAdmission
+from render_pool import (
+    default_worker_count,
+    job_log_path,
+    job_output_path,
+    job_result,
+    render_jobs,
+    run_render_job,
+    variant_jobs,
+    variant_path,
+)
+from render_workers import render_jobs_warm
+from section_render import JOBS_DIR
+
+
+LEASE_SECONDS = 120.0
+POLL_SECONDS = 2.0
+MAX_ATTEMPTS = 3
+
+
+def write_json(path: str, data: Dict):
+    """Replace a queue file, synced first since other machines read it"""
+    atomic_write_json(path, data, sync=True, indent=2)
+
+
+def read_json(path: str) -> Optional[Dict]:
+    """Read a queue file, or None if another process moved it away"""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class RenderQueue:
+    """Directory-based job queue with leases, heartbeats and retries"""
+
+    def __init__(
+        self,
+        root: str = DEFAULT_QUEUE_DIR,
+        lease: float = LEASE_SECONDS,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        self.root = os.path.abspath(root)
+        self.lease = lease
+        self.max_attempts = max_attempts
+        for state in ("pending", "running", "done", "renders"):
+            os.makedirs(os.path.join(self.root, state), exist_ok=True)
+
+    def path(self, state: str, entry: str) -> str:
+        """Path of an entry's file in one queue state"""
+        return os.path.join(self.root, state, f"{entry}.json")
+
+    def entries(self, state: str) -> List[str]:
+        """Entries currently in one queue state"""
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(os.path.join(self.root, state))
+            if name.endswith(".json")
+        )
+
+    def now(self) -> float:
+        """Current time on the queue's storage, for comparing mtimes"""
+        clock = os.path.join(self.root, ".clock")
+        with open(clock, "a"):
+            pass
+        os.utime(clock)
+        return os.stat(clock).st_mtime
+
+    @staticmethod
+    def entry_name(job: Dict) -> str:
+        """Queue entry of a job; names repeat across quality tiers"""
+        return f"{job['quality']}--{job['name']}"
+
+    def publish(self, jobs: List[Dict]) -> List[str]:
+        """Add jobs to the queue and return their entry names
+
+        A job that is already pending or running with the same cache key and
+        source is left alone, so several launchers publishing the same build
+        share one render. An entry queued for an older version of the job is
+        replaced; if it is running, its worker's result will be discarded.
+        """
+        names = []
+        for job in jobs:
+            name = self.entry_name(job)
+            names.append(name)
+            portable = self.portable(job)
+            if self.queued(name, portable):
+                continue
+            entry = {
+                "job": portable,
+                "attempts": 0,
+                "published": time.time(),
+            }
+            with open(job["file"], encoding="utf-8") as shim:
+                entry["shim"] = shim.read()
+            for state in ("done", "running"):
+                try:
+                    os.remove(self.path(state, name))
+                except FileNotFoundError:
+                    pass
+            write_json(self.path("pending", name), entry)
+        return names
+
+    def queued(self, name: str, job: Dict) -> bool:
+        """Whether an entry is pending or running for this version of a job"""
+        for state in ("pending", "running"):
+            entry = read_json(self.path(state, name))
+            if entry is not None:
+                return all(
+                    entry["job"].get(field) == job.get(field)
+                    for field in ("cache_key", "source_digest")
+                )
+        return False
+
+    def portable(self, job: Dict) -> Dict:
+        """Job with paths relative to the render tree and source hash"""
+        portable = dict(job)
+        portable["file"] = os.path.basename(job["file"])
+        portable["output_dir"] = os.path.relpath(
+            job["output_dir"], DEFAULT_OUTPUT_DIR
+        )
+        source = job.get("source", job["file"])
+        portable["source_digest"] = source_digest(source)
+        portable["source"] = source
+        return portable
+
+    def local_job(self, entry: Dict) -> Dict:
+        """Job for this machine: shim in JOBS_DIR, output on shared storage"""
+        job = dict(entry["job"])
+        job["file"] = os.path.join(JOBS_DIR, job["file"])
+        atomic_write(job["file"], entry["shim"])
+        job["output_dir"] = os.path.normpath(
+            os.path.join(self.root, "renders", job["output_dir"])
+        )
+        return job
+
+    def pending_in_order(self) -> List[str]:
+        """Pending entries, oldest first (publish order, retries last)"""
+        stamped = []
+        for name in self.entries("pending"):
+            try:
+                stamped.append((os.stat(self.path("pending", name)).st_mtime, name))
+            except FileNotFoundError:
+                continue
+        return [name for _, name in sorted(stamped)]
+
+    def claim(self, worker: str) -> Optional[str]:
+        """Atomically take one pending entry, or None if there are none"""
+        for name in self.pending_in_order():
+            try:
+                # The rename keeps the mtime, which is the lease: renew it
+                # first, or a reaper could take an entry that waited long
+                os.utime(self.path("pending", name))
+                os.rename(self.path("pending", name), self.path("running", name))
+            except FileNotFoundError:
+                continue  # another worker won this entry
+            entry = read_json(self.path("running", name))
+            if entry is None:
+                continue
+            entry["worker"] = worker
+            entry["attempts"] += 1
+            write_json(self.path("running", name), entry)
+            return name
+        return None
+
+    def owns(self, name: str, worker: str) -> bool:
+        """Whether ``worker`` still holds the lease on a running entry"""
+        entry = read_json(self.path("running", name))
+        return entry is not None and entry.get("worker") == worker
+
+    def heartbeat(self, name: str, worker: str) -> bool:
+        """Renew ``worker``'s lease on an entry; False if it was taken away
+
+        A reaped entry may already be running again under another worker,
+        whose lease this worker must not keep alive.
+        """
+        if not self.owns(name, worker):
+            return False
+        try:
+            os.utime(self.path("running", name))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, name: str, worker: str, result: Dict) -> bool:
+        """Report ``worker``'s result; False if its lease had already expired
+
+        Once a lease expires the entry is reaped and may be claimed by
+        another worker, so only the worker named in the entry may report.
+        """
+        entry = read_json(self.path("running", name))
+        if entry is None or entry.get("worker") != worker:
+            return False
+        write_json(self.path("done", name), dict(result, attempts=entry["attempts"]))
+        try:
+            os.remove(self.path("running", name))
+        except FileNotFoundError:
+            pass
+        return True
+
+    def reap(self) -> List[str]:
+        """Return entries with expired leases to pending (or fail them)"""
+        now = self.now()
+        reaped = []
+        for name in self.entries("running"):
+            path = self.path("running", name)
+            try:
+                if now - os.stat(path).st_mtime < self.lease:
+                    continue
+                # Renaming to a private name makes exactly one reaper win
+                private = f"{path}.reap.{socket.gethostname()}.{os.getpid()}"
+                os.rename(path, private)
+            except FileNotFoundError:
+                continue
+            entry = read_json(private)
+            if entry is None:
+                os.remove(private)
+                continue
+            if entry["attempts"] >= self.max_attempts:
+                job = entry["job"]
+                result = job_result(
+                    job,
+                    -1,
+                    0.0,
+                    error=f"lease expired {entry['attempts']} times",
+                )
+                write_json(self.path("done", name), result)
+            else:
+                entry.pop("worker", None)
+                write_json(self.path("pending", name), entry)
+            os.remove(private)
+            reaped.append(name)
+        return reaped
+
+    def idle(self) -> bool:
+        """Whether nothing is pending or running"""
+        return not self.entries("pending") and not self.entries("running")
+
+    def result(self, name: str) -> Optional[Dict]:
+        """Reported result of an entry, if it is done"""
+        return read_json(self.path("done", name))
+
+
+def run_claimed(
+    queue: RenderQueue,
+    name: str,
+    worker: str,
+    renderer: Callable[[Dict], Dict],
+    admission: Optional[MemoryAdmission] = None,
+):
+    """Render one claimed entry while a thread keeps its lease alive
+
+    With ``admission``, the render waits (lease still held) until the job
+    fits this machine's memory budget.
+    """
+    entry = read_json(queue.path("running", name))
+    if entry is None:
+        return
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(queue.lease / 4) and queue.heartbeat(name, worker):
+            pass
+
+    heartbeat = threading.Thread(target=beat, daemon=True)
+    heartbeat.start()
+    try:
+        job = queue.local_job(entry)
+        if source_digest(job["source"]) != job["source_digest"]:
+            result = job_result(
+                job, -1, 0.0, error=f"{job['source']} differs from the publisher's"
+            )
+        elif admission is None:
+            result = renderer(job)
+        else:
+            while True:
+                admission.acquire(job)
+                try:
+                    result = renderer(job)
+                finally:
+                    admission.release(job)
+                if not admission.retry_alone(job, result):
+                    break
+    except Exception as error:
+        result = job_result(entry["job"], -1, 0.0, error=str(error))
+    finally:
+        stop.set()
+        heartbeat.join()
+    if not queue.complete(name, worker, result):
+        print(f"⚠️  {name}: lease expired before it finished; result discarded")
+
+
+def work(
+    queue: RenderQueue,
+    worker: Optional[str] = None,
+    follow: bool = False,
+    renderer: Callable[[Dict], Dict] = run_render_job,
+    stop: Optional[threading.Event] = None,
+    admission: Optional[MemoryAdmission] = None,
+) -> int:
+    """Drain the queue on this machine and return the number of jobs run
+
+    Without ``follow`` the worker exits once nothing is pending or running;
+    with it, the worker keeps polling for new jobs until interrupted. Worker
+    threads sharing one ``admission`` stay within its memory budget.
+    """
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    completed = 0
+    while stop is None or not stop.is_set():
+        queue.reap()
+        name = queue.claim(worker)
+        if name is None:
+            if queue.idle() and not follow:
+                break
+            time.sleep(POLL_SECONDS)
+            continue
+        print(f"🎬 {worker} rendering {name}")
+        run_claimed(queue, name, worker, renderer, admission)
+        completed += 1
+    return completed
+
+
+def drain(
+    queue: RenderQueue,
+    workers: Optional[int] = None,
+    follow: bool = False,
+    memory_budget: Optional[int] = None,
+) -> int:
+    """Run ``workers`` worker threads on this machine until the queue drains"""
+    admission = MemoryAdmission(memory_budget, RenderHistory())
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    counts = []
+
+    def run(index: int):
+        counts.append(
+            work(queue, f"{host}:{index}", follow=follow, admission=admission)
+        )
+
+    threads = [
+        threading.Thread(target=run, args=(index,), daemon=True)
+        for index in range(workers or default_worker_count())
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        # Joining with a timeout keeps the main thread responsive to Ctrl+C
+        while thread.is_alive():
+            thread.join(timeout=1.0)
+    return sum(counts)
+
+
+def collect(job: Dict, result: Dict) -> Dict:
+    """Copy a worker's clips and log from shared storage into the job's tree"""
+    copies = [
+        (result.get("output"), job_output_path(job)),
+        (result.get("log"), job_log_path(job)),
+    ]
+    if result.get("output"):
+        for view in variant_jobs(job):
+            shared = variant_path(result["output"], job["quality"], view["quality"])
+            copies.append((shared, job_output_path(view)))
+    for shared, local in copies:
+        if (
+            shared
+            and os.path.exists(shared)
+            and os.path.abspath(shared) != os.path.abspath(local)
+        ):
+            os.makedirs(os.path.dirname(local), exist_ok=True)
+            shutil.copyfile(shared, local)
+    return dict(result, name=job["name"], output=copies[0][1], log=copies[1][1])
+
+
+def render_jobs_queued(
+    jobs: List[Dict],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    history: Optional["RenderHistory"] = None,
+    queue: Optional[RenderQueue] = None,
+    memory_budget: Optional[int] = None,
+) -> List[Dict]:
+    """Render jobs through a shared queue; same contract as ``render_jobs``
+
+    ``workers`` local worker threads drain the queue next to any workers on
+    other machines; with 0, this process only publishes and waits.
+    """
+    if not jobs:
+        return []
+    if history is not None:
+        jobs = history.order(jobs)
+    queue = queue or RenderQueue()
+    waiting = dict(zip(queue.publish(jobs), jobs))
+    print(f"📬 Published {len(waiting)} jobs to {queue.root}")
+
+    stop = threading.Event()
+    admission = MemoryAdmission(memory_budget, history)
+    local_workers = min(
+        default_worker_count() if workers is None else workers, len(jobs)
+    )
+    threads = [
+        threading.Thread(
+            target=work,
+            args=(queue, f"{socket.gethostname()}:{os.getpid()}:{index}"),
+            kwargs={"follow": True, "stop": stop, "admission": admission},
+            daemon=True,
+        )
+        for index in range(local_workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    results = []
+    try:
+        while waiting:
+            queue.reap()
+            for name in list(waiting):
+                reported = queue.result(name)
+                if reported is None:
+                    continue
+                job = waiting.pop(name)
+                result = collect(job, reported)
+                results.append(result)
+                if history is not None:
+                    history.record(job, result)
+                if on_result:
+                    on_result(result)
+            if waiting:
+                time.sleep(POLL_SECONDS)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        if history is not None:
+            history.save()
+    return results
+
+
+def select_renderer(
+    warm: bool = False,
+    queue: Optional[str] = None,
+    memory_budget: Optional[int] = None,
+) -> Callable:
+    """Pick the batch renderer for the launcher's render options"""
+    if queue is not None:
+        return functools.partial(
+            render_jobs_queued, queue=RenderQueue(queue), memory_budget=memory_budget
+        )
+    renderer = render_jobs_warm if warm else render_jobs
+    return functools.partial(renderer, memory_budget=memory_budget)
@@ -0,0 +1,106 @@
+"""
+Reduced Frame Rate Rendering
+
+``FrameRateScene`` renders the segments listed in ``section_frame_rates``
+(see ``section_rates``) at a lower frame rate without changing the clip's
+frame rate. Inside such a segment, each animation's time progression keeps
+only every ``step``-th of the tier's frame times, plus the last one, and
+every rendered frame is sent to the encoder once for each output frame it
+stands for. An animation therefore still produces exactly as many output
+frames as at the full rate, and every rendered frame shows the scene at
+the same instant as the full rate render would, so clip lengths, sections
+and the stitched course are unchanged.
+
+The repeats are written by the frame ring's feeder; the render process
+draws and reads back each frame once. A window, or animations being
+skipped, always run at the full rate.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import functools
+from collections import Counter
+
+import numpy as np
+from manimlib import Scene
+
+from scene_index import EPILOGUE, PROLOGUE
+from section_rates import frame_step
+
+
+class FrameRateScene(Scene):
+    """Mixin that renders slide sections at a lower frame rate"""
+
+    # Frame rate per segment, set by generated scenes
+    section_frame_rates = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Sections are the ones ProgressScene tracks
+        sections = getattr(cls, "progress_sections", [])
+        for name in sections:
+            last = name == sections[-1]
+            setattr(cls, name, cls._rate_section(name, last, getattr(cls, name)))
+
+    @staticmethod
+    def _rate_section(name, last, method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.rate_segment = name
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                if last:
+                    self.rate_segment = EPILOGUE
+
+        return wrapper
+
+    def run(self):
+        self.rate_segment = PROLOGUE
+        self.frame_copies = iter(())
+        self.rate_rendered = Counter()
+        self.rate_written = Counter()
+        super().run()
+        self.report_frame_rates()
+
+    def current_frame_step(self) -> int:
+        # StaticHoldScene already writes a whole static hold as one frame
+        if self.window is not None or getattr(self, "hold_active", False):
+            return 1
+        rate = self.section_frame_rates.get(self.rate_segment)
+        return frame_step(self.camera.fps, rate)
+
+    def get_time_progression(self, run_time, *args, **kwargs):
+        times = super().get_time_progression(run_time, *args, **kwargs)
+        step = self.current_frame_step()
+        self.frame_copies = iter(())
+        if step == 1 or not isinstance(times, np.ndarray) or not len(times):
+            return times
+        kept = list(range(step - 1, len(times), step))
+        if not kept or kept[-1] != len(times) - 1:
+            kept.append(len(times) - 1)
+        self.frame_copies = iter(
+            [index - previous for previous, index in zip([-1] + kept, kept)]
+        )
+        return times[kept]
+
+    def emit_frame(self):
+        copies = next(self.frame_copies, None)
+        if copies is None:
+            return super().emit_frame()
+        self.rate_rendered[self.rate_segment] += 1
+        self.rate_written[self.rate_segment] += copies
+        self.frame_repeats = copies
+        try:
+            super().emit_frame()
+        finally:
+            self.frame_repeats = 1
+
+    def report_frame_rates(self):
+        """Print how many frames each reduced rate segment rendered"""
+        for segment, written in self.rate_written.items():
+            rendered = self.rate_rendered[segment]
+            print(
+                f"Reduced frame rate: {segment} rendered {rendered} frames"
+                f" for {written}"
+            )
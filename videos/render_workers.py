@@ -0,0 +1,287 @@
+"""
+Warm Render Workers
+
+A pool of long-lived render processes that pay manimgl's startup cost once
+instead of once per job. Each worker imports manimlib, creates a headless
+OpenGL context and discovers fonts as soon as it starts, then receives jobs
+over a pipe and renders them in-process:
+
+- every scene the worker renders shares its single standalone context, so
+  shader programs compiled for one job are reused by the next;
+- course modules are dropped from ``sys.modules`` before each job so a
+  worker always renders the current source;
+- a worker that dies mid-job (OOM, segfault) is reported as a failed job
+  and replaced, so the rest of the batch carries on;
+- jobs are only sent to idle workers while they fit the memory budget of
+  ``render_memory``, and an OOM-killed job is retried alone.
+
+``render_jobs_warm`` has the same contract as ``render_pool.render_jobs``.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from contextlib import contextmanager
+from multiprocessing.connection import wait
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from course_settings import VIDEOS_DIR
+from render_memory import (
+    BACKOFF_SECONDS,
+    OOM_RETURNCODE,
+    MemoryAdmission,
+    process_peak_rss,
+    reset_process_peak_rss,
+)
+from render_pool import (
+    PROGRESS_ENV,
+    build_render_command,
+    default_worker_count,
+    job_log_path,
+    job_progress_path,
+    job_result,
+    read_progress,
+)
+
+if TYPE_CHECKING:
+    from render_history import RenderHistory
+
+
+def warm_up():
+    """Import manimlib and create the shared headless context (in a worker)"""
+    import manimlib  # noqa: F401  (the import itself is the expensive part)
+    import moderngl
+
+    context = moderngl.create_standalone_context()
+    moderngl.create_standalone_context = lambda *args, **kwargs: context
+
+    try:
+        import manimpango
+
+        manimpango.list_fonts()
+    except ImportError:
+        pass
+
+
+def purge_course_modules():
+    """Forget course modules imported by a previous job"""
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if os.path.abspath(path).startswith(VIDEOS_DIR + os.sep):
+            del sys.modules[name]
+
+
+def run_manimgl(argv: List[str]):
+    """Run manimgl's command line entry point inside this process"""
+    import manimlib.config as config
+    import manimlib.extract_scene as extract_scene
+
+    sys.argv = ["manimgl"] + argv
+    if hasattr(config, "initialize_manim_config"):
+        # manimgl >= 1.7 reads sys.argv into a global config at import time
+        from manimlib.__main__ import run_scenes
+
+        config.manim_config.clear()
+        config.manim_config.update(config.initialize_manim_config())
+        run_scenes()
+    else:
+        args = config.parse_cli()
+        for scene in extract_scene.main(config.get_configuration(args)):
+            scene.run()
+
+
+@contextmanager
+def redirected_output(path: str):
+    """Send this process's stdout and stderr to a log file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    with open(path, "w") as log:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+
+
+def render_in_process(job: Dict) -> Dict:
+    """Render one job in the current (warm) process"""
+    argv = build_render_command(job)[3:]  # drop "python -m manimlib"
+    purge_course_modules()
+    reset_process_peak_rss()
+    os.makedirs(os.path.dirname(job_progress_path(job)), exist_ok=True)
+    os.environ[PROGRESS_ENV] = job_progress_path(job)
+
+    start = time.perf_counter()
+    with redirected_output(job_log_path(job)):
+        try:
+            run_manimgl(argv)
+            returncode = 0
+        except SystemExit as error:
+            returncode = error.code if isinstance(error.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+    wall_time = time.perf_counter() - start
+    return job_result(
+        job,
+        returncode,
+        wall_time,
+        peak_rss=process_peak_rss(),
+        frames=read_progress(job).get("frames"),
+    )
+
+
+def worker_main(connection):
+    """Worker loop: warm up once, then render jobs until told to stop"""
+    os.chdir(VIDEOS_DIR)
+    if VIDEOS_DIR not in sys.path:
+        sys.path.insert(0, VIDEOS_DIR)
+    try:
+        warm_up()
+    except Exception:
+        connection.send({"warm": False, "error": traceback.format_exc()})
+        return
+    connection.send({"warm": True})
+
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        connection.send(render_in_process(job))
+
+
+class WarmWorker:
+    """Handle on one prefork worker process and its pipe"""
+
+    def __init__(self):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=worker_main, args=(child,), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.job = None
+        self.ready = False
+        self.started = None
+
+    def submit(self, job: Dict):
+        """Send a job to the worker"""
+        self.job = job
+        self.started = time.perf_counter()
+        self.connection.send(job)
+
+    def stop(self):
+        """Ask the worker to exit, killing it if it does not"""
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+
+
+def render_jobs_warm(
+    jobs: List[Dict],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    history: Optional["RenderHistory"] = None,
+    memory_budget: Optional[int] = None,
+) -> List[Dict]:
+    """Render jobs on prefork workers; same contract as ``render_jobs``"""
+    if not jobs:
+        return []
+    if history is not None:
+        jobs = history.order(jobs)
+
+    queue = list(jobs)
+    size = min(workers or default_worker_count(), len(jobs))
+    pool = [WarmWorker() for _ in range(size)]
+    admission = MemoryAdmission(memory_budget, history)
+    results = []
+    held = False
+
+    def finish(worker: WarmWorker, result: Dict):
+        job = worker.job
+        worker.job = None
+        admission.release(job)
+        if history is not None:
+            history.record(job, result)
+        if admission.retry_alone(job, result):
+            queue.insert(0, job)
+            return
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    try:
+        while len(results) < len(jobs):
+            for worker in pool:
+                if not (worker.ready and worker.job is None and queue):
+                    continue
+                job = admission.next_job(queue)
+                if job is None:
+                    if not held:
+                        print(admission.describe_backoff(len(queue)))
+                        held = True
+                    break
+                queue.remove(job)
+                admission.admit(job)
+                worker.submit(job)
+
+            connections = [worker.connection for worker in pool]
+            # Wake up periodically to re-check memory for held-back jobs
+            for connection in wait(connections, timeout=BACKOFF_SECONDS):
+                worker = next(w for w in pool if w.connection is connection)
+                try:
+                    message = connection.recv()
+                except EOFError:
+                    # The worker died: fail its job and replace it
+                    worker.process.join(timeout=1)
+                    if worker.job is not None:
+                        elapsed = time.perf_counter() - worker.started
+                        exit_code = worker.process.exitcode
+                        returncode = -1
+                        if exit_code == OOM_RETURNCODE:
+                            returncode = OOM_RETURNCODE
+                        finish(
+                            worker,
+                            job_result(
+                                worker.job,
+                                returncode,
+                                elapsed,
+                                error=f"worker exited with code {exit_code}",
+                            ),
+                        )
+                    elif not worker.ready:
+                        raise RuntimeError("Render worker died while warming up")
+                    pool[pool.index(worker)] = WarmWorker()
+                    continue
+
+                if "warm" in message:
+                    if not message["warm"]:
+                        raise RuntimeError(
+                            f"Render worker failed to warm up:\n{message['error']}"
+                        )
+                    worker.ready = True
+                else:
+                    finish(worker, message)
+    finally:
+        for worker in pool:
+            worker.stop()
+        if history is not None:
+            history.save()
+    return results
@@ -0,0 +1,161 @@
+"""
+Scene Checkpoints
+
+Saves the full scene state at section boundaries so a section render can
+start mid-module without running the sections before it. A checkpoint holds
+the scene's mobjects, the camera frame and background, both RNG states, the
+scene clock and the play counter, pickled under the key ``scene_index``
+chains from the code that produced that state:
+
+    renders/checkpoints/<Scene>/<key>.pkl
+
+``CheckpointScene`` writes a checkpoint whenever it reaches a boundary with
+genuine state. When rendering a later section it finds the nearest
+checkpoint before the target, skips the code of every section before it,
+and restores the saved state in place.
+
+The prologue in ``construct()`` always runs (with animations skipped) since
+its local variables, such as a title faded out in the epilogue, cannot be
+pickled. Every mobject added to the scene gets a ``checkpoint_id`` in order
+of addition; replaying the prologue recreates the same ids, so restoring
+updates those live objects with ``become`` and the locals keep pointing at
+what is on screen.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import os
+import pickle
+import random
+
+import numpy as np
+
+from course_settings import DEFAULT_OUTPUT_DIR, atomic_write
+from scene_index import EPILOGUE, PROLOGUE
+from section_runtime import SectionScene
+
+CHECKPOINTS_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "checkpoints")
+
+
+class CheckpointScene(SectionScene):
+    """SectionScene that saves and restores state at section boundaries"""
+
+    # Course scene name and segment name -> key of the state at its start
+    checkpoint_scene = ""
+    checkpoint_keys = {}
+
+    def checkpoint_path(self, segment: str) -> str:
+        """File holding the state at the start of a segment"""
+        return os.path.join(
+            CHECKPOINTS_DIR,
+            self.checkpoint_scene,
+            f"{self.checkpoint_keys[segment]}.pkl",
+        )
+
+    def segment_order(self):
+        return [PROLOGUE] + list(self.sections) + [EPILOGUE]
+
+    def find_resume_segment(self):
+        """Latest segment up to the target whose start state is saved"""
+        order = self.segment_order()
+        if self.target_segment not in order:
+            return None
+        candidates = order[1 : order.index(self.target_segment) + 1]
+        for segment in reversed(candidates):
+            if segment in self.checkpoint_keys and os.path.exists(
+                self.checkpoint_path(segment)
+            ):
+                return segment
+        return None
+
+    def construct(self):
+        self.next_checkpoint_id = getattr(self, "next_checkpoint_id", 0)
+        self.resume_segment = self.find_resume_segment()
+        self.state_is_genuine = self.resume_segment is None
+        self.saving_checkpoints = True
+        super().construct()
+
+    def add(self, *mobjects):
+        for mobject in mobjects:
+            if not hasattr(mobject, "checkpoint_id"):
+                mobject.checkpoint_id = getattr(self, "next_checkpoint_id", 0)
+                self.next_checkpoint_id = mobject.checkpoint_id + 1
+        return super().add(*mobjects)
+
+    def should_run_section(self, name: str) -> bool:
+        if self.resume_segment is None:
+            return True
+        order = self.segment_order()
+        return order.index(name) >= order.index(self.resume_segment)
+
+    def enter_segment(self, segment: str):
+        if self.state_is_genuine and segment in self.checkpoint_keys:
+            self.save_checkpoint(segment)
+        super().enter_segment(segment)
+        if segment == self.resume_segment:
+            self.restore_checkpoint(segment)
+            self.state_is_genuine = True
+
+    def scene_mobjects(self):
+        """Top-level mobjects other than the camera frame"""
+        frame = self.camera.frame
+        return [mobject for mobject in self.mobjects if mobject is not frame]
+
+    def save_checkpoint(self, segment: str):
+        """Pickle the current state as the start of ``segment``"""
+        path = self.checkpoint_path(segment)
+        if not self.saving_checkpoints or os.path.exists(path):
+            return
+        camera = self.camera
+        state = {
+            "mobjects": [(m.checkpoint_id, m) for m in self.scene_mobjects()],
+            "frame": camera.frame,
+            "background_color": getattr(camera, "background_color", None),
+            "background_rgba": getattr(camera, "background_rgba", None),
+            "random": random.getstate(),
+            "numpy": np.random.get_state(),
+            "time": self.time,
+            "num_plays": self.num_plays,
+            "next_checkpoint_id": self.next_checkpoint_id,
+        }
+        try:
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            # Unpicklable state (e.g. updater closures): fall back to replay
+            print(f"Checkpoints disabled for {self.checkpoint_scene}: {error}")
+            self.saving_checkpoints = False
+            return
+
+        try:
+            atomic_write(path, data)
+        except OSError as error:
+            # A missing checkpoint only means a later job replays this section
+            print(f"Checkpoint for {segment} not saved: {error}")
+
+    def restore_checkpoint(self, segment: str):
+        """Replace the current state with the one saved for ``segment``"""
+        with open(self.checkpoint_path(segment), "rb") as checkpoint:
+            state = pickle.load(checkpoint)
+
+        live = {m.checkpoint_id: m for m in self.scene_mobjects()}
+        restored = []
+        for checkpoint_id, saved in state["mobjects"]:
+            mobject = live.get(checkpoint_id)
+            if mobject is not None:
+                mobject.become(saved)
+            else:
+                mobject = saved
+            restored.append(mobject)
+        self.remove(*self.scene_mobjects())
+        self.add(*restored)
+
+        camera = self.camera
+        camera.frame.become(state["frame"])
+        for attribute in ("background_color", "background_rgba"):
+            if state[attribute] is not None:
+                setattr(camera, attribute, state[attribute])
+        random.setstate(state["random"])
+        np.random.set_state(state["numpy"])
+        self.time = state["time"]
+        self.num_plays = state["num_plays"]
+        self.next_checkpoint_id = state["next_checkpoint_id"]
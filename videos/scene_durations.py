@@ -0,0 +1,387 @@
+"""
+Scene Duration Estimates
+
+Estimates how long every scene runs by reading its source with ``ast``,
+without importing manimlib or building a mobject. Each ``self.play()`` adds
+its literal ``run_time=`` or, failing that, the longest default run time of
+its animations; each ``self.wait()`` adds its literal duration or manimgl's
+one second default. Helper methods called from a section are followed,
+loops over literal ranges and sequences are multiplied out, and every value
+that could not be read statically falls back to the default and is counted
+as ``guessed``.
+
+Estimates have the same shape as ``scene_timeline`` timelines, with time
+attributed to sections the same way: code between two section calls in
+``construct()`` belongs to the earlier section, code after the last one to
+the epilogue. They are cached per file by modification time in
+``renders/durations.json``, so listing the course only parses files that
+changed.
+"""
+
+import ast
+import json
+import os
+from typing import Dict, List, Optional
+
+from course_settings import DEFAULT_OUTPUT_DIR, VIDEOS_DIR, atomic_write_json
+from scene_index import (
+    EPILOGUE,
+    PROLOGUE,
+    class_methods,
+    find_scene_classes,
+    find_sections,
+    parse_source,
+    self_method_call,
+)
+
+DURATIONS_CACHE = os.path.join(DEFAULT_OUTPUT_DIR, "durations.json")
+
+# Bumped whenever the estimate rules change, so old cache entries are redone
+ESTIMATOR_VERSION = 1
+
+# manimgl defaults for animations and waits without an explicit duration
+DEFAULT_RUN_TIME = 1.0
+DEFAULT_WAIT_TIME = 1.0
+DEFAULT_LAG_RATIO = 0.05
+
+# Animations whose default run time differs from DEFAULT_RUN_TIME. Write
+# runs for two seconds on anything with 15 or more submobjects, which
+# covers nearly every Text in the course.
+ANIMATION_RUN_TIMES = {
+    "Write": 2.0,
+    "DrawBorderThenFill": 2.0,
+    "Wiggle": 2.0,
+    "Homotopy": 3.0,
+    "Broadcast": 3.0,
+    "Rotating": 5.0,
+}
+
+GROUP_ANIMATIONS = {"AnimationGroup", "LaggedStart", "Succession"}
+
+
+def number(node: ast.AST) -> Optional[float]:
+    """Value of a numeric literal or arithmetic on literals, else None"""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        return None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        value = number(node.operand)
+        if value is None:
+            return None
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp):
+        left, right = number(node.left), number(node.right)
+        if left is None or right is None:
+            return None
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, ast.Div) and right:
+            return left / right
+    return None
+
+
+def keyword(call: ast.Call, name: str) -> Optional[ast.AST]:
+    """Value node of a keyword argument, if given"""
+    for item in call.keywords:
+        if item.arg == name:
+            return item.value
+    return None
+
+
+def reference_name(node: ast.AST) -> str:
+    """Name a function or class is referred by, e.g. ``FadeIn``"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def call_name(call: ast.Call) -> str:
+    """Name of the called function or class"""
+    return reference_name(call.func)
+
+
+def is_animate_call(call: ast.Call) -> bool:
+    """Whether a call builds an animation with ``mobject.animate``"""
+    node = call.func
+    while isinstance(node, (ast.Attribute, ast.Call)):
+        if isinstance(node, ast.Attribute):
+            if node.attr == "animate":
+                return True
+            node = node.value
+        else:
+            node = node.func
+    return False
+
+
+def loop_count(node: ast.AST) -> Optional[int]:
+    """Iterations of a loop over a literal range or sequence, else None"""
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        if any(isinstance(item, ast.Starred) for item in node.elts):
+            return None
+        return len(node.elts)
+    if isinstance(node, ast.Call) and call_name(node) == "enumerate" and node.args:
+        return loop_count(node.args[0])
+    if isinstance(node, ast.Call) and call_name(node) == "range" and node.args:
+        values = [number(arg) for arg in node.args]
+        if None in values or node.keywords:
+            return None
+        start, stop, step = 0.0, values[0], 1.0
+        if len(values) > 1:
+            start, stop = values[0], values[1]
+        if len(values) > 2:
+            step = values[2]
+        if not step:
+            return None
+        return max(len(range(int(start), int(stop), int(step))), 0)
+    return None
+
+
+def empty_estimate() -> Dict:
+    return {"duration": 0.0, "plays": 0, "waits": 0, "guessed": 0}
+
+
+def add_estimate(total: Dict, part: Dict, times: int = 1):
+    """Add ``times`` repetitions of one estimate to another, in place"""
+    for key in ("duration", "plays", "waits", "guessed"):
+        total[key] += part[key] * times
+
+
+class DurationEstimator:
+    """Statically estimates the run time of one scene's code"""
+
+    def __init__(self, node: ast.ClassDef):
+        self.node = node
+        self.methods = class_methods(node)
+        self.calling = []
+
+    def animation_time(self, node: ast.AST):
+        """(seconds, guessed) of one animation argument of ``play()``"""
+        if isinstance(node, ast.Starred):
+            node = node.value
+            if isinstance(node, (ast.ListComp, ast.GeneratorExp)):
+                return self.animation_time(node.elt)
+        if not isinstance(node, ast.Call):
+            return DEFAULT_RUN_TIME, True
+        run_time = keyword(node, "run_time")
+        if run_time is not None:
+            seconds = number(run_time)
+            return (DEFAULT_RUN_TIME, True) if seconds is None else (seconds, False)
+        if is_animate_call(node):
+            return DEFAULT_RUN_TIME, False
+
+        name = call_name(node)
+        if name in GROUP_ANIMATIONS:
+            return self.group_time(node, name)
+        if name == "LaggedStartMap" and node.args:
+            # Applies an animation class to a group of unknown size
+            child = reference_name(node.args[0])
+            return ANIMATION_RUN_TIMES.get(child, DEFAULT_RUN_TIME), True
+        return ANIMATION_RUN_TIMES.get(name, DEFAULT_RUN_TIME), False
+
+    def group_time(self, node: ast.Call, name: str):
+        """(seconds, guessed) of an AnimationGroup, LaggedStart or Succession"""
+        children = [self.animation_time(arg) for arg in node.args]
+        if not children:
+            return 0.0, False
+        times = [seconds for seconds, _ in children]
+        guessed = any(flag for _, flag in children)
+        if name == "Succession":
+            return sum(times), guessed
+        longest = max(times)
+        lag = DEFAULT_LAG_RATIO if name == "LaggedStart" else 0.0
+        lag_ratio = keyword(node, "lag_ratio")
+        if lag_ratio is not None:
+            lag = number(lag_ratio)
+            if lag is None:
+                return longest, True
+        count = len(node.args)
+        if any(isinstance(arg, ast.Starred) for arg in node.args):
+            # A spread list of unknown length: the lag cannot be sized
+            return longest, guessed or bool(lag)
+        return longest * (1 + (count - 1) * lag), guessed
+
+    def play_estimate(self, call: ast.Call) -> Dict:
+        estimate = empty_estimate()
+        estimate["plays"] = 1
+        run_time = keyword(call, "run_time")
+        if run_time is not None:
+            seconds = number(run_time)
+            estimate["duration"] = DEFAULT_RUN_TIME if seconds is None else seconds
+            estimate["guessed"] = int(seconds is None)
+            return estimate
+        times = [self.animation_time(arg) for arg in call.args]
+        if times:
+            estimate["duration"] = max(seconds for seconds, _ in times)
+            estimate["guessed"] = int(any(flag for _, flag in times))
+        return estimate
+
+    def wait_estimate(self, call: ast.Call) -> Dict:
+        estimate = empty_estimate()
+        estimate["waits"] = 1
+        duration = call.args[0] if call.args else keyword(call, "duration")
+        seconds = DEFAULT_WAIT_TIME if duration is None else number(duration)
+        estimate["duration"] = DEFAULT_WAIT_TIME if seconds is None else seconds
+        estimate["guessed"] = int(seconds is None)
+        return estimate
+
+    def method_estimate(self, name: str) -> Dict:
+        """Estimate of a whole method, following helpers it calls"""
+        if name in self.calling:
+            return empty_estimate()
+        self.calling.append(name)
+        try:
+            return self.statements_estimate(self.methods[name].body)
+        finally:
+            self.calling.pop()
+
+    def calls_estimate(self, node: ast.AST) -> Dict:
+        """Estimate of the play/wait/helper calls within one expression"""
+        total = empty_estimate()
+        if isinstance(node, (ast.Lambda, ast.FunctionDef, ast.AsyncFunctionDef)):
+            return total
+        if isinstance(node, ast.Call):
+            func = node.func
+            if (
+                isinstance(func, ast.Attribute)
+                and isinstance(func.value, ast.Name)
+                and func.value.id == "self"
+            ):
+                if func.attr == "play":
+                    return self.play_estimate(node)
+                if func.attr == "wait":
+                    return self.wait_estimate(node)
+                if func.attr in self.methods and func.attr != "construct":
+                    add_estimate(total, self.method_estimate(func.attr))
+        for child in ast.iter_child_nodes(node):
+            add_estimate(total, self.calls_estimate(child))
+        return total
+
+    def statements_estimate(self, statements: List[ast.stmt]) -> Dict:
+        """Estimate of a block of statements, in execution order"""
+        total = empty_estimate()
+        for statement in statements:
+            add_estimate(total, self.statement_estimate(statement))
+        return total
+
+    def statement_estimate(self, statement: ast.stmt) -> Dict:
+        if isinstance(statement, (ast.For, ast.AsyncFor)):
+            total = self.calls_estimate(statement.iter)
+            body = self.statements_estimate(statement.body)
+            count = loop_count(statement.iter)
+            if count is None and body["plays"] + body["waits"]:
+                body["guessed"] += 1
+            add_estimate(total, body, 1 if count is None else count)
+            add_estimate(total, self.statements_estimate(statement.orelse))
+            return total
+        if isinstance(statement, ast.While):
+            total = self.statements_estimate(statement.body)
+            if total["plays"] + total["waits"]:
+                total["guessed"] += 1
+            return total
+        if isinstance(statement, ast.If):
+            # Course code rarely branches; count the longer branch
+            total = self.calls_estimate(statement.test)
+            branches = [
+                self.statements_estimate(statement.body),
+                self.statements_estimate(statement.orelse),
+            ]
+            add_estimate(total, max(branches, key=lambda part: part["duration"]))
+            return total
+        if isinstance(statement, (ast.With, ast.AsyncWith)):
+            total = empty_estimate()
+            for item in statement.items:
+                add_estimate(total, self.calls_estimate(item.context_expr))
+            add_estimate(total, self.statements_estimate(statement.body))
+            return total
+        if isinstance(statement, ast.Try):
+            total = self.statements_estimate(statement.body)
+            add_estimate(total, self.statements_estimate(statement.orelse))
+            add_estimate(total, self.statements_estimate(statement.finalbody))
+            return total
+        return self.calls_estimate(statement)
+
+    def scene_estimate(self) -> Dict:
+        """Timeline-shaped estimate of the scene with per-section totals"""
+        construct = self.methods.get("construct")
+        sections = {}
+        if construct is None:
+            return {"duration": 0.0, "guessed": 0, "sections": sections}
+        names = find_sections(self.node)
+        calls = [self_method_call(statement) for statement in construct.body]
+        last = next((name for name in reversed(calls) if name in names), None)
+
+        current, start, guessed = PROLOGUE, 0.0, 0
+        self.calling.append("construct")
+        for statement in construct.body:
+            name = self_method_call(statement)
+            if name in names:
+                current = name
+                part = self.method_estimate(name)
+            else:
+                part = self.statement_estimate(statement)
+            if part["plays"] or part["waits"]:
+                totals = sections.setdefault(
+                    current, {"start": start, **empty_estimate()}
+                )
+                add_estimate(totals, part)
+                start += part["duration"]
+                guessed += part["guessed"]
+            if name is not None and name == last:
+                current = EPILOGUE
+        self.calling.pop()
+        return {"duration": start, "guessed": guessed, "sections": sections}
+
+
+def estimate_file(path: str) -> Dict[str, Dict]:
+    """Estimates of every Scene subclass in a file, without caching"""
+    return {
+        name: DurationEstimator(node).scene_estimate()
+        for name, node in find_scene_classes(parse_source(path)).items()
+    }
+
+
+def load_cache(cache_path: str) -> Dict:
+    try:
+        with open(cache_path, encoding="utf-8") as cache:
+            data = json.load(cache)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return data if data.get("version") == ESTIMATOR_VERSION else {}
+
+
+def estimate_durations(
+    files: List[str], cache_path: str = DURATIONS_CACHE
+) -> Dict[str, Dict[str, Dict]]:
+    """Estimates per file and scene, re-parsing only files that changed"""
+    cache = load_cache(cache_path)
+    entries = cache.get("files", {})
+    estimates = {}
+    changed = False
+    for file in files:
+        path = os.path.join(VIDEOS_DIR, file)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        entry = entries.get(file)
+        if entry is None or entry["mtime"] != mtime:
+            entry = {"mtime": mtime, "scenes": estimate_file(path)}
+            entries[file] = entry
+            changed = True
+        estimates[file] = entry["scenes"]
+
+    if changed:
+        cache = {"version": ESTIMATOR_VERSION, "files": entries}
+        try:
+            atomic_write_json(cache_path, cache)
+        except OSError:
+            pass  # estimates are recomputed from the sources next time
+    return estimates
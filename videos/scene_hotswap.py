@@ -0,0 +1,130 @@
+"""
+Scene Hot-Swapping
+
+Applies edits to a scene that is open in manimgl's interactive window
+without restarting the process or losing the GL context. ``HotSwapScene``
+snapshots the scene state (manimgl's ``get_state()``: mobjects, clock and
+play count) the first time each section starts. In the embedded shell,
+``self.hot_swap()`` then:
+
+1. re-executes the course module from disk in a fresh namespace,
+2. compares segment fingerprints with the source the scene was started
+   from, to find the sections whose code (or helpers) changed,
+3. rebinds every method of the reloaded class onto the live scene, and
+4. restores the snapshot of the earliest changed section that has already
+   run and replays only that section.
+
+Changes to the ``construct()`` prologue or epilogue are rebound but cannot
+be replayed; restart the window for those. Launch a module with
+``course_launcher.py --interactive MODULE``.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import functools
+import importlib.util
+import os
+import types
+
+from manimlib import Scene
+
+from course_settings import VIDEOS_DIR
+from scene_index import EPILOGUE, PROLOGUE, segment_fingerprints
+
+
+class HotSwapScene(Scene):
+    """Mixin that reloads edited section methods into the live scene"""
+
+    # Course scene, its source file and its section method names, set by
+    # generated scenes
+    hotswap_scene = ""
+    hotswap_source = ""
+    hotswap_sections = []
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.hotswap_sections:
+            setattr(cls, name, cls._snapshot_section(name, getattr(cls, name)))
+
+    @staticmethod
+    def _snapshot_section(name, method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if name not in self.hotswap_snapshots:
+                self.hotswap_snapshots[name] = self.get_state()
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    def setup(self):
+        super().setup()
+        self.hotswap_snapshots = {}
+        self.hotswap_fingerprints = segment_fingerprints(
+            self.hotswap_path(), self.hotswap_scene
+        )
+        self.hotswap_reloads = 0
+
+    def construct(self):
+        super().construct()
+        # Stay in the window with a shell, where self.hot_swap() applies edits
+        self.embed()
+
+    def hotswap_path(self) -> str:
+        return os.path.join(VIDEOS_DIR, self.hotswap_source)
+
+    def reload_scene_class(self) -> type:
+        """Execute the course module from disk and return the scene class"""
+        self.hotswap_reloads += 1
+        name = f"hotswap_{self.hotswap_reloads}_{self.hotswap_scene}"
+        spec = importlib.util.spec_from_file_location(name, self.hotswap_path())
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return getattr(module, self.hotswap_scene)
+
+    def rebind(self, scene_class: type):
+        """Bind every method of a reloaded class onto this scene instance"""
+        for name, function in vars(scene_class).items():
+            if not isinstance(function, types.FunctionType):
+                continue
+            if name in self.hotswap_sections:
+                function = self._snapshot_section(name, function)
+            setattr(self, name, types.MethodType(function, self))
+
+    def hot_swap(self):
+        """Reload the course source and replay the earliest changed section"""
+        try:
+            fingerprints = segment_fingerprints(
+                self.hotswap_path(), self.hotswap_scene
+            )
+            scene_class = self.reload_scene_class()
+        except Exception as error:  # the shell must survive a broken edit
+            print(f"❌ Reload failed, scene left as it was: {error!r}")
+            return
+        changed = [
+            segment
+            for segment, digest in fingerprints.items()
+            if self.hotswap_fingerprints.get(segment) != digest
+        ]
+        self.rebind(scene_class)
+        self.hotswap_fingerprints = fingerprints
+        if not changed:
+            print("💤 No section changed")
+            return
+        print(f"✏️  Changed: {', '.join(changed)}")
+        if PROLOGUE in changed or EPILOGUE in changed:
+            print("⚠️  construct() changed; restart the window to apply that part")
+
+        replay = next(
+            (
+                name
+                for name in self.hotswap_sections
+                if name in changed and name in self.hotswap_snapshots
+            ),
+            None,
+        )
+        if replay is None:
+            print("✅ Rebound; changed sections will run with the new code")
+            return
+        print(f"🔁 Replaying {replay}")
+        self.restore_state(self.hotswap_snapshots[replay])
+        getattr(self, replay)()
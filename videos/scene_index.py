@@ -0,0 +1,398 @@
+"""
+Scene Index
+
+Statically discovers Scene subclasses and their section methods by parsing
+the course sources with ``ast``. Nothing here imports manimlib, so it is safe
+to use from the launcher and from build tooling.
+
+A scene's sections are the ``self.<method>()`` calls made directly from its
+``construct()``, in call order. Code in ``construct()`` before the first
+section is the prologue and code after the last section is the epilogue;
+both only count as segments when they animate something.
+
+Segment fingerprints hash the normalized AST of a segment together with the
+helper methods and module-level definitions it reaches, so comments,
+docstrings and formatting never change a fingerprint.
+
+``index_scenes`` describes every scene of a set of course files in source
+order and caches the result in ``renders/scene_index.json`` by file hash;
+the launcher uses it as its list of render targets.
+"""
+
+import ast
+import copy
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+from course_settings import (
+    DEFAULT_OUTPUT_DIR,
+    VIDEOS_DIR,
+    atomic_write_json,
+    source_digest,
+)
+
+PROLOGUE = "__prologue__"
+EPILOGUE = "__epilogue__"
+
+ANIMATION_METHODS = {"play", "wait"}
+
+SCENE_INDEX_CACHE = os.path.join(DEFAULT_OUTPUT_DIR, "scene_index.json")
+
+# Bumped whenever scene descriptions change shape, so old caches are redone
+INDEX_VERSION = 1
+
+
+def parse_source(path: str) -> ast.Module:
+    """Parse a Python source file into an AST"""
+    with open(path, encoding="utf-8") as source:
+        return ast.parse(source.read(), filename=path)
+
+
+def _base_names(node: ast.ClassDef) -> List[str]:
+    names = []
+    for base in node.bases:
+        if isinstance(base, ast.Name):
+            names.append(base.id)
+        elif isinstance(base, ast.Attribute):
+            names.append(base.attr)
+    return names
+
+
+def find_scene_classes(tree: ast.Module) -> Dict[str, ast.ClassDef]:
+    """Return top-level classes that derive from Scene, directly or indirectly"""
+    classes = {
+        node.name: node for node in tree.body if isinstance(node, ast.ClassDef)
+    }
+    scenes = {}
+    changed = True
+    while changed:
+        changed = False
+        for name, node in classes.items():
+            if name in scenes:
+                continue
+            bases = _base_names(node)
+            if "Scene" in bases or any(base in scenes for base in bases):
+                scenes[name] = node
+                changed = True
+    return {name: classes[name] for name in classes if name in scenes}
+
+
+def class_methods(node: ast.ClassDef) -> Dict[str, ast.FunctionDef]:
+    """Return the methods defined directly on a class"""
+    return {
+        item.name: item
+        for item in node.body
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+
+
+def self_method_call(statement: ast.stmt) -> Optional[str]:
+    """Return ``name`` if the statement is a bare ``self.name(...)`` call"""
+    if not isinstance(statement, ast.Expr):
+        return None
+    call = statement.value
+    if not isinstance(call, ast.Call):
+        return None
+    func = call.func
+    if (
+        isinstance(func, ast.Attribute)
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "self"
+    ):
+        return func.attr
+    return None
+
+
+def has_animation_calls(statements: List[ast.stmt]) -> bool:
+    """Check whether any statement calls ``self.play`` or ``self.wait``"""
+    for statement in statements:
+        for node in ast.walk(statement):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "self"
+                and node.func.attr in ANIMATION_METHODS
+            ):
+                return True
+    return False
+
+
+def find_sections(node: ast.ClassDef) -> List[str]:
+    """Return the section methods called from construct(), in order"""
+    methods = class_methods(node)
+    construct = methods.get("construct")
+    if construct is None:
+        return []
+
+    sections = []
+    for statement in construct.body:
+        name = self_method_call(statement)
+        if name in methods and name != "construct" and name not in sections:
+            sections.append(name)
+    return sections
+
+
+def find_segments(node: ast.ClassDef) -> List[str]:
+    """Return the renderable segments of a scene: prologue, sections, epilogue"""
+    sections = find_sections(node)
+    construct = class_methods(node).get("construct")
+    if construct is None:
+        return []
+    if not sections:
+        return [PROLOGUE] if has_animation_calls(construct.body) else []
+
+    calls = [self_method_call(statement) for statement in construct.body]
+    first = calls.index(sections[0])
+    last = len(calls) - 1 - calls[::-1].index(sections[-1])
+
+    segments = []
+    if has_animation_calls(construct.body[:first]):
+        segments.append(PROLOGUE)
+    segments.extend(sections)
+    if has_animation_calls(construct.body[last + 1 :]):
+        segments.append(EPILOGUE)
+    return segments
+
+
+def describe_scenes(path: str) -> Dict[str, Dict]:
+    """Describe every Scene subclass in a file with its sections and segments"""
+    scenes = {}
+    for name, node in find_scene_classes(parse_source(path)).items():
+        scenes[name] = {
+            "name": name,
+            "lineno": node.lineno,
+            "sections": find_sections(node),
+            "segments": find_segments(node),
+            "background": scene_background(node),
+        }
+    return scenes
+
+
+def index_scenes(
+    files: List[str], cache_path: str = SCENE_INDEX_CACHE
+) -> Dict[str, List[Dict]]:
+    """Scenes of each course file in source order, re-parsing changed files
+
+    Files are relative to the videos directory; missing files map to no
+    scenes.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as cache:
+            data = json.load(cache)
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+    entries = data.get("files", {}) if data.get("version") == INDEX_VERSION else {}
+
+    index = {}
+    changed = False
+    for file in files:
+        try:
+            digest = source_digest(file)
+        except FileNotFoundError:
+            index[file] = []
+            continue
+        entry = entries.get(file)
+        if entry is None or entry["digest"] != digest:
+            scenes = describe_scenes(os.path.join(VIDEOS_DIR, file)).values()
+            entry = {
+                "digest": digest,
+                "scenes": sorted(scenes, key=lambda scene: scene["lineno"]),
+            }
+            entries[file] = entry
+            changed = True
+        index[file] = entry["scenes"]
+
+    if changed:
+        cache = {"version": INDEX_VERSION, "files": entries}
+        try:
+            atomic_write_json(cache_path, cache)
+        except OSError:
+            pass  # the index is rebuilt from the sources next time
+    return index
+
+
+def segment_statements(node: ast.ClassDef, segment: str) -> List[ast.stmt]:
+    """Return the statements that make up a segment of a scene"""
+    construct = class_methods(node)["construct"]
+    if segment not in (PROLOGUE, EPILOGUE):
+        return [class_methods(node)[segment]]
+
+    sections = find_sections(node)
+    if not sections:
+        return construct.body
+    calls = [self_method_call(statement) for statement in construct.body]
+    if segment == PROLOGUE:
+        return construct.body[: calls.index(sections[0])]
+    last = len(calls) - 1 - calls[::-1].index(sections[-1])
+    return construct.body[last + 1 :]
+
+
+def _strip_docstrings(node: ast.AST) -> ast.AST:
+    for child in ast.walk(node):
+        body = getattr(child, "body", None)
+        if (
+            isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+            and body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            child.body = body[1:] or [ast.Pass()]
+    return node
+
+
+def normalized_dump(node: ast.AST) -> str:
+    """Dump an AST without positions or docstrings"""
+    return ast.dump(_strip_docstrings(copy.deepcopy(node)), include_attributes=False)
+
+
+def _referenced_names(nodes: List[ast.AST]) -> Set[str]:
+    names = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                names.add(child.id)
+            elif (
+                isinstance(child, ast.Attribute)
+                and isinstance(child.value, ast.Name)
+                and child.value.id == "self"
+            ):
+                names.add(f"self.{child.attr}")
+    return names
+
+
+def module_definitions(tree: ast.Module) -> Dict[str, ast.stmt]:
+    """Map module-level function, class and variable names to their statements"""
+    definitions = {}
+    for statement in tree.body:
+        if isinstance(statement, (ast.FunctionDef, ast.ClassDef)):
+            definitions[statement.name] = statement
+        elif isinstance(statement, ast.Assign):
+            for target in statement.targets:
+                if isinstance(target, ast.Name):
+                    definitions[target.id] = statement
+    return definitions
+
+
+def segment_dependencies(
+    tree: ast.Module, node: ast.ClassDef, segment: str
+) -> List[ast.AST]:
+    """Return a segment's statements plus every helper and definition it uses"""
+    methods = class_methods(node)
+    definitions = module_definitions(tree)
+    pending = list(segment_statements(node, segment))
+    seen_names = set()
+    nodes = []
+    while pending:
+        current = pending.pop(0)
+        nodes.append(current)
+        for name in sorted(_referenced_names([current]) - seen_names):
+            seen_names.add(name)
+            if name.startswith("self."):
+                method = methods.get(name[len("self.") :])
+                if method is not None and method.name != "construct":
+                    pending.append(method)
+            elif name in definitions and definitions[name] is not node:
+                pending.append(definitions[name])
+    return nodes
+
+
+def scene_background(node: ast.ClassDef) -> Optional[str]:
+    """Return the background colour a scene assigns in construct(), if literal"""
+    construct = class_methods(node).get("construct")
+    for child in ast.walk(construct) if construct else []:
+        if not isinstance(child, ast.Assign) or not isinstance(
+            child.value, ast.Constant
+        ):
+            continue
+        for target in child.targets:
+            if isinstance(target, ast.Attribute) and target.attr == "background_color":
+                return str(child.value.value)
+    return None
+
+
+def segment_fingerprints(path: str, scene: str) -> Dict[str, str]:
+    """Hash every segment of a scene from its normalized source and dependencies
+
+    The construct() prologue is folded into every section's hash because it
+    sets up state (titles, background) that sections carry on screen. State
+    handed over from the section before is not part of the hash; see
+    ``clip_fingerprints`` for keys that include it.
+    """
+    tree = parse_source(path)
+    node = find_scene_classes(tree)[scene]
+    prologue = normalized_dump(ast.Module(body=segment_statements(node, PROLOGUE)))
+
+    fingerprints = {}
+    for segment in find_segments(node):
+        digest = hashlib.sha256(prologue.encode())
+        for dependency in segment_dependencies(tree, node, segment):
+            digest.update(normalized_dump(dependency).encode())
+        fingerprints[segment] = digest.hexdigest()
+    return fingerprints
+
+
+def clip_fingerprints(fingerprints: Dict[str, str]) -> Dict[str, str]:
+    """Hash every segment's clip from its own code and the state it starts in
+
+    A section starts from the scene state every earlier segment left behind:
+    what is on screen (many open with ``FadeOut(*self.mobjects)``) and the
+    position of manimgl's seeded ``random`` and ``np.random`` streams. Like
+    ``checkpoint_keys``, each key chains the key of the segment before it,
+    so an edit changes the key of its segment and of every one after it.
+    """
+    keys = {}
+    previous = ""
+    for segment, fingerprint in fingerprints.items():
+        digest = hashlib.sha256(f"{previous}\n{fingerprint}".encode())
+        keys[segment] = digest.hexdigest()
+        previous = keys[segment]
+    return keys
+
+
+def segment_costs(path: str) -> Dict[str, Dict[str, int]]:
+    """Static render cost of every segment, as AST node counts of its code
+
+    Used to order jobs before any render history exists; bigger segments
+    build more mobjects and play more animations, so node count tracks
+    render time well enough to pick which job to start first.
+    """
+    tree = parse_source(path)
+    costs = {}
+    for scene, node in find_scene_classes(tree).items():
+        costs[scene] = {
+            segment: sum(
+                len(list(ast.walk(dependency)))
+                for dependency in segment_dependencies(tree, node, segment)
+            )
+            for segment in find_segments(node)
+        }
+    return costs
+
+
+def checkpoint_keys(
+    path: str, scene: str, fingerprints: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """Key of the scene state at the start of each section and the epilogue
+
+    A key chains the prologue with the fingerprints of every section before
+    it, so a saved state stays valid exactly as long as none of the code
+    that produced it has changed. Pass the scene's ``segment_fingerprints``
+    if they are already computed.
+    """
+    tree = parse_source(path)
+    node = find_scene_classes(tree)[scene]
+    if fingerprints is None:
+        fingerprints = segment_fingerprints(path, scene)
+    prologue = normalized_dump(ast.Module(body=segment_statements(node, PROLOGUE)))
+
+    digest = hashlib.sha256(f"{scene}\n{prologue}".encode())
+    keys = {}
+    for name in find_sections(node) + [EPILOGUE]:
+        keys[name] = digest.hexdigest()
+        if name in fingerprints:
+            digest.update(fingerprints[name].encode())
+    return keys
@@ -0,0 +1,77 @@
+"""
+Scene Timelines
+
+Exact scene durations from a dry run. A timeline job runs a course scene's
+``construct()`` through ``section_runtime.TimelineScene``: every mobject is
+built and every ``play()``/``wait()`` call advances the clock by its real run
+time, but no frame is rasterized or encoded. The result is a JSON timeline:
+
+    renders/timelines/<Scene>.json
+    {
+        "scene": "ProgrammingLogicCourse",
+        "source_digest": "...",
+        "duration": 1412.5,
+        "sections": {"what_is_programming": {"start": 3.0, "duration": 180.0,
+                                             "plays": 41, "waits": 12}, ...},
+        "events": [{"kind": "play", "section": "__prologue__", "start": 0.0,
+                    "run_time": 2.0, "animations": ["Write"]}, ...]
+    }
+
+A timeline is only used while the source hash it was recorded from still
+matches the file. Timeline jobs are planned by ``section_render``; this
+module only reads timelines and stays cheap to import for the launcher.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+
+from course_settings import DEFAULT_OUTPUT_DIR, source_digest
+
+TIMELINES_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "timelines")
+
+# Timelines only need the clock, so dry runs use the cheapest tier
+TIMELINE_QUALITY = "draft"
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Short h:mm:ss / m:ss rendering of a duration"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def timeline_path(scene: str) -> str:
+    """JSON file holding a scene's dry-run timeline"""
+    return os.path.join(TIMELINES_DIR, f"{scene}.json")
+
+
+def load_timeline(file: str, scene: str) -> Optional[Dict]:
+    """A scene's timeline, or None if missing or recorded from older source"""
+    try:
+        with open(timeline_path(scene), encoding="utf-8") as timeline:
+            data = json.load(timeline)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    try:
+        current = source_digest(file)
+    except OSError:
+        return None
+    return data if data.get("source_digest") == current else None
+
+
+def timeline_lines(timeline: Dict) -> List[str]:
+    """Per-section breakdown of a timeline, one line per section"""
+    lines = []
+    for section, totals in timeline["sections"].items():
+        lines.append(
+            f"   {format_duration(totals['start']):>8}  {section:<36}"
+            f" {format_duration(totals['duration']):>8}"
+            f"  ({totals['plays']} plays, {totals['waits']} waits)"
+        )
+    return lines
@@ -0,0 +1,145 @@
+"""
+Section Frame Rates
+
+Most course sections are slides: text is written or faded in, then held.
+Those look the same at 30 fps as at 60 fps, so they can be rendered at half
+the frame rate of the high and uhd tiers. ``section_frame_rates`` picks a
+rate for every segment of a scene:
+
+* a rate declared on the course scene wins, e.g.
+  ``section_frame_rates = {"library_overview": 30}`` as a class attribute;
+* otherwise a segment whose animations are all ``SLIDE_ANIMATIONS`` and
+  whose code (helpers included) sets up no updaters gets
+  ``SLIDE_FRAME_RATE``;
+* everything else renders at the tier's full rate (no entry).
+
+Only the frames that are rendered change: ``FrameRateScene`` sends every
+frame to the encoder as many times as the full rate needs, so each clip is
+still written at its tier's frame rate and stitches with the others. Like
+the rest of the scene index this reads the source with ``ast`` and never
+imports manimlib.
+"""
+
+import ast
+from typing import Dict, Optional
+
+from scene_durations import call_name, number, reference_name
+from scene_index import (
+    class_methods,
+    find_scene_classes,
+    find_segments,
+    parse_source,
+    segment_dependencies,
+)
+
+# Frame rate of a section that only writes, draws or fades content in place
+SLIDE_FRAME_RATE = 30
+
+SLIDE_ANIMATIONS = {
+    "AddTextWordByWord",
+    "Create",
+    "DrawBorderThenFill",
+    "FadeIn",
+    "FadeOut",
+    "ShowCreation",
+    "ShowIncreasingSubsets",
+    "Uncreate",
+    "Write",
+}
+
+# Arguments that make a fade move or scale its mobject
+MOTION_KEYWORDS = {"shift", "scale", "path_arc"}
+
+# Names that give mobjects continuous motion between animations
+UPDATER_NAMES = {"add_updater", "always", "always_redraw", "f_always"}
+
+GROUP_ANIMATIONS = {"AnimationGroup", "LaggedStart", "Succession"}
+
+
+def is_slide_animation(node: ast.AST) -> bool:
+    """Whether an argument of ``play()`` only reveals or hides content"""
+    if isinstance(node, ast.Starred):
+        node = node.value
+        if isinstance(node, (ast.ListComp, ast.GeneratorExp)):
+            node = node.elt
+    if not isinstance(node, ast.Call):
+        return False
+    name = call_name(node)
+    if name in GROUP_ANIMATIONS:
+        return all(is_slide_animation(arg) for arg in node.args)
+    if name == "LaggedStartMap":
+        return bool(node.args) and reference_name(node.args[0]) in SLIDE_ANIMATIONS
+    if name not in SLIDE_ANIMATIONS:
+        return False
+    return not any(item.arg in MOTION_KEYWORDS for item in node.keywords)
+
+
+def is_slide_play(call: ast.Call) -> bool:
+    """Whether a ``self.play()`` call animates nothing but slide animations"""
+    return bool(call.args) and all(is_slide_animation(arg) for arg in call.args)
+
+
+def is_slide_segment(tree: ast.Module, node: ast.ClassDef, segment: str) -> bool:
+    """Whether a segment, with every helper it uses, renders like a slide"""
+    for dependency in segment_dependencies(tree, node, segment):
+        for child in ast.walk(dependency):
+            if isinstance(child, ast.Name) and child.id in UPDATER_NAMES:
+                return False
+            if isinstance(child, ast.Attribute) and (
+                child.attr in UPDATER_NAMES or child.attr == "animate"
+            ):
+                return False
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Attribute)
+                and isinstance(child.func.value, ast.Name)
+                and child.func.value.id == "self"
+                and child.func.attr == "play"
+                and not is_slide_play(child)
+            ):
+                return False
+    return True
+
+
+def declared_frame_rates(node: ast.ClassDef) -> Dict[str, int]:
+    """Rates a scene declares in a literal ``section_frame_rates`` dict"""
+    for statement in node.body:
+        if not isinstance(statement, ast.Assign):
+            continue
+        if not any(
+            isinstance(target, ast.Name) and target.id == "section_frame_rates"
+            for target in statement.targets
+        ):
+            continue
+        if not isinstance(statement.value, ast.Dict):
+            return {}
+        rates = {}
+        for key, value in zip(statement.value.keys, statement.value.values):
+            rate = number(value)
+            if isinstance(key, ast.Constant) and isinstance(key.value, str) and rate:
+                rates[key.value] = int(rate)
+        return rates
+    return {}
+
+
+def section_frame_rates(path: str, scene: str) -> Dict[str, int]:
+    """Frame rate of every segment that renders below the full rate"""
+    tree = parse_source(path)
+    node = find_scene_classes(tree).get(scene)
+    if node is None or "construct" not in class_methods(node):
+        return {}
+    declared = declared_frame_rates(node)
+    rates = {}
+    for segment in find_segments(node):
+        if segment in declared:
+            rates[segment] = declared[segment]
+        elif is_slide_segment(tree, node, segment):
+            rates[segment] = SLIDE_FRAME_RATE
+    return rates
+
+
+def frame_step(tier_fps: int, rate: Optional[int]) -> int:
+    """Output frames per rendered frame, keeping at least ``rate`` fps"""
+    if not rate or rate >= tier_fps:
+        return 1
+    return max(1, int(tier_fps // rate))
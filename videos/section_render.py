@@ -0,0 +1,324 @@
+"""
+Section Render Planning
+
+Turns a course scene into one render job per segment. Each job gets a small
+generated scene file that mixes ``SectionScene`` into the course scene, so a
+plain ``manimgl`` invocation renders exactly that segment to its own clip and
+the jobs can run on separate processes through ``render_pool``.
+
+Every generated scene, whole-scene jobs included, also mixes in
+``JournalScene`` so a crashed render resumes from its last finished
+animation instead of from frame zero. Section jobs use ``CheckpointScene``,
+which starts from the saved state of an earlier section boundary instead of
+replaying every section before the target. All of them report progress
+through ``ProgressScene`` for the launcher's live view, and jobs planned with
+``variants`` mix in ``MultiOutputScene`` to write lower quality tiers in the
+same pass.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Sequence
+
+from course_settings import (
+    DEFAULT_OUTPUT_DIR,
+    QUALITY_TIERS,
+    VIDEOS_DIR,
+    atomic_write,
+    source_digest,
+)
+from render_cache import clip_cache_key
+from render_pool import sections_dir
+from scene_index import (
+    checkpoint_keys,
+    clip_fingerprints,
+    describe_scenes,
+    segment_fingerprints,
+)
+from scene_timeline import TIMELINE_QUALITY, TIMELINES_DIR, timeline_path
+from section_rates import frame_step, section_frame_rates
+
+JOBS_DIR = os.path.join(DEFAULT_OUTPUT_DIR, "jobs")
+
+# Render-side mixins a generated scene can use, and the module defining each
+RUNTIME_MIXINS = {
+    "CheckpointScene": "scene_checkpoints",
+    "FrameDedupScene": "render_dedup",
+    "FrameRateScene": "render_rates",
+    "HotSwapScene": "scene_hotswap",
+    "JournalScene": "render_journal",
+    "MultiOutputScene": "multi_output",
+    "PipelineScene": "render_pipeline",
+    "ProgressScene": "render_progress",
+    "StaticHoldScene": "render_holds",
+    "SectionScene": "section_runtime",
+    "ShardScene": "section_runtime",
+    "TimelineScene": "section_runtime",
+}
+
+# Mixed into every generated scene, in this order, ahead of a job's own mixins
+DEFAULT_MIXINS = [
+    "ProgressScene",
+    "PipelineScene",
+    "StaticHoldScene",
+    "FrameDedupScene",
+    "FrameRateScene",
+]
+
+SHIM_TEMPLATE = '''# Generated by section_render.py - do not edit
+import sys
+
+sys.path.insert(0, {videos_dir!r})
+
+{imports}
+from {module} import {scene}
+
+
+class {shim_class}({bases}):
+{attributes}
+
+
+SCENES_IN_ORDER = [{shim_class}]
+'''
+
+
+def segment_job_name(scene: str, index: int, segment: str) -> str:
+    """Name of a segment clip; the index keeps clips in playback order"""
+    return f"{scene}__{index:02d}_{segment.strip('_')}"
+
+
+def write_scene_shim(
+    file: str,
+    scene: str,
+    name: str,
+    mixins: List[str],
+    attributes: Dict,
+    info: Optional[Dict] = None,
+    frame_rates: Optional[Dict[str, int]] = None,
+    quality: Optional[str] = None,
+) -> str:
+    """Write a generated scene that mixes runtime support into a course scene
+
+    ``ProgressScene`` is always mixed in first, tracking the scene's sections,
+    followed by ``PipelineScene``, which feeds frames to the encoder from
+    another process, ``StaticHoldScene``, which renders static waits only
+    once, ``FrameDedupScene``, which reports repeated frames per section, and
+    ``FrameRateScene``, which renders slide sections at a lower frame rate.
+
+    The scene's ``info`` (from ``describe_scenes``) and ``frame_rates`` are
+    read from the source unless the caller already has them; planners that
+    write many shims for one scene pass them in. The file is named after the
+    job and its ``quality``, since renders of one segment at different tiers
+    carry different attributes, and it is replaced atomically because a
+    render of an earlier plan may be importing it.
+    """
+    source = os.path.join(VIDEOS_DIR, file)
+    if info is None:
+        info = describe_scenes(source).get(scene, {})
+    if frame_rates is None:
+        frame_rates = section_frame_rates(source, scene)
+    mixins = DEFAULT_MIXINS + mixins
+    attributes = dict(
+        progress_sections=info.get("sections", []),
+        section_frame_rates=frame_rates,
+        **attributes,
+    )
+    module = os.path.splitext(os.path.basename(file))[0]
+    file_name = f"{name}__{quality}" if quality else name
+    shim_path = os.path.join(JOBS_DIR, f"{file_name}.py")
+    content = SHIM_TEMPLATE.format(
+        videos_dir=VIDEOS_DIR,
+        imports="\n".join(
+            f"from {RUNTIME_MIXINS[mixin]} import {mixin}" for mixin in mixins
+        ),
+        module=module,
+        scene=scene,
+        shim_class=name,
+        bases=", ".join(mixins + [scene]),
+        attributes="\n".join(
+            f"    {key} = {value!r}" for key, value in attributes.items()
+        )
+        or "    pass",
+    )
+    atomic_write(shim_path, content)
+    return shim_path
+
+
+def scene_journal_key(file: str, quality: str) -> str:
+    """Identity of a whole-scene render for its crash journal"""
+    with open(os.path.join(VIDEOS_DIR, file), "rb") as source:
+        digest = hashlib.sha256(source.read())
+    digest.update(json.dumps(QUALITY_TIERS[quality], sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def output_mixins(quality: str, variants: Sequence[str], attributes: Dict):
+    """Mixins (and shim attributes) writing the extra quality tiers"""
+    if not variants:
+        return []
+    attributes.update(output_quality=quality, output_variants=list(variants))
+    # Partials journaled without the scaled copies cannot be resumed with them
+    attributes["journal_key"] += "+" + "+".join(variants)
+    return ["MultiOutputScene"]
+
+
+def plan_scene_job(
+    file: str,
+    scene: str,
+    quality: str,
+    output_dir: str,
+    variants: Sequence[str] = (),
+) -> Dict:
+    """Create a render job for a whole scene, with crash journaling
+
+    ``variants`` are lower quality tiers encoded from the same frames.
+    """
+    attributes = {"journal_key": scene_journal_key(file, quality)}
+    mixins = output_mixins(quality, variants, attributes) + ["JournalScene"]
+    return {
+        "name": scene,
+        "file": write_scene_shim(
+            file, scene, f"{scene}__full", mixins, attributes, quality=quality
+        ),
+        "scene": f"{scene}__full",
+        "quality": quality,
+        "output_dir": output_dir,
+        "source": file,
+        "parent_scene": scene,
+        "variants": {variant: None for variant in variants},
+    }
+
+
+def plan_section_jobs(
+    file: str,
+    scene: str,
+    quality: str,
+    segments: Optional[List[str]] = None,
+    variants: Sequence[str] = (),
+) -> List[Dict]:
+    """Create one render job per segment of a scene
+
+    ``variants`` are lower quality tiers encoded from the same frames; each
+    gets its own cache key, as if rendered at that tier.
+    """
+    source = os.path.join(VIDEOS_DIR, file)
+    scenes = describe_scenes(source)
+    if scene not in scenes:
+        raise KeyError(f"{scene} is not a Scene subclass in {file}")
+
+    info = scenes[scene]
+    # Clip keys cover the state each segment inherits from all earlier ones
+    own_fingerprints = segment_fingerprints(source, scene)
+    fingerprints = clip_fingerprints(own_fingerprints)
+    checkpoints = checkpoint_keys(source, scene, own_fingerprints)
+    rates = section_frame_rates(source, scene)
+    output_dir = sections_dir(quality, scene)
+    jobs = []
+    for index, segment in enumerate(info["segments"]):
+        if segments and segment not in segments:
+            continue
+        name = segment_job_name(scene, index, segment)
+        # Variants are decimated from the same frames, so they share the step
+        step = frame_step(QUALITY_TIERS[quality]["fps"], rates.get(segment))
+        key = clip_cache_key(fingerprints[segment], quality, info["background"], step)
+        attributes = {
+            "sections": info["sections"],
+            "target_segment": segment,
+            "checkpoint_scene": scene,
+            "checkpoint_keys": checkpoints,
+            "journal_key": key,
+        }
+        mixins = output_mixins(quality, variants, attributes)
+        mixins += ["JournalScene", "CheckpointScene"]
+        jobs.append(
+            {
+                "name": name,
+                "file": write_scene_shim(
+                    file, scene, name, mixins, attributes, info, rates, quality
+                ),
+                "scene": name,
+                "quality": quality,
+                "output_dir": output_dir,
+                "source": file,
+                "parent_scene": scene,
+                "segment": segment,
+                "sections": info["sections"],
+                "checkpoint_keys": checkpoints,
+                "cache_key": key,
+                "variants": {
+                    variant: clip_cache_key(
+                        fingerprints[segment], variant, info["background"], step
+                    )
+                    for variant in variants
+                },
+            }
+        )
+    return jobs
+
+
+def plan_timeline_job(file: str, scene: str) -> Dict:
+    """Create a dry-run job that records a scene's timeline"""
+    info = describe_scenes(os.path.join(VIDEOS_DIR, file)).get(scene)
+    if info is None:
+        raise KeyError(f"{scene} is not a Scene subclass in {file}")
+    name = f"{scene}__timeline"
+    attributes = {
+        "timeline_scene": scene,
+        "timeline_sections": info["sections"],
+        "timeline_source_digest": source_digest(file),
+        "timeline_path": timeline_path(scene),
+    }
+    return {
+        "name": name,
+        "file": write_scene_shim(
+            file,
+            scene,
+            name,
+            ["TimelineScene"],
+            attributes,
+            info=info,
+            quality=TIMELINE_QUALITY,
+        ),
+        "scene": name,
+        "quality": TIMELINE_QUALITY,
+        "output_dir": TIMELINES_DIR,
+        "source": file,
+        "parent_scene": scene,
+    }
+
+
+def plan_interactive_job(file: str, scene: str) -> Dict:
+    """Create a job that opens a scene in manimgl's window, hot-swappable"""
+    info = describe_scenes(os.path.join(VIDEOS_DIR, file)).get(scene)
+    if info is None:
+        raise KeyError(f"{scene} is not a Scene subclass in {file}")
+    name = f"{scene}__interactive"
+    attributes = {
+        "hotswap_scene": scene,
+        "hotswap_source": file,
+        "hotswap_sections": info["sections"],
+    }
+    return {
+        "name": name,
+        "file": write_scene_shim(
+            file, scene, name, ["HotSwapScene"], attributes, info=info
+        ),
+        "scene": name,
+        "source": file,
+        "parent_scene": scene,
+    }
+
+
+def section_clip_paths(file: str, scene: str, quality: str) -> List[str]:
+    """Return the expected clip of every segment of a scene, in playback order"""
+    info = describe_scenes(os.path.join(VIDEOS_DIR, file)).get(scene)
+    if info is None:
+        raise KeyError(f"{scene} is not a Scene subclass in {file}")
+    return [
+        os.path.join(
+            sections_dir(quality, scene),
+            f"{segment_job_name(scene, index, segment)}.mp4",
+        )
+        for index, segment in enumerate(info["segments"])
+    ]
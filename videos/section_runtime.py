@@ -0,0 +1,208 @@
+"""
+Section Runtime
+
+Render-side support for section-granular jobs. ``SectionScene`` is mixed into
+a course Scene so that only one segment of its ``construct()`` is written to
+the output file. Every other segment before it still runs with
+``skip_animations`` enabled, which replays the scene state (mobjects, camera,
+RNG draws) without rasterizing a frame, and rendering stops as soon as the
+target segment is finished.
+
+``ShardScene`` narrows a render further to a range of frames, so one long
+segment can be split across several processes.
+
+``TimelineScene`` runs a whole scene with rendering disabled and records
+every ``play()`` and ``wait()`` with its start time, run time and owning
+section, for ``scene_timeline``.
+
+This module imports manimlib and is only loaded inside render processes.
+"""
+
+import functools
+import json
+
+from manimlib import Scene
+from manimlib.scene.scene import EndScene
+
+from course_settings import atomic_write_json
+from scene_index import EPILOGUE, PROLOGUE
+
+
+class SectionScene(Scene):
+    """Mixin that renders a single segment of a course scene"""
+
+    # Ordered section method names and the segment to write, set by subclasses
+    sections = []
+    target_segment = PROLOGUE
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for index, name in enumerate(cls.sections):
+            method = getattr(cls, name)
+            is_last = index == len(cls.sections) - 1
+            setattr(cls, name, cls._wrap_section(name, method, is_last))
+
+    @staticmethod
+    def _wrap_section(name, method, is_last):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.enter_segment(name)
+            result = None
+            if self.should_run_section(name):
+                result = method(self, *args, **kwargs)
+            if is_last:
+                self.enter_segment(EPILOGUE)
+            return result
+
+        return wrapper
+
+    def enter_segment(self, segment: str):
+        """Switch the active segment, stopping once the target is complete"""
+        if getattr(self, "current_segment", None) == self.target_segment:
+            raise EndScene()
+        self.current_segment = segment
+        self.skip_animations = segment != self.target_segment
+
+    def should_run_section(self, name: str) -> bool:
+        """Whether a section's code runs at all (subclasses may elide it)"""
+        return True
+
+    def construct(self):
+        self.enter_segment(PROLOGUE)
+        super().construct()
+
+
+class ShardScene(Scene):
+    """Mixin that writes only one frame range of the recorded timeline
+
+    Frames are numbered from the first frame the scene would write (so for a
+    section job, from the start of the target segment). Frames before
+    ``shard_frames[0]`` still advance time and update mobjects, so state is
+    exact, but are never rasterized or encoded; rendering stops at
+    ``shard_frames[1]``. With ``frame_count_path`` set and no range, nothing
+    is written and the number of frames is saved there as JSON instead.
+    """
+
+    shard_frames = None
+    frame_count_path = None
+
+    def run(self):
+        self.frame_index = 0
+        if self.shard_frames is None:
+            self.file_writer.write_to_movie = False
+        super().run()
+
+    def in_shard(self) -> bool:
+        """Whether the next frame to emit belongs to this shard"""
+        if self.shard_frames is None:
+            return False
+        start, end = self.shard_frames
+        return start <= self.frame_index < end
+
+    def update_frame(self, dt=0, ignore_skipping=False):
+        if self.skip_animations or self.in_shard():
+            return super().update_frame(dt, ignore_skipping)
+        # Outside the shard: advance state without rasterizing
+        self.increment_time(dt)
+        self.update_mobjects(dt)
+
+    def emit_frame(self):
+        if self.skip_animations:
+            return
+        if self.in_shard():
+            super().emit_frame()
+        self.frame_index += 1
+        if self.shard_frames is not None and self.frame_index >= self.shard_frames[1]:
+            raise EndScene()
+
+    def tear_down(self):
+        if self.frame_count_path:
+            with open(self.frame_count_path, "w", encoding="utf-8") as count:
+                json.dump({"frames": self.frame_index}, count)
+        super().tear_down()
+
+
+def animation_name(animation) -> str:
+    """Class name of an animation (``animate`` for ``mobject.animate``)"""
+    name = type(animation).__name__
+    return "animate" if name == "_AnimationBuilder" else name
+
+
+class TimelineScene(Scene):
+    """Mixin that dry-runs a scene and writes its timeline as JSON
+
+    Every call is replayed with ``skip_animations`` enabled, which advances
+    the scene clock by each animation's real run time without rasterizing
+    or encoding a frame.
+    """
+
+    # Course scene, its section method names, its source hash and the JSON
+    # file to write, set by subclasses
+    timeline_scene = ""
+    timeline_sections = []
+    timeline_source_digest = ""
+    timeline_path = ""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for index, name in enumerate(cls.timeline_sections):
+            method = getattr(cls, name)
+            is_last = index == len(cls.timeline_sections) - 1
+            setattr(cls, name, cls._time_section(name, method, is_last))
+
+    @staticmethod
+    def _time_section(name, method, is_last):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.timeline_section = name
+            result = method(self, *args, **kwargs)
+            if is_last:
+                self.timeline_section = EPILOGUE
+            return result
+
+        return wrapper
+
+    def run(self):
+        self.timeline_section = PROLOGUE
+        self.timeline_events = []
+        self.file_writer.write_to_movie = False
+        self.skip_animations = True
+        super().run()
+        self.write_timeline()
+
+    def timed(self, kind: str, method, *args, **kwargs):
+        """Run play()/wait() and record when it started and how long it ran"""
+        start = self.time
+        event = {"kind": kind, "section": self.timeline_section, "start": start}
+        if kind == "play":
+            event["animations"] = [animation_name(arg) for arg in args]
+        result = method(*args, **kwargs)
+        event["run_time"] = self.time - start
+        self.timeline_events.append(event)
+        return result
+
+    def play(self, *args, **kwargs):
+        return self.timed("play", super().play, *args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        return self.timed("wait", super().wait, *args, **kwargs)
+
+    def write_timeline(self):
+        """Write the recorded events with per-section totals"""
+        sections = {}
+        for event in self.timeline_events:
+            totals = sections.setdefault(
+                event["section"],
+                {"start": event["start"], "duration": 0.0, "plays": 0, "waits": 0},
+            )
+            totals["duration"] += event["run_time"]
+            totals[f"{event['kind']}s"] += 1
+
+        timeline = {
+            "scene": self.timeline_scene,
+            "source_digest": self.timeline_source_digest,
+            "duration": self.time,
+            "sections": sections,
+            "events": self.timeline_events,
+        }
+        atomic_write_json(self.timeline_path, timeline, indent=2)
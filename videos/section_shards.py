@@ -0,0 +1,178 @@
+"""
+Section Sharding
+
+Splits one long section into frame ranges rendered by separate processes.
+A quick probe job first replays the section without rasterizing to count its
+frames; the range is then cut into equal shards, each shard renders only its
+frames (restoring or replaying everything before them), and the shard clips
+are joined into the section clip with stream copy.
+"""
+
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from render_pool import job_output_path, print_render_summary
+from section_render import write_scene_shim
+from stitch import StitchError, concat_clips
+
+if TYPE_CHECKING:
+    from render_history import RenderHistory
+
+
+def shard_dir(job: Dict) -> str:
+    """Directory holding a section job's probe result and shard clips"""
+    return os.path.join(job["output_dir"], "shards", job["name"])
+
+
+def frame_count_path(job: Dict) -> str:
+    """File the probe job writes the section's frame count to"""
+    return os.path.join(shard_dir(job), "frames.json")
+
+
+def shard_job(job: Dict, name: str, attributes: Dict) -> Dict:
+    """Derive a probe or shard job from a section job
+
+    The derived job's ``shard`` is its name within the section, which keeps
+    its render history apart from the whole section's.
+    """
+    attributes = dict(
+        sections=job["sections"],
+        target_segment=job["segment"],
+        checkpoint_scene=job["parent_scene"],
+        checkpoint_keys=job["checkpoint_keys"],
+        **attributes,
+    )
+    derived = dict(job)
+    derived.update(
+        {
+            "name": name,
+            "file": write_scene_shim(
+                job["source"],
+                job["parent_scene"],
+                name,
+                ["ShardScene", "CheckpointScene"],
+                attributes,
+                quality=job["quality"],
+            ),
+            "scene": name,
+            "output_dir": shard_dir(job),
+            "shard": name[len(job["name"]) + 2 :],
+        }
+    )
+    derived.pop("cache_key", None)
+    return derived
+
+
+def plan_probe_job(job: Dict) -> Dict:
+    """Job that counts a section's frames without rendering any"""
+    os.makedirs(shard_dir(job), exist_ok=True)
+    return shard_job(
+        job, f"{job['name']}__probe", {"frame_count_path": frame_count_path(job)}
+    )
+
+
+def read_frame_count(job: Dict) -> int:
+    """Frame count recorded by a section's probe job"""
+    with open(frame_count_path(job), encoding="utf-8") as count:
+        return json.load(count)["frames"]
+
+
+def frame_ranges(total: int, shards: int) -> List[range]:
+    """Split ``total`` frames into at most ``shards`` contiguous ranges"""
+    if total <= 0:
+        return []
+    shards = max(1, min(shards, total))
+    bounds = [total * index // shards for index in range(shards + 1)]
+    return [range(start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+def plan_shard_jobs(job: Dict, total: int, shards: int) -> List[Dict]:
+    """Jobs rendering each frame range of a section"""
+    return [
+        shard_job(
+            job,
+            f"{job['name']}__shard{index:02d}",
+            {"shard_frames": (frames.start, frames.stop)},
+        )
+        for index, frames in enumerate(frame_ranges(total, shards))
+    ]
+
+
+def render_sharded(
+    jobs: List[Dict],
+    shards: int,
+    renderer: Callable[..., List[Dict]],
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict], None]] = None,
+    history: Optional["RenderHistory"] = None,
+) -> List[Dict]:
+    """Render section jobs split into frame-range shards
+
+    Returns one result per section job, in the same shape ``renderer``
+    (``render_jobs`` or ``render_jobs_warm``) reports for a single job.
+    ``on_result`` gets each section's result once its shards are joined;
+    ``history`` orders and records the probe and shard jobs, and records
+    each section's total as well.
+    """
+    start = time.perf_counter()
+    probes = {job["name"]: plan_probe_job(job) for job in jobs}
+    probe_results = {
+        result["name"]: result
+        for result in renderer(
+            list(probes.values()), workers=workers, history=history
+        )
+    }
+
+    results = []
+    planned = {}
+    for job in jobs:
+        probe = probe_results[probes[job["name"]]["name"]]
+        if not probe["ok"]:
+            results.append(dict(probe, name=job["name"]))
+            if on_result:
+                on_result(results[-1])
+            continue
+        planned[job["name"]] = plan_shard_jobs(job, read_frame_count(job), shards)
+
+    shard_jobs = [shard for section in planned.values() for shard in section]
+    shard_results = {
+        result["name"]: result
+        for result in renderer(shard_jobs, workers=workers, history=history)
+    }
+    print_render_summary(list(shard_results.values()), time.perf_counter() - start)
+
+    for job in jobs:
+        if job["name"] not in planned:
+            continue
+        parts = [shard_results[shard["name"]] for shard in planned[job["name"]]]
+        result = {
+            "name": job["name"],
+            "returncode": 0,
+            "ok": all(part["ok"] for part in parts),
+            "wall_time": sum(part["wall_time"] for part in parts),
+            "output": job_output_path(job),
+            "log": parts[0]["log"] if parts else "",
+            "shards": len(parts),
+            "peak_rss": max((part.get("peak_rss") or 0 for part in parts), default=0),
+            "frames": sum(part.get("frames") or 0 for part in parts),
+        }
+        if result["ok"]:
+            try:
+                concat_clips([part["output"] for part in parts], result["output"])
+            except StitchError as error:
+                result.update(ok=False, error=error.args[0])
+        if not result["ok"]:
+            failed = [part for part in parts if not part["ok"]]
+            result["returncode"] = failed[0]["returncode"] if failed else -1
+            if failed:
+                result["log"] = failed[0]["log"]
+        if history is not None:
+            history.record(job, result)
+        results.append(result)
+        if on_result:
+            on_result(result)
+    if history is not None:
+        history.save()
+    return results
@@ -0,0 +1,198 @@
+"""
+Section Watch Mode
+
+Re-renders only the sections an author just edited. ``SectionWatcher`` polls
+the course files' modification times. Once a file has stopped changing for
+``DEBOUNCE_SECONDS`` it compares the segment fingerprints of every scene in
+it with those of the previous save: a fingerprint hashes the normalized AST
+of a section and the helpers it uses, so comments and formatting never
+trigger a render. Only the segments whose fingerprint changed are rendered,
+at draft quality, as ordinary section jobs: earlier sections are skipped or
+restored from a checkpoint instead of being replayed, and a render cache
+hit (after undoing an edit, say) skips rendering altogether.
+
+Each finished clip is copied to ``renders/preview/latest.mp4``, so a player
+pointed at that file always shows the section just edited. A save arriving
+while an earlier render of the same file is still running cancels that
+render first; its result could only be stale.
+"""
+
+import os
+import shutil
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from course_settings import DEFAULT_OUTPUT_DIR, VIDEOS_DIR, replacing
+from render_cache import restore_cached_jobs, store_rendered_results
+from render_pool import job_log_path, job_output_path, job_result, spawn_render
+from scene_index import find_scene_classes, parse_source, segment_fingerprints
+from section_render import plan_section_jobs
+
+if TYPE_CHECKING:
+    from render_cache import RenderCache
+
+WATCH_QUALITY = "draft"
+PREVIEW_PATH = os.path.join(DEFAULT_OUTPUT_DIR, "preview", "latest.mp4")
+
+# Seconds a file must stay unchanged before a save is acted on; editors
+# often write a file in several steps and auto-format right after saving
+DEBOUNCE_SECONDS = 0.5
+POLL_SECONDS = 0.2
+
+
+def refresh_preview(clip: str, preview: str = PREVIEW_PATH):
+    """Replace the preview file with a clip, atomically"""
+    with replacing(preview) as temporary:
+        shutil.copyfile(clip, temporary)
+
+
+class SectionWatcher:
+    """Watches course files and re-renders the sections edited on each save"""
+
+    def __init__(
+        self,
+        files: List[str],
+        quality: str = WATCH_QUALITY,
+        cache: Optional["RenderCache"] = None,
+    ):
+        self.files = files
+        self.quality = quality
+        self.cache = cache
+        self.mtimes = {}
+        self.fingerprints = {}
+        self.changed_at = {}
+        self.renders = {}
+
+    def mtime(self, file: str) -> Optional[int]:
+        try:
+            return os.stat(os.path.join(VIDEOS_DIR, file)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def snapshot(self, file: str) -> Optional[Dict[str, Dict[str, str]]]:
+        """Segment fingerprints of every scene in a file, None if unparsable"""
+        path = os.path.join(VIDEOS_DIR, file)
+        try:
+            scenes = find_scene_classes(parse_source(path))
+            return {scene: segment_fingerprints(path, scene) for scene in scenes}
+        except (SyntaxError, OSError) as error:
+            print(f"⚠️  {file}: {error}; waiting for the next save")
+            return None
+
+    def changed_segments(self, file: str, fingerprints: Dict) -> Dict[str, List]:
+        """Segments per scene whose fingerprint differs from the last save"""
+        previous = self.fingerprints.get(file, {})
+        changes = {}
+        for scene, segments in fingerprints.items():
+            before = previous.get(scene, {})
+            changed = [
+                segment
+                for segment, digest in segments.items()
+                if before.get(segment) != digest
+            ]
+            if changed:
+                changes[scene] = changed
+        return changes
+
+    def poll_files(self):
+        """Note files whose modification time changed since the last poll"""
+        now = time.monotonic()
+        for file in self.files:
+            mtime = self.mtime(file)
+            if mtime != self.mtimes.get(file):
+                self.mtimes[file] = mtime
+                self.changed_at[file] = now
+
+    def settle(self):
+        """Act on files that have stopped changing for the debounce period"""
+        now = time.monotonic()
+        for file, changed_at in list(self.changed_at.items()):
+            if now - changed_at >= DEBOUNCE_SECONDS:
+                del self.changed_at[file]
+                self.on_save(file)
+
+    def on_save(self, file: str):
+        """Diff a saved file and render its changed segments"""
+        fingerprints = self.snapshot(file)
+        if fingerprints is None:
+            return
+        changes = self.changed_segments(file, fingerprints)
+        self.fingerprints[file] = fingerprints
+        if not changes:
+            print(f"💤 {file}: no section changed")
+            return
+        self.cancel(file)
+
+        jobs = []
+        for scene, segments in changes.items():
+            print(f"✏️  {scene}: {', '.join(segments)} changed")
+            jobs.extend(plan_section_jobs(file, scene, self.quality, segments))
+        if self.cache is not None:
+            jobs, restored = restore_cached_jobs(jobs, self.cache)
+            for job in restored:
+                print(f"♻️  {job['name']} served from cache")
+                refresh_preview(job_output_path(job))
+        self.renders[file] = [self.start(job) for job in jobs]
+
+    def start(self, job: Dict) -> Dict:
+        """Start rendering a job in the background"""
+        os.makedirs(os.path.dirname(job_log_path(job)), exist_ok=True)
+        log = open(job_log_path(job), "w")
+        print(f"🎬 Rendering {job['name']} at {self.quality} quality")
+        return {
+            "job": job,
+            "log": log,
+            "process": spawn_render(job, log),
+            "started": time.perf_counter(),
+        }
+
+    def cancel(self, file: str):
+        """Stop a file's in-flight renders, which a newer save made stale"""
+        for render in self.renders.pop(file, []):
+            if render["process"].poll() is None:
+                render["process"].terminate()
+                render["process"].wait()
+                print(f"⏹️  Cancelled stale render {render['job']['name']}")
+            render["log"].close()
+
+    def reap(self):
+        """Report finished renders and refresh the preview"""
+        for file, renders in list(self.renders.items()):
+            running = []
+            for render in renders:
+                returncode = render["process"].poll()
+                if returncode is None:
+                    running.append(render)
+                    continue
+                render["log"].close()
+                job = render["job"]
+                result = job_result(
+                    job, returncode, time.perf_counter() - render["started"]
+                )
+                if not result["ok"]:
+                    print(f"❌ {job['name']} failed, see {result['log']}")
+                    continue
+                print(f"✅ {job['name']} rendered in {result['wall_time']:.1f}s")
+                refresh_preview(result["output"])
+                if self.cache is not None:
+                    store_rendered_results([job], [result], self.cache)
+            if running:
+                self.renders[file] = running
+            else:
+                del self.renders[file]
+
+    def run(self):
+        """Watch until interrupted"""
+        for file in self.files:
+            self.mtimes[file] = self.mtime(file)
+            self.fingerprints[file] = self.snapshot(file) or {}
+        print(f"👀 Watching {len(self.files)} files; preview: {PREVIEW_PATH}")
+        try:
+            while True:
+                self.poll_files()
+                self.settle()
+                self.reap()
+                time.sleep(POLL_SECONDS)
+        finally:
+            for file in list(self.renders):
+                self.cancel(file)
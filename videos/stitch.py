@@ -0,0 +1,135 @@
+"""
+Lossless Clip Stitching
+
+Joins rendered clips into module videos, and module videos into the full
+course video, with ffmpeg's concat demuxer and stream copy, so no frame is
+ever re-encoded. Stream copy only produces a valid file when every input was
+encoded with the same parameters, so those are probed and compared up front
+and a mismatch is reported before anything is written.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+from typing import Dict, List
+
+# Stream properties that must be identical for stream-copy concatenation
+VIDEO_KEYS = (
+    "codec_name",
+    "profile",
+    "width",
+    "height",
+    "pix_fmt",
+    "r_frame_rate",
+    "time_base",
+    "sample_aspect_ratio",
+)
+AUDIO_KEYS = ("codec_name", "sample_rate", "channels", "channel_layout")
+
+
+class StitchError(Exception):
+    """Raised when clips cannot be concatenated without re-encoding"""
+
+
+def probe_streams(path: str) -> List[Dict]:
+    """Return the encoder parameters of each stream in a media file"""
+    command = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-show_streams",
+        "-of",
+        "json",
+        path,
+    ]
+    try:
+        process = subprocess.run(command, capture_output=True, text=True)
+    except OSError as error:
+        raise StitchError(f"ffprobe is not available: {error}") from error
+    if process.returncode != 0:
+        raise StitchError(f"Cannot probe {path}: {process.stderr.strip()}")
+
+    streams = []
+    for stream in json.loads(process.stdout).get("streams", []):
+        keys = VIDEO_KEYS if stream.get("codec_type") == "video" else AUDIO_KEYS
+        params = {key: stream.get(key) for key in keys}
+        params["codec_type"] = stream.get("codec_type")
+        streams.append(params)
+    return streams
+
+
+def check_compatible(paths: List[str]) -> List[Dict]:
+    """Ensure all clips share encoder parameters; return the common ones"""
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        raise StitchError("Missing clips:\n" + "\n".join(missing))
+
+    reference = probe_streams(paths[0])
+    problems = []
+    for path in paths[1:]:
+        streams = probe_streams(path)
+        if len(streams) != len(reference):
+            problems.append(
+                f"{path}: {len(streams)} streams, expected {len(reference)}"
+            )
+            continue
+        for expected, actual in zip(reference, streams):
+            for key, value in expected.items():
+                if actual[key] != value:
+                    problems.append(
+                        f"{path}: {key}={actual[key]!r}, expected {value!r}"
+                    )
+
+    if problems:
+        raise StitchError(
+            f"Clips differ from {paths[0]}; render them at the same quality:\n"
+            + "\n".join(problems)
+        )
+    return reference
+
+
+def concat_clips(paths: List[str], output: str) -> str:
+    """Concatenate clips into one file with stream copy"""
+    if not paths:
+        raise StitchError("No clips to stitch")
+    check_compatible(paths)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as listing:
+        for path in paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            listing.write(f"file '{escaped}'\n")
+        list_path = listing.name
+
+    command = [
+        "ffmpeg",
+        "-y",
+        "-v",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        list_path,
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        output,
+    ]
+    try:
+        process = subprocess.run(command, capture_output=True, text=True)
+    except OSError as error:
+        raise StitchError(f"ffmpeg is not available: {error}") from error
+    finally:
+        os.remove(list_path)
+    if process.returncode != 0:
+        raise StitchError(f"ffmpeg failed: {process.stderr.strip()}")
+    return output
+
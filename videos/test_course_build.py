@@ -0,0 +1,87 @@
+"""
+Tests for incremental builds: which segment jobs an edit makes stale
+
+Run from the videos directory with ``python -m unittest test_course_build``.
+"""
+
+import os
+import tempfile
+import unittest
+
+from course_build import stale_jobs
+from scene_index import clip_fingerprints, segment_fingerprints
+
+SECTIONS = ["opening", "counting", "summary", "outro"]
+
+SCENE_SOURCE = '''
+from manimlib import *
+
+
+class Lesson(Scene):
+    def construct(self):
+        self.opening()
+        self.counting()
+        self.summary()
+        self.outro()
+
+    def opening(self):
+        self.play(Write(Text("Opening")))
+
+    def counting(self):
+        dots = VGroup(*[Dot() for _ in range({count})])
+        self.play(FadeOut(*self.mobjects), FadeIn(dots))
+
+    def summary(self):
+        self.play(FadeOut(*self.mobjects), Write(Text("Summary")))
+
+    def outro(self):
+        self.play(FadeOut(*self.mobjects), Write(Text("Outro")))
+'''
+
+
+class StaleJobsTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def clip_keys(self, count: int):
+        path = os.path.join(self.directory.name, "lesson.py")
+        with open(path, "w", encoding="utf-8") as source:
+            source.write(SCENE_SOURCE.format(count=count))
+        return clip_fingerprints(segment_fingerprints(path, "Lesson"))
+
+    def jobs(self, keys):
+        jobs = []
+        for index, segment in enumerate(keys):
+            job = {
+                "name": f"Lesson__{index:02d}_{segment}",
+                "segment": segment,
+                "cache_key": keys[segment],
+                "output_dir": self.directory.name,
+            }
+            # Every clip of the previous build is still on disk
+            with open(os.path.join(self.directory.name, f"{job['name']}.mp4"), "w"):
+                pass
+            jobs.append(job)
+        return jobs
+
+    def test_segments_are_the_sections(self):
+        self.assertEqual(list(self.clip_keys(12)), SECTIONS)
+
+    def test_unchanged_source_is_up_to_date(self):
+        keys = self.clip_keys(12)
+        self.assertEqual(stale_jobs(self.jobs(keys), keys), [])
+
+    def test_edit_marks_the_section_and_every_later_one_stale(self):
+        previous = self.clip_keys(12)
+        stale = stale_jobs(self.jobs(self.clip_keys(20)), previous)
+        self.assertEqual([job["segment"] for job in stale], SECTIONS[1:])
+
+    def test_edit_leaves_earlier_sections_alone(self):
+        previous = self.clip_keys(12)
+        keys = self.clip_keys(20)
+        self.assertEqual(keys["opening"], previous["opening"])
+
+
+if __name__ == "__main__":
+    unittest.main()